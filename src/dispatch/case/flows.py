@@ -7,6 +7,7 @@ from dispatch.case import service as case_service
 from dispatch.case.messaging import send_case_welcome_participant_message
 from dispatch.case.models import CaseRead
 from dispatch.conversation import flows as conversation_flows
+from dispatch.conversation.index import conversation_index
 from dispatch.decorators import background_task
 from dispatch.document import flows as document_flows
 from dispatch.email_templates import service as email_template_service
@@ -970,6 +971,9 @@ def common_escalate_flow(
         db_session.add(incident)
         db_session.commit()
 
+        # the conversation now resolves to the incident instead of the case
+        conversation_index.invalidate(case.conversation.channel_id)
+
     # we run the incident create flow in a background task
     incident = incident_flows.incident_create_flow(
         incident_id=incident.id,
@@ -1,4 +1,3 @@
-import json
 import logging
 from datetime import datetime
 from typing import Annotated
@@ -17,9 +16,18 @@ from dispatch.auth.permissions import (
 )
 from dispatch.auth.service import CurrentUser
 from dispatch.case.enums import CaseStatus
-from dispatch.common.utils.views import create_pydantic_include
+from dispatch.common.utils.views import (
+    PydanticJSONResponse,
+    create_model_projection,
+    create_projected_pagination,
+    create_pydantic_include,
+)
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    CursorParameters,
+    search_filter_sort_paginate,
+)
 from dispatch.event import flows as event_flows
 from dispatch.event.models import EventCreateMinimal, EventUpdate
 from dispatch.incident import service as incident_service
@@ -52,6 +60,7 @@ from .models import (
     CasePagination,
     CasePaginationMinimalWithExtras,
     CaseRead,
+    CaseReadMinimalWithExtras,
     CaseUpdate,
 )
 from .service import create, delete, get, get_participants, update
@@ -60,6 +69,9 @@ log = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# the attributes loaded for the minimal case list
+CASE_MINIMAL_PROJECTION = create_model_projection(CaseReadMinimalWithExtras)
+
 
 def get_current_case(db_session: DbSession, request: Request) -> Case:
     """Fetches a case or returns an HTTP 404."""
@@ -126,37 +138,42 @@ def get_case_participants(
 @router.get("", summary="Retrieves a list of cases.")
 def get_cases(
     common: CommonParameters,
+    cursor: CursorParameters,
     include: list[str] = Query([], alias="include[]"),
     expand: bool = Query(default=False),
 ):
     """Retrieves all cases."""
-    pagination = search_filter_sort_paginate(model="Case", **common)
-
-    if expand:
-        return json.loads(CaseExpandedPagination(**pagination).json())
-
-    if include:
+    if include and not expand:
         # only allow two levels for now
         include_sets = create_pydantic_include(include)
 
-        include_fields = {
-            "items": {"__all__": include_sets},
-            "itemsPerPage": ...,
-            "page": ...,
-            "total": ...,
-        }
-        return json.loads(CaseExpandedPagination(**pagination).json(include=include_fields))
-    return json.loads(CasePagination(**pagination).json())
+        # only the included attributes are loaded and serialized
+        pagination = search_filter_sort_paginate(
+            model="Case", projection=include_sets, **common, **cursor
+        )
+        return PydanticJSONResponse(
+            create_projected_pagination(CaseRead, include_sets)(**pagination)
+        )
+
+    pagination = search_filter_sort_paginate(model="Case", **common, **cursor)
+
+    if expand:
+        return PydanticJSONResponse(CaseExpandedPagination(**pagination))
+
+    return PydanticJSONResponse(CasePagination(**pagination))
 
 
 @router.get("/minimal", summary="Retrieves a list of cases with minimal data.")
 def get_cases_minimal(
     common: CommonParameters,
+    cursor: CursorParameters,
 ):
     """Retrieves all cases with minimal data."""
-    pagination = search_filter_sort_paginate(model="Case", **common)
+    pagination = search_filter_sort_paginate(
+        model="Case", projection=CASE_MINIMAL_PROJECTION, **common, **cursor
+    )
 
-    return json.loads(CasePaginationMinimalWithExtras(**pagination).json())
+    return PydanticJSONResponse(CasePaginationMinimalWithExtras(**pagination))
 
 
 @router.post("", response_model=CaseRead, summary="Creates a new case.")
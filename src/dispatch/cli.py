@@ -720,9 +720,24 @@ def list_tasks():
 
     table = []
     for task in scheduler.registered_tasks:
-        table.append([task["name"], task["job"].period, task["job"].at_time])
+        table.append(
+            [
+                task["name"],
+                task["job"].period,
+                task["job"].at_time,
+                task["max_concurrency"],
+                task["timeout"],
+                task["executor"],
+            ]
+        )
 
-    click.secho(tabulate(table, headers=["Task Name", "Period", "At Time"]), fg="blue")
+    click.secho(
+        tabulate(
+            table,
+            headers=["Task Name", "Period", "At Time", "Max Concurrency", "Timeout", "Executor"],
+        ),
+        fg="blue",
+    )
 
 
 @dispatch_scheduler.command("start")
@@ -935,7 +950,25 @@ def consume_signals():
 
 
 @signals_group.command("process")
-def process_signals():
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Run a pool of workers that claim disjoint batches of signals. Safe to run on many pods.",
+)
+@click.option(
+    "--worker-type",
+    type=click.Choice(["thread", "process"]),
+    default="thread",
+    help="Whether pool workers are threads or processes.",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=500,
+    help="Maximum number of signals a pool worker claims per organization.",
+)
+def process_signals(workers, worker_type, batch_size):
     """
     Runs a continuous process that does additional processing on newly created signals.
 
@@ -945,6 +978,9 @@ def process_signals():
     3. Processing each instance with proper error handling
     4. Ensuring proper session cleanup even if exceptions occur
 
+    With `--workers`, signals are instead processed by a pool of workers, each claiming
+    disjoint batches with `SELECT ... FOR UPDATE SKIP LOCKED`.
+
     Returns:
         None
     """
@@ -961,6 +997,12 @@ def process_signals():
 
     install_plugins()
 
+    if workers:
+        signal_flows.parallel_processing_loop(
+            num_workers=workers, worker_type=worker_type, limit=batch_size
+        )
+        return
+
     @contextmanager
     def session_scope(schema_engine):
         """Provide a transactional scope around a series of operations."""
@@ -1,3 +1,30 @@
+import json
+import operator
+import threading
+import types
+from functools import reduce
+from typing import Union, get_args, get_origin
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, create_model
+
+from dispatch.models import DispatchBase, Pagination
+
+
+class PydanticJSONResponse(JSONResponse):
+    """Serializes a pydantic model straight to JSON bytes.
+
+    Avoids dumping the model to a string, parsing it back and letting FastAPI encode it again.
+    """
+
+    def __init__(self, content: BaseModel, include: dict | None = None, **kwargs):
+        self.include = include
+        super().__init__(content, **kwargs)
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content, include=self.include)
+
+
 def create_pydantic_include(include):
     """Creates a pydantic sets based on dotted notation."""
     include_sets = {}
@@ -15,3 +42,92 @@ def create_pydantic_include(include):
         include_sets.update(keyset)
 
     return include_sets
+
+
+_projected_models = {}
+_projected_models_lock = threading.Lock()
+
+
+def _projection_key(model: type[BaseModel], projection) -> tuple:
+    return model, json.dumps(projection, sort_keys=True, default=repr)
+
+
+def _project_annotation(annotation, projection: dict):
+    """Replaces the pydantic models referenced by an annotation with their projection."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return create_projected_model(annotation, projection)
+
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin in (Union, types.UnionType):
+        return reduce(operator.or_, [_project_annotation(arg, projection) for arg in args])
+    if origin is list:
+        return list[_project_annotation(args[0], projection)]
+    return annotation
+
+
+def create_projected_model(model: type[BaseModel], projection: dict) -> type[BaseModel]:
+    """Creates a model with only the fields of a projection (see `create_pydantic_include`).
+
+    Validating the projected model only reads the projected attributes, so the rest
+    doesn't need to be loaded.
+    """
+    key = _projection_key(model, projection)
+    with _projected_models_lock:
+        if key in _projected_models:
+            return _projected_models[key]
+
+    fields = {}
+    for name, subprojection in projection.items():
+        field = model.model_fields.get(name)
+        if not field:
+            continue
+
+        annotation = field.annotation
+        if isinstance(subprojection, dict):
+            annotation = _project_annotation(
+                annotation, subprojection.get("__all__", subprojection)
+            )
+        fields[name] = (annotation, field)
+
+    projected = create_model(f"{model.__name__}Projection", __base__=DispatchBase, **fields)
+    with _projected_models_lock:
+        return _projected_models.setdefault(key, projected)
+
+
+def create_projected_pagination(model: type[BaseModel], projection: dict) -> type[Pagination]:
+    """Creates a pagination model of projected items."""
+    key = _projection_key(Pagination, {model.__name__: projection})
+    with _projected_models_lock:
+        if key in _projected_models:
+            return _projected_models[key]
+
+    projected = create_model(
+        f"{model.__name__}ProjectionPagination",
+        __base__=Pagination,
+        items=(list[create_projected_model(model, projection)], []),
+    )
+    with _projected_models_lock:
+        return _projected_models.setdefault(key, projected)
+
+
+def _nested_model(annotation) -> type[BaseModel] | None:
+    """Returns the pydantic model referenced by an annotation (e.g. `list[Model] | None`)."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        nested = _nested_model(arg)
+        if nested:
+            return nested
+    return None
+
+
+def create_model_projection(model: type[BaseModel], depth: int = 2) -> dict:
+    """Creates the projection of every field of a model, nested models up to `depth`."""
+    projection = {}
+    for name, field in model.model_fields.items():
+        nested = _nested_model(field.annotation)
+        if nested and depth > 1:
+            projection[name] = create_model_projection(nested, depth=depth - 1)
+        else:
+            projection[name] = ...
+    return projection
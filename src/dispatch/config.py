@@ -199,6 +199,45 @@ STATIC_DIR = config("STATIC_DIR", default=DEFAULT_STATIC_DIR)
 
 # metrics
 METRIC_PROVIDERS = config("METRIC_PROVIDERS", cast=CommaSeparatedStrings, default="")
+# how often (in seconds) buffered metrics are aggregated and sent to the providers
+METRIC_FLUSH_INTERVAL = config("METRIC_FLUSH_INTERVAL", cast=float, default=10)
+# the number of samples buffered between flushes, the oldest are dropped when it's full
+METRIC_BUFFER_SIZE = config("METRIC_BUFFER_SIZE", cast=int, default=100000)
+
+# slack
+# how many Slack user lookups are cached and for how long (in seconds),
+# lookups of unknown users are cached for NEGATIVE_TTL seconds
+SLACK_USER_CACHE_SIZE = config("SLACK_USER_CACHE_SIZE", cast=int, default=10000)
+SLACK_USER_CACHE_TTL = config("SLACK_USER_CACHE_TTL", cast=int, default=3600)
+SLACK_USER_CACHE_NEGATIVE_TTL = config("SLACK_USER_CACHE_NEGATIVE_TTL", cast=int, default=300)
+# how many Slack clients (one per bot token) are kept, and how many connections to Slack
+# each process keeps alive
+SLACK_CLIENT_CACHE_SIZE = config("SLACK_CLIENT_CACHE_SIZE", cast=int, default=64)
+SLACK_CLIENT_POOL_SIZE = config("SLACK_CLIENT_POOL_SIZE", cast=int, default=10)
+# whether Slack user lookups are served from an in-memory directory of the workspace,
+# how often (in seconds) it's reloaded with users.list, and how old it can get (e.g. when
+# reloading fails) before lookups stop using it
+SLACK_DIRECTORY_ENABLED = config("SLACK_DIRECTORY_ENABLED", cast=bool, default=True)
+SLACK_DIRECTORY_REFRESH_INTERVAL = config(
+    "SLACK_DIRECTORY_REFRESH_INTERVAL", cast=int, default=3600
+)
+SLACK_DIRECTORY_MAX_AGE = config("SLACK_DIRECTORY_MAX_AGE", cast=int, default=86400)
+
+# participant activity
+# how often (in seconds) buffered participant role activity is written, and the number
+# of pending increments that triggers an early write
+PARTICIPANT_ACTIVITY_FLUSH_INTERVAL = config(
+    "PARTICIPANT_ACTIVITY_FLUSH_INTERVAL", cast=float, default=10
+)
+PARTICIPANT_ACTIVITY_FLUSH_THRESHOLD = config(
+    "PARTICIPANT_ACTIVITY_FLUSH_THRESHOLD", cast=int, default=500
+)
+
+# signals
+# the most signal instances a single bulk ingestion request can create
+SIGNAL_INSTANCE_BULK_CREATE_MAX_SIZE = config(
+    "SIGNAL_INSTANCE_BULK_CREATE_MAX_SIZE", cast=int, default=500
+)
 
 # database
 DATABASE_HOSTNAME = config("DATABASE_HOSTNAME")
@@ -215,6 +254,8 @@ DATABASE_ENGINE_POOL_PING = config("DATABASE_ENGINE_POOL_PING", default=False)
 DATABASE_ENGINE_POOL_RECYCLE = config("DATABASE_ENGINE_POOL_RECYCLE", cast=int, default=3600)
 DATABASE_ENGINE_POOL_SIZE = config("DATABASE_ENGINE_POOL_SIZE", cast=int, default=20)
 DATABASE_ENGINE_POOL_TIMEOUT = config("DATABASE_ENGINE_POOL_TIMEOUT", cast=int, default=30)
+# how long (in seconds) the in-process list of tenant schemas is trusted before being reloaded
+DATABASE_SCHEMA_REGISTRY_TTL = config("DATABASE_SCHEMA_REGISTRY_TTL", cast=int, default=60)
 SQLALCHEMY_DATABASE_URI = f"postgresql+psycopg2://{_DATABASE_CREDENTIAL_USER}:{_QUOTED_DATABASE_PASSWORD}@{DATABASE_HOSTNAME}:{DATABASE_PORT}/{DATABASE_NAME}"
 
 ALEMBIC_CORE_REVISION_PATH = config(
@@ -0,0 +1,57 @@
+import threading
+from typing import NamedTuple
+
+from cachetools import TTLCache
+
+
+class ConversationSubject(NamedTuple):
+    """The subject (incident or case) a conversation belongs to."""
+
+    organization_slug: str
+    type: str
+    id: int
+    project_id: int
+
+
+class ConversationIndex:
+    """Bounded, TTL'd index of (channel_id, thread_id) to conversation subjects across organizations.
+
+    Resolving the subject of a conversation otherwise requires querying every
+    organization schema. Entries are added when a conversation is resolved and
+    dropped when its channel is updated, deleted or reassigned to another subject.
+    Other processes don't see those invalidations, so callers confirm a cached
+    subject against the conversation of its organization before using it.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: int = 600):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, channel_id: str, thread_id: str | None = None) -> ConversationSubject | None:
+        """Returns the cached subject for a conversation, if any."""
+        with self._lock:
+            return self._cache.get((channel_id, thread_id))
+
+    def set(
+        self, channel_id: str, thread_id: str | None, subject: ConversationSubject
+    ) -> ConversationSubject:
+        """Caches the subject for a conversation."""
+        with self._lock:
+            self._cache[(channel_id, thread_id)] = subject
+        return subject
+
+    def invalidate(self, channel_id: str) -> None:
+        """Drops all cached entries for a channel, regardless of thread."""
+        if not channel_id:
+            return
+        with self._lock:
+            for key in [k for k in self._cache.keys() if k[0] == channel_id]:
+                self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        """Drops all cached entries."""
+        with self._lock:
+            self._cache.clear()
+
+
+conversation_index = ConversationIndex()
@@ -1,4 +1,6 @@
 import logging
+
+from .index import conversation_index
 from .models import Conversation, ConversationCreate, ConversationUpdate
 
 log = logging.getLogger(__name__)
@@ -75,6 +77,8 @@ def update(
     conversation_data = conversation.dict()
     update_data = conversation_in.dict(exclude_unset=True)
 
+    conversation_index.invalidate(conversation.channel_id)
+
     for field in conversation_data:
         if field in update_data:
             setattr(conversation, field, update_data[field])
@@ -85,5 +89,9 @@ def update(
 
 def delete(*, db_session, conversation_id: int):
     """Deletes a conversation."""
+    conversation = get(db_session=db_session, conversation_id=conversation_id)
+    if conversation:
+        conversation_index.invalidate(conversation.channel_id)
+
     db_session.query(Conversation).filter(Conversation.id == conversation_id).delete()
     db_session.commit()
@@ -0,0 +1,103 @@
+"""
+.. module: dispatch.database.registry
+    :platform: Unix
+    :copyright: (c) 2019 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+
+import logging
+import threading
+import time
+
+from sqlalchemy import Engine, inspect
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from dispatch import config
+
+from .core import engine
+from .enums import DISPATCH_ORGANIZATION_SCHEMA_PREFIX
+
+log = logging.getLogger(__name__)
+
+
+class SchemaRegistry:
+    """In-process registry of tenant schemas and their session factories.
+
+    The set of known schemas is loaded lazily from the database catalog and
+    reloaded once it is older than `ttl` seconds, or when explicitly
+    invalidated (e.g. after an organization is created or deleted). Lookups
+    for unknown schemas trigger at most one reload every `miss_refresh_interval`
+    seconds so that bogus slugs cannot turn into a catalog query per request.
+    """
+
+    def __init__(self, engine: Engine, ttl: int, miss_refresh_interval: int = 5):
+        self.engine = engine
+        self.ttl = ttl
+        self.miss_refresh_interval = miss_refresh_interval
+        self._schemas: frozenset[str] = frozenset()
+        self._loaded_at: float | None = None
+        self._sessions: dict[str, scoped_session] = {}
+        self._lock = threading.Lock()
+
+    def refresh(self) -> frozenset[str]:
+        """Reloads the schema names from the database catalog."""
+        schemas = frozenset(inspect(self.engine).get_schema_names())
+        with self._lock:
+            self._schemas = schemas
+            self._loaded_at = time.monotonic()
+        log.debug(f"Loaded {len(schemas)} database schemas into the schema registry.")
+        return schemas
+
+    def invalidate(self) -> None:
+        """Marks the registry as stale so the next lookup reloads it."""
+        with self._lock:
+            self._loaded_at = None
+
+    def _age(self) -> float | None:
+        if self._loaded_at is None:
+            return None
+        return time.monotonic() - self._loaded_at
+
+    def get_schema_names(self) -> frozenset[str]:
+        """Returns the known schema names, reloading them if stale."""
+        age = self._age()
+        if age is None or age > self.ttl:
+            return self.refresh()
+        return self._schemas
+
+    def exists(self, schema: str) -> bool:
+        """Checks whether a schema exists."""
+        if schema in self.get_schema_names():
+            return True
+
+        # the schema may have been created by another process since our last load
+        age = self._age()
+        if age is None or age > self.miss_refresh_interval:
+            return schema in self.refresh()
+        return False
+
+    def organization_exists(self, organization_slug: str) -> bool:
+        """Checks whether the schema for an organization exists."""
+        return self.exists(f"{DISPATCH_ORGANIZATION_SCHEMA_PREFIX}_{organization_slug}")
+
+    def get_scoped_session(self, schema: str, scopefunc=None) -> scoped_session:
+        """Returns a scoped session registry bound to a schema translated engine.
+
+        The registry is built once per schema and reused across requests.
+        """
+        session = self._sessions.get(schema)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(schema)
+                if session is None:
+                    schema_engine = self.engine.execution_options(
+                        schema_translate_map={
+                            None: schema,
+                        }
+                    )
+                    session = scoped_session(sessionmaker(bind=schema_engine), scopefunc=scopefunc)
+                    self._sessions[schema] = session
+        return session
+
+
+schema_registry = SchemaRegistry(engine, ttl=config.DATABASE_SCHEMA_REGISTRY_TTL)
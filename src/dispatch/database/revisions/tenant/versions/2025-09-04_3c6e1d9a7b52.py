@@ -0,0 +1,38 @@
+"""Adds indexes used by signal deduplication.
+
+Revision ID: 3c6e1d9a7b52
+Revises: ff08d822ef2c
+Create Date: 2025-09-04 10:12:41.518209
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3c6e1d9a7b52"
+down_revision = "ff08d822ef2c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_signal_instance_signal_id_created_at",
+        "signal_instance",
+        ["signal_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_assoc_signal_instance_entities_entity_id",
+        "assoc_signal_instance_entities",
+        ["entity_id", "signal_instance_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_assoc_signal_instance_entities_entity_id",
+        table_name="assoc_signal_instance_entities",
+    )
+    op.drop_index("ix_signal_instance_signal_id_created_at", table_name="signal_instance")
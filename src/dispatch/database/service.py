@@ -1,18 +1,29 @@
+import base64
 import logging
 import json
+import uuid
 from collections import namedtuple
+from datetime import date, datetime
 from collections.abc import Iterable
 from inspect import signature
 from itertools import chain
 
-from fastapi import Depends, Query
+from fastapi import Depends, HTTPException, Query, status
 from pydantic import StringConstraints
 from pydantic import Json
 from six import string_types
 from sortedcontainers import SortedSet
-from sqlalchemy import Table, and_, desc, func, not_, or_, orm, exists
+from sqlalchemy import Table, and_, desc, func, inspect, not_, or_, orm, exists
 from sqlalchemy.exc import InvalidRequestError, ProgrammingError
-from sqlalchemy.orm import mapperlib, Query as SQLAlchemyQuery
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlalchemy.orm import (
+    Query as SQLAlchemyQuery,
+    load_only,
+    mapperlib,
+    raiseload,
+    selectinload,
+)
 from sqlalchemy_filters import apply_pagination, apply_sort
 from sqlalchemy_filters.exceptions import BadFilterFormat, FieldNotFound
 from sqlalchemy_filters.models import Field, BadQuery, BadSpec
@@ -24,7 +35,7 @@ from dispatch.case.models import Case
 from dispatch.data.query.models import Query as QueryModel
 from dispatch.data.source.models import Source
 from dispatch.database.core import DbSession
-from dispatch.enums import UserRoles, Visibility
+from dispatch.enums import DispatchEnum, UserRoles, Visibility
 from dispatch.feedback.incident.models import Feedback
 from dispatch.incident.models import Incident
 from dispatch.incident.type.models import IncidentType
@@ -616,6 +627,188 @@ CommonParameters = Annotated[
 ]
 
 
+class PaginationCount(DispatchEnum):
+    exact = "exact"
+    estimate = "estimate"
+    none = "none"
+
+
+def cursor_parameters(
+    cursor: str = Query(None),
+    count: PaginationCount = Query(PaginationCount.exact),
+):
+    """Opt-in keyset pagination, `?cursor=` (empty) requests the first page."""
+    return {"cursor": cursor, "count": count}
+
+
+CursorParameters = Annotated[dict[str, str | None], Depends(cursor_parameters)]
+
+
+class Explain(Executable, ClauseElement):
+    """Renders `EXPLAIN (FORMAT JSON)` for a statement."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def estimate_count(db_session, query) -> int:
+    """Returns the query planner's estimate of the number of rows a query returns."""
+    plan = db_session.execute(Explain(query.order_by(None).statement)).scalar()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def invalid_cursor(msg: str = "Invalid cursor."):
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=[{"msg": msg}],
+    )
+
+
+def get_cursor_sort_columns(model_cls, sort_by: list[str], descending: list[bool]):
+    """Returns the (column attribute, descending) keys a cursor paginates on.
+
+    Only columns of the model itself can be used, the primary key is always appended
+    to make the ordering total.
+    """
+    columns = inspect(model_cls).columns
+    keys = []
+    for i, field in enumerate(sort_by or []):
+        # check to see if field is json with a key parameter
+        try:
+            field = json.loads(field).get("key", "")
+        except (json.JSONDecodeError, AttributeError):
+            pass
+
+        if field not in columns:
+            raise invalid_cursor(f"Cursor pagination can't sort by `{field}`.")
+
+        direction = bool(descending[i]) if i < len(descending) else False
+        keys.append((getattr(model_cls, field), direction))
+
+    if "id" not in [column.key for column, _ in keys]:
+        keys.append((model_cls.id, keys[-1][1] if keys else False))
+    return keys
+
+
+def _encode_cursor_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _decode_cursor_value(column, value):
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    return value
+
+
+def encode_cursor(row, keys) -> str:
+    """Encodes the sort key values of a row into an opaque cursor."""
+    values = [_encode_cursor_value(getattr(row, column.key)) for column, _ in keys]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str, keys) -> list:
+    """Decodes a cursor created by `encode_cursor` for the same sort keys."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError
+        return [
+            _decode_cursor_value(column, v) for (column, _), v in zip(keys, values, strict=True)
+        ]
+    except (ValueError, TypeError):
+        raise invalid_cursor() from None
+
+
+def apply_cursor(query, keys, values):
+    """Filters the query to the rows after the cursor values.
+
+    Follows Postgres' default null ordering (last when ascending, first when descending).
+    """
+    conditions = []
+    for i, (column, descending) in enumerate(keys):
+        value = values[i]
+        if descending:
+            after = column.isnot(None) if value is None else column < value
+        else:
+            if value is None:
+                # nothing sorts after nulls in this column
+                after = None
+            else:
+                after = or_(column > value, column.is_(None))
+
+        if after is not None:
+            equal = [
+                c.is_(None) if v is None else c == v
+                for (c, _), v in zip(keys[:i], values[:i], strict=True)
+            ]
+            conditions.append(and_(*equal, after))
+
+    return query.filter(or_(*conditions))
+
+
+def cursor_paginate(
+    db_session,
+    query,
+    model_cls,
+    cursor: str,
+    items_per_page: int | None,
+    sort_by: list[str] = None,
+    descending: list[bool] = None,
+    count: PaginationCount = PaginationCount.exact,
+):
+    """Paginates a query on its sort keys instead of an offset."""
+    keys = get_cursor_sort_columns(model_cls, sort_by, descending or [])
+
+    if count == PaginationCount.exact:
+        total = query.order_by(None).count()
+    elif count == PaginationCount.estimate:
+        total = estimate_count(db_session, query)
+    else:
+        total = None
+
+    if cursor:
+        query = apply_cursor(query, keys, decode_cursor(cursor, keys))
+
+    query = query.order_by(None).order_by(
+        *[column.desc() if descending else column.asc() for column, descending in keys]
+    )
+
+    if items_per_page is None:
+        return query.all(), total, None
+
+    # an empty page has no last item to continue from
+    if items_per_page <= 0:
+        return [], total, None
+
+    items = query.limit(items_per_page + 1).all()
+    next_cursor = None
+    if len(items) > items_per_page:
+        items = items[:items_per_page]
+        next_cursor = encode_cursor(items[-1], keys)
+    return items, total, next_cursor
+
+
 def has_filter_model(model: str, filter_spec: list[dict]):
     """Checks if the filter spec has a TagAll filter."""
 
@@ -670,6 +863,77 @@ def rebuild_filter_spec_without_tag_all(filter_spec: dict):
     return ({"and": new_filter_spec} if len(new_filter_spec) else None, tag_all_spec)
 
 
+# attributes computed in python and the projection they need loaded
+computed_attribute_map = {
+    (Incident, "total_cost"): {"incident_costs": {"amount": ...}},
+    (Incident, "tactical_reports"): {"reports": ...},
+    (Incident, "last_tactical_report"): {"reports": ...},
+    (Incident, "executive_reports"): {"reports": ...},
+    (Incident, "last_executive_report"): {"reports": ...},
+}
+
+
+def create_load_options(
+    model_cls, projection: dict, columns: list[str] = None, raise_on_unloaded: bool = True
+) -> list:
+    """Translates a projection into loader options.
+
+    The projection is a pydantic include set (see `create_pydantic_include`). Only the
+    projected columns are loaded and projected relationships are eagerly loaded with
+    their own projection. Relationships that aren't projected raise if accessed when
+    `raise_on_unloaded` is set, this only applies to `model_cls` itself.
+
+    Computed attributes are replaced by the projection they depend on (see
+    `computed_attribute_map`). If the projection references anything else that level
+    is loaded as usual.
+    """
+    mapper = inspect(model_cls)
+    load_columns, options = [], []
+    complete = True
+
+    expanded = {}
+    for key, subprojection in projection.items():
+        dependencies = computed_attribute_map.get((model_cls, key))
+        if dependencies:
+            for dependency, dependency_projection in dependencies.items():
+                expanded.setdefault(dependency, dependency_projection)
+        else:
+            expanded[key] = subprojection
+
+    for key, subprojection in expanded.items():
+        if key in mapper.columns:
+            load_columns.append(getattr(model_cls, key))
+        elif key in mapper.relationships:
+            loader = selectinload(getattr(model_cls, key))
+            if isinstance(subprojection, dict):
+                subprojection = subprojection.get("__all__", subprojection)
+            if isinstance(subprojection, dict):
+                related_options = create_load_options(
+                    mapper.relationships[key].mapper.class_,
+                    subprojection,
+                    raise_on_unloaded=False,
+                )
+                if related_options:
+                    loader = loader.options(*related_options)
+            options.append(loader)
+        else:
+            complete = False
+
+    if complete:
+        for column in columns or []:
+            if column in mapper.columns:
+                load_columns.append(getattr(model_cls, column))
+        if not load_columns:
+            load_columns = [
+                mapper.get_property_by_column(column).class_attribute
+                for column in mapper.primary_key
+            ]
+        options.append(load_only(*load_columns))
+        if raise_on_unloaded:
+            options.append(raiseload("*"))
+    return options
+
+
 def search_filter_sort_paginate(
     db_session,
     model,
@@ -682,13 +946,30 @@ def search_filter_sort_paginate(
     current_user: DispatchUser = None,
     role: UserRoles = UserRoles.member,
     security_event_only: bool = None,
+    cursor: str = None,
+    count: PaginationCount = PaginationCount.exact,
+    projection: dict = None,
 ):
-    """Common functionality for searching, filtering, sorting, and pagination."""
+    """Common functionality for searching, filtering, sorting, and pagination.
+
+    If a cursor is passed (an empty one requests the first page) the results are
+    paginated on the sort keys instead of an offset, `count` controls how the total
+    is computed.
+
+    If a projection is passed only the projected attributes are loaded, see
+    `create_load_options`.
+    """
     model_cls = get_class_by_tablename(model)
 
     try:
         query = db_session.query(model_cls)
 
+        if projection:
+            # sort columns must be loaded as they can't be ordered by otherwise with DISTINCT
+            query = query.options(
+                *create_load_options(model_cls, projection, columns=sort_by or [])
+            )
+
         if query_str:
             sort = False if sort_by else True
             query = search(query_str=query_str, query=query, model=model, sort=sort)
@@ -727,7 +1008,7 @@ def search_filter_sort_paginate(
         for filter in tag_all_filters:
             query = query.intersect(filter)
 
-        if sort_by:
+        if sort_by and cursor is None:
             sort_spec = create_sort_spec(model, sort_by, descending)
             query = apply_sort(query, sort_spec)
 
@@ -742,6 +1023,35 @@ def search_filter_sort_paginate(
     # TODO investigate moving to a different way to parsing queries that won't through errors
     # e.g. websearch_to_tsquery
     # https://www.postgresql.org/docs/current/textsearch-controls.html
+    if cursor is not None:
+        try:
+            items, total, next_cursor = cursor_paginate(
+                db_session,
+                query,
+                model_cls,
+                cursor=cursor,
+                items_per_page=items_per_page,
+                sort_by=sort_by,
+                descending=descending,
+                count=count,
+            )
+        except ProgrammingError as e:
+            log.debug(e)
+            return {
+                "items": [],
+                "itemsPerPage": items_per_page,
+                "page": page,
+                "total": 0,
+            }
+
+        return {
+            "items": items,
+            "itemsPerPage": items_per_page if items_per_page is not None else -1,
+            "page": page,
+            "total": total,
+            "nextCursor": next_cursor,
+        }
+
     try:
         # Check if this model is likely to have duplicate results from many-to-many joins
         # Models with many secondary relationships (like Tag) can cause count inflation
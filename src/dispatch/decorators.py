@@ -1,7 +1,8 @@
 import inspect
 import logging
 import time
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
 
 from sqlalchemy.orm import scoped_session
 
@@ -19,9 +20,49 @@ def fullname(o):
     return f"{module.__name__}.{o.__qualname__}"
 
 
+def _run_project_unit(func, organization_slug: str, project_id: int, timeout, *args, **kwargs):
+    """Runs a scheduled task for a single project, in its own session."""
+    schema_engine = engine.execution_options(
+        schema_translate_map={None: f"dispatch_organization_{organization_slug}"}
+    )
+    db_session = sessionmaker(bind=schema_engine)()
+    tags = {"function": fullname(func), "organization": organization_slug}
+    start = time.perf_counter()
+
+    try:
+        project = project_service.get(db_session=db_session, project_id=project_id)
+        tags["project"] = project.slug
+        func(*args, db_session=db_session, project=project, **kwargs)
+    except Exception as e:
+        log.error(
+            f"Error trying to execute task: {fullname(func)} for project {project_id} in organization {organization_slug} with parameters {args} and {kwargs}"
+        )
+        log.exception(e)
+        metrics_provider.counter("function.project.error.counter", tags=tags)
+        db_session.rollback()
+    finally:
+        db_session.close()
+
+        elapsed_time = time.perf_counter() - start
+        metrics_provider.timer("function.project.elapsed.time", value=elapsed_time, tags=tags)
+        if timeout and elapsed_time > timeout:
+            # threads can't be interrupted, overruns are only reported
+            log.warning(
+                "Task %s for project %s in organization %s took %.2f seconds (timeout: %s).",
+                fullname(func),
+                project_id,
+                organization_slug,
+                elapsed_time,
+                timeout,
+            )
+            metrics_provider.counter("function.project.timeout.counter", tags=tags)
+
+
 def _execute_task_in_project_context(
     func,
     *args,
+    max_workers: int = 1,
+    timeout: int | None = None,
     **kwargs,
 ) -> None:
     CoreSession = scoped_session(sessionmaker(bind=engine))
@@ -31,28 +72,43 @@ def _execute_task_in_project_context(
     start = time.perf_counter()
 
     try:
-        # iterate for all schema
+        # collect the (organization, project) units of work of all schemas
+        units = []
         for organization in organization_service.get_all(db_session=db_session):
             schema_engine = engine.execution_options(
                 schema_translate_map={None: f"dispatch_organization_{organization.slug}"}
             )
-            OrgSession = scoped_session(sessionmaker(bind=schema_engine))
-            schema_session = OrgSession()
-
+            schema_session = sessionmaker(bind=schema_engine)()
             try:
-                kwargs["db_session"] = schema_session
                 for project in project_service.get_all(db_session=schema_session):
-                    kwargs["project"] = project
-                    func(*args, **kwargs)
+                    units.append((organization.slug, project.id))
             except Exception as e:
                 log.error(
-                    f"Error trying to execute task: {fullname(func)} with parameters {args} and {kwargs}"
+                    f"Error trying to list the projects of organization {organization.slug} for task: {fullname(func)}"
                 )
                 log.exception(e)
-                schema_session.rollback()
             finally:
                 schema_session.close()
-                OrgSession.remove()
+
+        if max_workers > 1 and len(units) > 1:
+            # a slow project only holds up one worker
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(units)),
+                thread_name_prefix=f"scheduled-{func.__name__}",
+            ) as executor:
+                for organization_slug, project_id in units:
+                    executor.submit(
+                        _run_project_unit,
+                        func,
+                        organization_slug,
+                        project_id,
+                        timeout,
+                        *args,
+                        **kwargs,
+                    )
+        else:
+            for organization_slug, project_id in units:
+                _run_project_unit(func, organization_slug, project_id, timeout, *args, **kwargs)
 
         elapsed_time = time.perf_counter() - start
         metrics_provider.timer(
@@ -67,18 +123,27 @@ def _execute_task_in_project_context(
         CoreSession.remove()
 
 
-def scheduled_project_task(func):
+def scheduled_project_task(func=None, *, max_workers: int = 1, timeout: int | None = None):
     """Decorator that sets up a background task function with
     a database session and exception tracking.
 
-    Each task is executed in a specific project context.
+    Each task is executed in a specific project context, with its own session.
+    Projects are processed one after the other unless `max_workers` is greater
+    than one, in which case they are fanned out to a thread pool of that size.
+    Projects taking longer than `timeout` seconds are reported.
+
+    Can be used as `@scheduled_project_task` or `@scheduled_project_task(max_workers=8)`.
     """
+    if func is None:
+        return partial(scheduled_project_task, max_workers=max_workers, timeout=timeout)
 
     @wraps(func)
     def wrapper(*args, **kwargs):
         _execute_task_in_project_context(
             func,
             *args,
+            max_workers=max_workers,
+            timeout=timeout,
             **kwargs,
         )
 
@@ -144,7 +209,7 @@ def timer(func):
         metrics_provider.timer(
             "function.elapsed.time", value=elapsed_time, tags={"function": fullname(func)}
         )
-        log.debug(f"function.elapsed.time.{fullname(func)}: {elapsed_time}")
+        log.debug("function.elapsed.time.%s: %s", fullname(func), elapsed_time)
         return result
 
     return wrapper
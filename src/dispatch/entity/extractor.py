@@ -0,0 +1,123 @@
+import functools
+import logging
+import re
+import threading
+from collections.abc import Generator, Sequence
+from typing import Any, NamedTuple
+
+import jsonpath_ng
+from cachetools import LRUCache
+
+from dispatch.entity_type.models import EntityType, EntityTypeCreate
+
+log = logging.getLogger(__name__)
+
+
+class CompiledEntityType(NamedTuple):
+    """An entity type with its expressions parsed ahead of time."""
+
+    entity_type: EntityTypeCreate
+    regex: re.Pattern[str] | None
+    json_path: jsonpath_ng.JSONPath | None
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_regex(regular_expression: str) -> re.Pattern[str]:
+    return re.compile(regular_expression)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_jpath(jpath: str) -> jsonpath_ng.JSONPath:
+    return jsonpath_ng.parse(jpath)
+
+
+def compile_entity_type(entity_type: EntityType) -> CompiledEntityType:
+    """Parses the regular expression and JSONPath of an entity type."""
+    return CompiledEntityType(
+        entity_type=EntityTypeCreate.model_validate(entity_type),
+        regex=(
+            _compile_regex(entity_type.regular_expression)
+            if entity_type.regular_expression
+            else None
+        ),
+        json_path=_parse_jpath(entity_type.jpath) if entity_type.jpath else None,
+    )
+
+
+class EntityExtractor:
+    """Extracts entity values from raw signal payloads using precompiled entity types."""
+
+    def __init__(self, compiled_entity_types: Sequence[CompiledEntityType]):
+        self.compiled_entity_types = list(compiled_entity_types)
+
+    def __add__(self, other: "EntityExtractor") -> "EntityExtractor":
+        return EntityExtractor(self.compiled_entity_types + other.compiled_entity_types)
+
+    def __bool__(self) -> bool:
+        return bool(self.compiled_entity_types)
+
+    def find_values(self, raw: Any) -> Generator[tuple[EntityTypeCreate, str], None, None]:
+        """Yields (entity type, value) pairs found in a raw payload."""
+        for entity_type, _, json_path in self.compiled_entity_types:
+            if not json_path:
+                continue
+
+            try:
+                for match in json_path.find(raw):
+                    if isinstance(match.value, str):
+                        yield entity_type, match.value
+            except KeyError:
+                log.warning(
+                    f"Unable to extract entity {str(json_path)} is not a valid JSONPath."
+                    f"A KeyError usually occurs when the JSONPath includes a list index lookup against a dictionary value."
+                    f"  Example: dictionary[0].value"
+                )
+                continue
+            except Exception as e:
+                log.exception(
+                    f"An error occurred while extracting entity {str(json_path)}: {str(e)}"
+                )
+                continue
+
+
+class EntityExtractorCache:
+    """Bounded cache of entity extractors keyed by the entity types they were built from.
+
+    The key includes the expressions of each entity type, so edited entity types
+    never hit a stale extractor. The cache is also cleared whenever entity types
+    are created, updated or deleted.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self._cache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, entity_types: Sequence[EntityType]) -> EntityExtractor:
+        """Returns the extractor for the given entity types, building it if needed."""
+        entity_types = [
+            t for t in entity_types if isinstance(t.regular_expression, str) or t.jpath is not None
+        ]
+
+        # entity types that have not been persisted yet can't be told apart reliably
+        if any(t.id is None for t in entity_types):
+            return EntityExtractor([compile_entity_type(t) for t in entity_types])
+
+        key = tuple(
+            (t.id, t.project_id, t.name, t.jpath, t.regular_expression) for t in entity_types
+        )
+
+        with self._lock:
+            extractor = self._cache.get(key)
+        if extractor is None:
+            extractor = EntityExtractor([compile_entity_type(t) for t in entity_types])
+            with self._lock:
+                self._cache[key] = extractor
+        return extractor
+
+    def invalidate(self) -> None:
+        """Drops all cached extractors."""
+        with self._lock:
+            self._cache.clear()
+
+
+entity_extractor_cache = EntityExtractorCache()
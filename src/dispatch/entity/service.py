@@ -1,15 +1,13 @@
 from datetime import datetime, timedelta
 import logging
-import re
-from collections.abc import Generator, Sequence
-from typing import NamedTuple
-import jsonpath_ng
+from collections.abc import Sequence
 from pydantic import ValidationError
 from sqlalchemy import desc
 from sqlalchemy.orm import Session, joinedload
 
 from dispatch.project import service as project_service
 from dispatch.case.models import Case
+from dispatch.entity.extractor import EntityExtractor, entity_extractor_cache
 from dispatch.entity.models import Entity, EntityCreate, EntityUpdate, EntityRead
 from dispatch.entity_type import service as entity_type_service
 from dispatch.entity_type.models import EntityType
@@ -244,18 +242,16 @@ def get_signal_instances_with_entities(
     return signal_instances
 
 
-EntityTypePair = NamedTuple(
-    "EntityTypePairTuple",
-    [
-        ("entity_type", EntityType),
-        ("regex", re.Pattern[str] | None),
-        ("json_path", jsonpath_ng.JSONPath | None),
-    ],
-)
+def get_entity_extractor(entity_types: Sequence[EntityType]) -> EntityExtractor:
+    """Returns a (cached) extractor for a list of EntityTypes."""
+    return entity_extractor_cache.get(entity_types)
 
 
 def find_entities(
-    db_session: Session, signal_instance: SignalInstance, entity_types: Sequence[EntityType]
+    db_session: Session,
+    signal_instance: SignalInstance,
+    entity_types: Sequence[EntityType] = (),
+    extractor: EntityExtractor | None = None,
 ) -> list[Entity]:
     """
     Find entities in a SignalInstance based on a list of EntityTypes.
@@ -264,66 +260,24 @@ def find_entities(
         db_session (Session): The database session to use for entity creation.
         signal_instance (SignalInstance): The SignalInstance to extract entities from.
         entity_types (Sequence[EntityType]): A list of EntityTypes to search for in the SignalInstance.
+        extractor (EntityExtractor): A precompiled extractor to use instead of `entity_types`.
 
     Returns:
         list[Entity]: A list of entities found in the SignalInstance.
     """
-
-    def _find_entities_by_jsonpath_expression(
-        signal_instance: SignalInstance,
-        entity_type_pairs: list[EntityTypePair],
-    ) -> Generator[EntityCreate, None, None]:
-        """
-        Yield entities found in a SignalInstance by searching its fields using regular expressions and JSONPath expressions.
-
-        Args:
-            signal_instance: The SignalInstance to extract entities from.
-            entity_type_pairs: A list of (entity_type, entity_regex, jpath) tuples to search for.
-
-        Yields:
-            EntityCreate: An entity found in the SignalInstance.
-        """
-        for entity_type, _, jpath in entity_type_pairs:
-            if jpath:
-                try:
-                    matches = jpath.find(signal_instance.raw)
-                    for match in matches:
-                        if isinstance(match.value, str):
-                            yield EntityCreate(
-                                id=None,
-                                value=match.value,
-                                entity_type=entity_type,
-                                project=signal_instance.project,
-                            )
-
-                except KeyError:
-                    log.warning(
-                        f"Unable to extract entity {str(jpath)} is not a valid JSONPath for Instance {signal_instance.id}."
-                        f"A KeyError usually occurs when the JSONPath includes a list index lookup against a dictionary value."
-                        f"  Example: dictionary[0].value"
-                    )
-                    continue
-                except Exception as e:  # Add this to handle general exceptions
-                    log.exception(
-                        f"An error occurred while extracting entity {str(jpath)} from Instance {signal_instance.id}: {str(e)}"
-                    )
-                    continue
-
-    # Create a list of (entity type, regular expression, jpath) tuples
-    entity_type_pairs = [
-        (
-            type,
-            re.compile(type.regular_expression) if type.regular_expression else None,
-            jsonpath_ng.parse(type.jpath) if type.jpath else None,
+    if extractor is None:
+        extractor = get_entity_extractor(entity_types)
+
+    entities = [
+        EntityCreate(
+            id=None,
+            value=value,
+            entity_type=entity_type,
+            project=signal_instance.project,
         )
-        for type in entity_types
-        if isinstance(type.regular_expression, str) or type.jpath is not None
+        for entity_type, value in extractor.find_values(signal_instance.raw)
     ]
 
-    entities = []
-
-    entities.extend(_find_entities_by_jsonpath_expression(signal_instance, entity_type_pairs))
-
     # Filter out duplicate entities
     entities = list(set(entities))
 
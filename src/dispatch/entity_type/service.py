@@ -3,6 +3,7 @@ import logging
 from pydantic import ValidationError
 from sqlalchemy.orm import Query, Session
 from jsonpath_ng import parse
+from dispatch.entity.extractor import entity_extractor_cache
 from dispatch.project import service as project_service
 from dispatch.signal import service as signal_service
 from .models import EntityType, EntityTypeCreate, EntityTypeRead, EntityTypeUpdate
@@ -77,6 +78,7 @@ def create(
 
     db_session.add(entity_type)
     db_session.commit()
+    entity_extractor_cache.invalidate()
 
     # Extract entities for all relevant signal instances
     from dispatch.signal.models import SignalInstance
@@ -141,6 +143,7 @@ def update(
     set_jpath(entity_type, entity_type_in)
 
     db_session.commit()
+    entity_extractor_cache.invalidate()
     return entity_type
 
 
@@ -149,6 +152,7 @@ def delete(*, db_session: Session, entity_type_id: int) -> None:
     entity_type = db_session.query(EntityType).filter(EntityType.id == entity_type_id).one()
     db_session.delete(entity_type)
     db_session.commit()
+    entity_extractor_cache.invalidate()
 
 
 def set_jpath(entity_type: EntityType, entity_type_in: EntityTypeCreate):
@@ -124,16 +124,19 @@ def incident_report_daily(db_session: Session, project: Project):
     notifications = notification_service.get_all_enabled(
         db_session=db_session, project_id=project.id
     )
+    # we match all incidents against each filter at once
+    notifications_matches = {
+        notification.id: search_filter_service.match_all(
+            db_session=db_session,
+            search_filters=notification.filters,
+            class_instances=incidents,
+        )
+        for notification in notifications
+    }
     for incident in incidents:
         for notification in notifications:
             for search_filter in notification.filters:
-                match = search_filter_service.match(
-                    db_session=db_session,
-                    subject=search_filter.subject,
-                    filter_spec=search_filter.expression,
-                    class_instance=incident,
-                )
-                if match:
+                if incident.id in notifications_matches[notification.id][search_filter.id]:
                     incidents_notification_filters_mapping[notification.id][
                         search_filter.id
                     ].append(incident)
@@ -343,7 +346,7 @@ def incident_report_weekly(db_session: Session, project: Project):
 
 @scheduler.add(every(1).hour, name="incident-sync-members")
 @timer
-@scheduled_project_task
+@scheduled_project_task(max_workers=8, timeout=1800)
 def incident_sync_members(db_session: Session, project: Project):
     """Checks the members of all conversations associated with active
     and stable incidents and ensures they are in the incident."""
@@ -1,5 +1,4 @@
 import calendar
-import json
 import logging
 from datetime import date, datetime
 from typing import Annotated
@@ -18,9 +17,17 @@ from dispatch.auth.permissions import (
     PermissionsDependency,
 )
 from dispatch.auth.service import CurrentUser
-from dispatch.common.utils.views import create_pydantic_include
+from dispatch.common.utils.views import (
+    PydanticJSONResponse,
+    create_projected_pagination,
+    create_pydantic_include,
+)
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    CursorParameters,
+    search_filter_sort_paginate,
+)
 from dispatch.event import flows as event_flows
 from dispatch.event.models import EventCreateMinimal, EventUpdate
 from dispatch.incident.enums import IncidentStatus
@@ -76,27 +83,29 @@ CurrentIncident = Annotated[Incident, Depends(get_current_incident)]
 @router.get("", summary="Retrieve a list of incidents.")
 def get_incidents(
     common: CommonParameters,
+    cursor: CursorParameters,
     include: list[str] = Query([], alias="include[]"),
     expand: bool = Query(default=False),
 ):
     """Retrieves a list of incidents."""
-    pagination = search_filter_sort_paginate(model="Incident", **common)
-
-    if expand:
-        return json.loads(IncidentExpandedPagination(**pagination).json())
-
-    if include:
+    if include and not expand:
         # only allow two levels for now
         include_sets = create_pydantic_include(include)
 
-        include_fields = {
-            "items": {"__all__": include_sets},
-            "itemsPerPage": ...,
-            "page": ...,
-            "total": ...,
-        }
-        return json.loads(IncidentExpandedPagination(**pagination).json(include=include_fields))
-    return json.loads(IncidentPagination(**pagination).json())
+        # only the included attributes are loaded and serialized
+        pagination = search_filter_sort_paginate(
+            model="Incident", projection=include_sets, **common, **cursor
+        )
+        return PydanticJSONResponse(
+            create_projected_pagination(IncidentRead, include_sets)(**pagination)
+        )
+
+    pagination = search_filter_sort_paginate(model="Incident", **common, **cursor)
+
+    if expand:
+        return PydanticJSONResponse(IncidentExpandedPagination(**pagination))
+
+    return PydanticJSONResponse(IncidentPagination(**pagination))
 
 
 @router.get(
@@ -4,15 +4,16 @@ from schedule import every
 
 from dispatch.database.core import SessionLocal
 from dispatch.decorators import scheduled_project_task, timer
-from dispatch.incident import service as incident_service
-from dispatch.incident.enums import IncidentStatus
 from dispatch.incident_cost_type import service as incident_cost_type_service
 from dispatch.project.models import Project
 from dispatch.scheduler import scheduler
 
 from .service import (
     calculate_incident_response_cost,
+    get_cost_model_incidents_to_update,
+    get_incidents_without_response_cost,
     get_or_create_default_incident_response_cost,
+    update_classic_incidents_response_cost,
 )
 
 
@@ -21,7 +22,7 @@ log = logging.getLogger(__name__)
 
 @scheduler.add(every(1).hour, name="calculate-incidents-response-cost")
 @timer
-@scheduled_project_task
+@scheduled_project_task(max_workers=8, timeout=1800)
 def calculate_incidents_response_cost(db_session: SessionLocal, project: Project):
     """Calculates and saves the response cost for all incidents."""
     response_cost_type = incident_cost_type_service.get_default(
@@ -33,23 +34,29 @@ def calculate_incidents_response_cost(db_session: SessionLocal, project: Project
         )
         return
 
-    incidents = incident_service.get_all(db_session=db_session, project_id=project.id)
+    # incidents without a response cost get one, their cost accrues from then on
+    for incident in get_incidents_without_response_cost(
+        db_session=db_session,
+        project_id=project.id,
+        incident_cost_type_id=response_cost_type.id,
+    ):
+        try:
+            get_or_create_default_incident_response_cost(incident, db_session)
+        except Exception as e:
+            log.exception(e)
 
-    for incident in incidents:
+    # incidents using a cost model record the activity fetched from their plugins
+    for incident in get_cost_model_incidents_to_update(
+        db_session=db_session,
+        project_id=project.id,
+        incident_cost_type_id=response_cost_type.id,
+    ):
         try:
             # we get the response cost for the given incident
             incident_response_cost = get_or_create_default_incident_response_cost(
                 incident, db_session
             )
 
-            # we don't need to update the cost of closed incidents
-            # if they already have a response cost and this was updated
-            # after the incident was marked as stable
-            if incident.status == IncidentStatus.closed:
-                if incident_response_cost:
-                    if incident_response_cost.updated_at > incident.stable_at:
-                        continue
-
             # we calculate the response cost amount
             amount = calculate_incident_response_cost(incident.id, db_session)
             # we don't need to update the cost amount if it hasn't changed
@@ -64,3 +71,11 @@ def calculate_incidents_response_cost(db_session: SessionLocal, project: Project
         except Exception as e:
             # we shouldn't fail to update all incidents when one fails
             log.exception(e)
+
+    # the time accrued by the participants of the other incidents is aggregated in the database,
+    # incidents without new participant time since their cost was last updated are skipped
+    update_classic_incidents_response_cost(
+        db_session=db_session,
+        project=project,
+        incident_cost_type_id=response_cost_type.id,
+    )
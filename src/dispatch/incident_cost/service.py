@@ -2,9 +2,11 @@ from datetime import datetime, timedelta, timezone
 import logging
 import math
 
+from sqlalchemy import Float, and_, case, cast, exists, extract, func, or_
+from sqlalchemy import update as sql_update
 from sqlalchemy.orm import Session
 
-from dispatch.cost_model.models import CostModelActivity
+from dispatch.cost_model.models import CostModel, CostModelActivity
 from dispatch.incident import service as incident_service
 from dispatch.incident.enums import IncidentStatus
 from dispatch.incident.models import Incident
@@ -12,8 +14,8 @@ from dispatch.incident.type.models import IncidentType
 from dispatch.incident_cost_type import service as incident_cost_type_service
 from dispatch.incident_cost_type.models import IncidentCostTypeRead
 from dispatch.participant import service as participant_service
-from dispatch.participant.models import ParticipantRead
-from dispatch.participant_activity import service as participant_activity_service
+from dispatch.participant.models import Participant, ParticipantRead
+from dispatch.participant_activity.buffer import ParticipantActivityBuffer
 from dispatch.participant_activity.models import ParticipantActivityCreate
 from dispatch.participant_role.models import ParticipantRoleType, ParticipantRole
 from dispatch.plugin import service as plugin_service
@@ -102,18 +104,19 @@ def delete(*, db_session: Session, incident_cost_id: int):
     db_session.commit()
 
 
+ENGAGEMENT_MULTIPLIERS = {
+    ParticipantRoleType.incident_commander: 1,
+    ParticipantRoleType.scribe: 0.75,
+    ParticipantRoleType.liaison: 0.75,
+    ParticipantRoleType.participant: 0.5,
+    ParticipantRoleType.reporter: 0.5,
+    # ParticipantRoleType.observer: 0, # NOTE: set to 0. It's not used, as we don't calculate cost for participants with observer role
+}
+
+
 def get_engagement_multiplier(participant_role: str):
     """Returns an engagement multiplier for a given incident role."""
-    engagement_mappings = {
-        ParticipantRoleType.incident_commander: 1,
-        ParticipantRoleType.scribe: 0.75,
-        ParticipantRoleType.liaison: 0.75,
-        ParticipantRoleType.participant: 0.5,
-        ParticipantRoleType.reporter: 0.5,
-        # ParticipantRoleType.observer: 0, # NOTE: set to 0. It's not used, as we don't calculate cost for participants with observer role
-    }
-
-    return engagement_mappings.get(participant_role)
+    return ENGAGEMENT_MULTIPLIERS.get(participant_role)
 
 
 def get_incident_review_hours(incident: Incident) -> int:
@@ -265,18 +268,23 @@ def calculate_incident_response_cost_with_cost_model(
         oldest = incident_response_cost.updated_at.replace(tzinfo=timezone.utc).timestamp()
 
     # Get the cost model. Iterate through all the listed activities we want to record.
+    participants = {}
     for activity in incident.incident_type.cost_model.activities:
         # Array of sorted (timestamp, user_id) tuples.
         incident_events = fetch_incident_events(
             incident=incident, activity=activity, oldest=oldest, db_session=db_session
         )
 
+        # overlapping events of a participant are recorded as a single activity
+        activity_buffer = ParticipantActivityBuffer()
         for ts, user_id in incident_events:
-            participant = participant_service.get_by_incident_id_and_conversation_id(
-                db_session=db_session,
-                incident_id=incident.id,
-                user_conversation_id=user_id,
-            )
+            if user_id not in participants:
+                participants[user_id] = participant_service.get_by_incident_id_and_conversation_id(
+                    db_session=db_session,
+                    incident_id=incident.id,
+                    user_conversation_id=user_id,
+                )
+            participant = participants[user_id]
             if not participant:
                 log.warning("Cannot resolve participant.")
                 continue
@@ -288,13 +296,11 @@ def calculate_incident_response_cost_with_cost_model(
                 participant=ParticipantRead(id=participant.id),
                 incident=incident,
             )
+            activity_buffer.add(activity_in)
 
-            if participant_response_time := participant_activity_service.create_or_update(
-                db_session=db_session, activity_in=activity_in
-            ):
-                participants_total_response_time_seconds += (
-                    participant_response_time.total_seconds()
-                )
+        participants_total_response_time_seconds += activity_buffer.flush(
+            db_session=db_session
+        ).total_seconds()
 
     hourly_rate = get_hourly_rate(incident.project)
     amount = calculate_response_cost(
@@ -457,6 +463,160 @@ def calculate_incident_response_cost_with_classic_model(
     return float(incident_response_cost.amount) + amount
 
 
+def get_participant_role_time_seconds_expression(now: datetime):
+    """Returns `get_participant_role_time_seconds` as a SQL expression.
+
+    The expression is evaluated over incident, participant role and incident cost rows,
+    the incident cost's `updated_at` being the time from which time spent is considered.
+
+    Returns:
+        tuple: The time spent expression, and the start and end of the time considered.
+    """
+    start_at = func.greatest(ParticipantRole.assumed_at, IncidentCost.updated_at)
+    end_at = case(
+        (
+            Incident.status == IncidentStatus.active,
+            func.coalesce(ParticipantRole.renounced_at, now),
+        ),
+        # least() ignores nulls, roles that are still assumed end when the incident became stable
+        else_=func.least(func.coalesce(Incident.stable_at, now), ParticipantRole.renounced_at),
+    )
+
+    hours = cast(extract("epoch", end_at - start_at), Float) / SECONDS_IN_HOUR
+    days = func.floor(hours / HOURS_IN_DAY)
+    adjusted_hours = case(
+        (hours > HOURS_IN_DAY, (days * HOURS_IN_DAY) / 3 + (hours - days * HOURS_IN_DAY)),
+        else_=hours,
+    )
+    multiplier = case(
+        {role.value: multiplier for role, multiplier in ENGAGEMENT_MULTIPLIERS.items()},
+        value=ParticipantRole.role,
+    )
+    return adjusted_hours * SECONDS_IN_HOUR * multiplier, start_at, end_at
+
+
+def get_classic_response_time_seconds(
+    *, db_session: Session, project_id: int, incident_cost_type_id: int, now: datetime
+) -> list[tuple[int, float, float]]:
+    """Returns the participant time accrued by incidents using the classic cost model.
+
+    Only incidents with time accrued since their response cost was last updated are returned,
+    as (incident cost id, incident cost amount, time in seconds) tuples.
+    """
+    seconds, start_at, end_at = get_participant_role_time_seconds_expression(now)
+    return (
+        db_session.query(IncidentCost.id, IncidentCost.amount, func.sum(seconds))
+        .select_from(Incident)
+        .join(IncidentType, Incident.incident_type_id == IncidentType.id)
+        .outerjoin(CostModel, IncidentType.cost_model_id == CostModel.id)
+        .join(
+            IncidentCost,
+            and_(
+                IncidentCost.incident_id == Incident.id,
+                IncidentCost.incident_cost_type_id == incident_cost_type_id,
+            ),
+        )
+        .join(Participant, Participant.incident_id == Incident.id)
+        .join(ParticipantRole, ParticipantRole.participant_id == Participant.id)
+        .filter(Incident.project_id == project_id)
+        .filter(CostModel.enabled.isnot(True))
+        .filter(ParticipantRole.role != ParticipantRoleType.observer)
+        .filter(or_(ParticipantRole.activity.is_(None), ParticipantRole.activity != 0))
+        .filter(
+            or_(
+                ParticipantRole.renounced_at.is_(None),
+                ParticipantRole.renounced_at >= IncidentCost.updated_at,
+            )
+        )
+        .filter(end_at > start_at)
+        .group_by(IncidentCost.id, IncidentCost.amount)
+        .all()
+    )
+
+
+def update_classic_incidents_response_cost(
+    *, db_session: Session, project, incident_cost_type_id: int
+) -> int:
+    """Adds the response cost accrued since their last update to the incidents of a project.
+
+    Covers the incidents using the classic cost model, which already have a response cost.
+    The time accrued is aggregated in the database and the costs are updated in bulk.
+
+    Returns:
+        int: The number of incident costs updated.
+    """
+    now = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+    hourly_rate = get_hourly_rate(project)
+
+    updates = []
+    for incident_cost_id, amount, seconds in get_classic_response_time_seconds(
+        db_session=db_session,
+        project_id=project.id,
+        incident_cost_type_id=incident_cost_type_id,
+        now=now,
+    ):
+        if not seconds:
+            continue
+        cost = calculate_response_cost(hourly_rate=hourly_rate, total_response_time_seconds=seconds)
+        updates.append(
+            {"id": incident_cost_id, "amount": float(amount or 0) + cost, "updated_at": now}
+        )
+
+    if updates:
+        db_session.execute(sql_update(IncidentCost), updates)
+        db_session.commit()
+    return len(updates)
+
+
+def get_incidents_without_response_cost(
+    *, db_session: Session, project_id: int, incident_cost_type_id: int
+) -> list[Incident]:
+    """Returns the incidents of a project that don't have a response cost yet."""
+    return (
+        db_session.query(Incident)
+        .filter(Incident.project_id == project_id)
+        .filter(
+            ~exists().where(
+                IncidentCost.incident_id == Incident.id,
+                IncidentCost.incident_cost_type_id == incident_cost_type_id,
+            )
+        )
+        .all()
+    )
+
+
+def get_cost_model_incidents_to_update(
+    *, db_session: Session, project_id: int, incident_cost_type_id: int
+) -> list[Incident]:
+    """Returns the incidents of a project using a cost model whose response cost may change.
+
+    Closed incidents whose response cost was updated after they were marked as stable are skipped.
+    """
+    return (
+        db_session.query(Incident)
+        .join(IncidentType, Incident.incident_type_id == IncidentType.id)
+        .join(CostModel, IncidentType.cost_model_id == CostModel.id)
+        .outerjoin(
+            IncidentCost,
+            and_(
+                IncidentCost.incident_id == Incident.id,
+                IncidentCost.incident_cost_type_id == incident_cost_type_id,
+            ),
+        )
+        .filter(Incident.project_id == project_id)
+        .filter(CostModel.enabled.is_(True))
+        .filter(
+            or_(
+                Incident.status != IncidentStatus.closed,
+                IncidentCost.id.is_(None),
+                Incident.stable_at.is_(None),
+                IncidentCost.updated_at <= Incident.stable_at,
+            )
+        )
+        .all()
+    )
+
+
 def calculate_incident_response_cost(
     incident_id: int, db_session: Session, incident_review: bool = False
 ) -> int:
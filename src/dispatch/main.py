@@ -11,8 +11,6 @@ from pydantic import ValidationError
 from sentry_asgi import SentryMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from sqlalchemy import inspect
-from sqlalchemy.orm import scoped_session, sessionmaker
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
@@ -25,8 +23,8 @@ from .common.utils.cli import install_plugin_events, install_plugins
 from .config import (
     STATIC_DIR,
 )
-from .database.core import engine
 from .database.logging import SessionTracker
+from .database.registry import schema_registry
 from .extensions import configure_extensions
 from .logging import configure_logging
 from .metrics import provider as metric_provider
@@ -84,18 +82,61 @@ api = FastAPI(
 api.add_middleware(GZipMiddleware, minimum_size=1000)
 
 
-def get_path_params_from_request(request: Request) -> str:
-    path_params = {}
-    for r in api_router.routes:
-        path_regex, path_format, param_converters = compile_path(r.path)
+class RouteMatcher:
+    """Matches request paths against precompiled API route patterns.
+
+    Routes are compiled once and bucketed by their number of path segments, so a
+    lookup only tests the handful of routes that could possibly match.
+    """
+
+    def __init__(self):
+        self._buckets: dict[int, list[tuple]] = {}
+        self._variable_length: list[tuple] = []
+
+    def build(self, routes: list) -> None:
+        """Compiles the given routes, replacing any previously compiled ones."""
+        buckets: dict[int, list[tuple]] = {}
+        variable_length = []
+        for r in routes:
+            path_regex, _, _ = compile_path(r.path)
+            entry = (path_regex, r.path)
+            if ":path}" in r.path:
+                variable_length.append(entry)
+            else:
+                buckets.setdefault(r.path.count("/"), []).append(entry)
+        self._buckets = buckets
+        self._variable_length = variable_length
+
+    def match(self, path: str) -> tuple[str | None, dict]:
+        """Returns the matching route template and its path params."""
+        candidates = self._buckets.get(path.count("/"), [])
+        for path_regex, template in (*candidates, *self._variable_length):
+            match = path_regex.match(path)
+            if match:
+                return template, match.groupdict()
+        return None, {}
+
+
+route_matcher = RouteMatcher()
+
+
+def match_route(request: Request) -> tuple[str | None, dict]:
+    """Matches the request against the API routes, memoized on the request state."""
+    if not hasattr(request.state, "route_match"):
         path = request["path"].removeprefix("/api/v1")  # remove the /api/v1 for matching
-        match = path_regex.match(path)
-        if match:
-            path_params = match.groupdict()
+        request.state.route_match = route_matcher.match(path)
+    return request.state.route_match
+
+
+def get_path_params_from_request(request: Request) -> dict:
+    _, path_params = match_route(request)
     return path_params
 
 
 def get_path_template(request: Request) -> str:
+    route_template, _ = match_route(request)
+    if route_template:
+        return route_template
     if hasattr(request, "path"):
         return ",".join(request.path.split("/")[1:])
     return ".".join(request.url.path.split("/")[1:])
@@ -127,21 +168,14 @@ async def db_session_middleware(request: Request, call_next):
         schema = f"dispatch_organization_{organization_slug}"
 
         # validate slug exists
-        schema_names = inspect(engine).get_schema_names()
-        if schema not in schema_names:
+        if not schema_registry.exists(schema):
             return JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={"detail": [{"msg": f"Unknown database schema name: {schema}"}]},
             )
 
-        # add correct schema mapping depending on the request
-        schema_engine = engine.execution_options(
-            schema_translate_map={
-                None: schema,
-            }
-        )
-
-        session = scoped_session(sessionmaker(bind=schema_engine), scopefunc=get_request_id)
+        # reuse the session registry bound to the schema translated engine
+        session = schema_registry.get_scoped_session(schema, scopefunc=get_request_id)
         request.state.db = session()
 
         # we track the session
@@ -189,6 +223,15 @@ async def db_session_middleware(request: Request, call_next):
         _request_id_ctx_var.reset(ctx_token)
 
 
+@app.on_event("startup")
+def load_schema_registry():
+    """Warms the tenant schema registry so the first requests don't hit the catalog."""
+    try:
+        schema_registry.refresh()
+    except Exception as e:
+        log.warning(f"Unable to load the database schema registry on startup: {e}")
+
+
 @app.middleware("http")
 async def add_security_headers(request: Request, call_next):
     response = await call_next(request)
@@ -210,7 +253,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             tags.update({"status_code": response.status_code})
             metric_provider.counter("server.call.counter", tags=tags)
             metric_provider.timer("server.call.elapsed", value=elapsed_time, tags=tags)
-            log.debug(f"server.call.elapsed.{path_template}: {elapsed_time}")
+            log.debug("server.call.elapsed.%s: %s", path_template, elapsed_time)
         except Exception as e:
             metric_provider.counter("server.call.exception.counter", tags=tags)
             raise e from None
@@ -258,6 +301,9 @@ install_plugins()
 # we add all the plugin event API routes to the API router
 install_plugin_events(api_router)
 
+# we compile the API routes once for organization and metrics path matching
+route_matcher.build(api_router.routes)
+
 # we add all API routes to the Web API framework
 api.include_router(api_router)
 
@@ -1,46 +1,161 @@
+import atexit
 import logging
+import os
+import threading
+from collections import deque
 
 from dispatch.plugins.base import plugins
 
-from .config import METRIC_PROVIDERS
+from .config import METRIC_BUFFER_SIZE, METRIC_FLUSH_INTERVAL, METRIC_PROVIDERS
 
 log = logging.getLogger(__file__)
 
+COUNTER = "counter"
+GAUGE = "gauge"
+TIMER = "timer"
+
+
+def _tag_key(tags: dict | None) -> tuple:
+    """Returns a hashable key for a tag set."""
+    if not tags:
+        return ()
+    return tuple(sorted((str(k), str(v)) for k, v in tags.items()))
+
 
 class Metrics(object):
+    """Sends metrics to the configured metric provider plugins.
+
+    Recording a metric only appends it to a bounded in-memory buffer (`deque.append` is
+    thread safe and doesn't take a lock). A background thread drains the buffer every
+    `METRIC_FLUSH_INTERVAL` seconds, aggregates it per metric and tag set (counters are
+    summed, the last gauge value wins and timers are kept as a histogram of their
+    values) and sends the aggregates to the providers. When the buffer is full the
+    oldest samples are dropped.
+    """
+
     _providers = []
 
-    def __init__(self):
-        if not METRIC_PROVIDERS:
+    def __init__(self, providers=None, flush_interval=None, buffer_size=None):
+        if providers is None:
+            providers = METRIC_PROVIDERS
+
+        if not providers:
             log.info(
                 "No metric providers defined via METRIC_PROVIDERS env var. Metrics will not be sent."
             )
         else:
-            self._providers = METRIC_PROVIDERS
+            self._providers = list(providers)
+
+        self.flush_interval = flush_interval or METRIC_FLUSH_INTERVAL
+        self.buffer_size = buffer_size or METRIC_BUFFER_SIZE
+        self._buffer = deque(maxlen=self.buffer_size)
+        self._dropped = 0
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._stopped = threading.Event()
+
+        if self._providers:
+            atexit.register(self.flush)
+            # threads don't survive a fork, the child starts its own flusher
+            os.register_at_fork(after_in_child=self._reset_after_fork)
 
     def gauge(self, name, value, tags=None):
-        for provider in self._providers:
-            log.debug(
-                f"Sending gauge metric {name} to provider {provider}. Value: {value} Tags: {tags}"
-            )
-            p = plugins.get(provider)
-            p.gauge(name, value, tags=tags)
+        self._record(GAUGE, name, value, tags)
 
     def counter(self, name, value=None, tags=None):
-        for provider in self._providers:
-            log.debug(
-                f"Sending counter metric {name} to provider {provider}. Value: {value} Tags: {tags}"
-            )
-            p = plugins.get(provider)
-            p.counter(name, value=value, tags=tags)
+        self._record(COUNTER, name, value, tags)
 
     def timer(self, name, value, tags=None):
-        for provider in self._providers:
-            log.debug(
-                f"Sending timer metric {name} to provider {provider}. Value: {value} Tags: {tags}"
+        self._record(TIMER, name, value, tags)
+
+    def _record(self, kind, name, value, tags):
+        if not self._providers:
+            return
+
+        if self._thread is None:
+            self._start()
+
+        buffer = self._buffer
+        if len(buffer) == self.buffer_size:
+            self._dropped += 1
+        buffer.append((kind, name, value, dict(tags) if tags else None))
+
+    def _start(self):
+        with self._flush_lock:
+            if self._thread is not None:
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="dispatch-metrics-flusher", daemon=True
             )
-            p = plugins.get(provider)
-            p.timer(name, value, tags=tags)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def _reset_after_fork(self):
+        self._buffer = deque(maxlen=self.buffer_size)
+        self._dropped = 0
+        self._flush_lock = threading.Lock()
+        self._thread = None
+
+    def stop(self):
+        """Stops the background flusher, sending the buffered metrics."""
+        self._stopped.set()
+        self.flush()
+
+    def aggregate(self) -> dict:
+        """Drains the buffer, aggregating the samples per metric and tag set."""
+        aggregates = {}
+        buffer = self._buffer
+        while True:
+            try:
+                kind, name, value, tags = buffer.popleft()
+            except IndexError:
+                break
+
+            key = (kind, name, _tag_key(tags))
+            if kind == COUNTER:
+                total = aggregates.get(key, (0, tags))[0]
+                aggregates[key] = (total + (1 if value is None else value), tags)
+            elif kind == GAUGE:
+                aggregates[key] = (value, tags)
+            else:
+                aggregates.setdefault(key, ([], tags))[0].append(value)
+        return aggregates
+
+    def flush(self):
+        """Sends the buffered metrics to the providers."""
+        with self._flush_lock:
+            aggregates = self.aggregate()
+            dropped, self._dropped = self._dropped, 0
+
+        if dropped:
+            log.warning("Dropped %s metric samples, the metrics buffer was full.", dropped)
+
+        if not aggregates:
+            return
+
+        for provider in self._providers:
+            try:
+                p = plugins.get(provider)
+            except KeyError:
+                continue
+
+            for (kind, name, _), (value, tags) in aggregates.items():
+                try:
+                    if kind == COUNTER:
+                        p.counter(name, value=value, tags=tags)
+                    elif kind == GAUGE:
+                        p.gauge(name, value, tags=tags)
+                    elif hasattr(p, "histogram"):
+                        p.histogram(name, value, tags=tags)
+                    else:
+                        for v in value:
+                            p.timer(name, v, tags=tags)
+                except Exception as e:
+                    log.warning("Unable to send metric %s to provider %s: %s", name, provider, e)
 
 
 provider = Metrics()
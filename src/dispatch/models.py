@@ -129,7 +129,9 @@ class Pagination(DispatchBase):
     """Pydantic model for paginated results."""
     itemsPerPage: int
     page: int
-    total: int
+    # not computed when using cursor pagination with `count=none`
+    total: int | None
+    nextCursor: str | None = None
 
 
 class PrimaryKeyModel(BaseModel):
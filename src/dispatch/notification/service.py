@@ -139,14 +139,13 @@ def filter_and_send(
     """Sends notifications."""
     notifications = get_all_enabled(db_session=db_session, project_id=project_id)
     for notification in notifications:
+        matches = search_filter_service.match_all(
+            db_session=db_session,
+            search_filters=notification.filters,
+            class_instances=[class_instance],
+        )
         for search_filter in notification.filters:
-            match = search_filter_service.match(
-                db_session=db_session,
-                subject=search_filter.subject,
-                filter_spec=search_filter.expression,
-                class_instance=class_instance,
-            )
-            if match:
+            if class_instance.id in matches[search_filter.id]:
                 send(
                     db_session=db_session,
                     project_id=project_id,
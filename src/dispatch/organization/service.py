@@ -4,6 +4,7 @@ from sqlalchemy.sql.expression import true
 from dispatch.auth.models import DispatchUser, DispatchUserOrganization
 from dispatch.database.core import engine
 from dispatch.database.manage import init_schema
+from dispatch.database.registry import schema_registry
 from dispatch.enums import UserRoles
 
 from .models import Organization, OrganizationCreate, OrganizationRead, OrganizationUpdate
@@ -109,6 +110,7 @@ def create(*, db_session, organization_in: OrganizationCreate) -> Organization:
 
     # we let the new schema session create the organization
     organization = init_schema(engine=engine, organization=organization)
+    schema_registry.invalidate()
     return organization
 
 
@@ -150,6 +152,7 @@ def delete(*, db_session, organization_id: int):
     organization = db_session.query(Organization).filter(Organization.id == organization_id).first()
     db_session.delete(organization)
     db_session.commit()
+    schema_registry.invalidate()
 
 
 def add_user(
@@ -0,0 +1,189 @@
+"""
+.. module: dispatch.participant_activity.buffer
+    :platform: Unix
+    :copyright: (c) 2019 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from datetime import timedelta
+
+from sqlalchemy import bindparam, func, update
+
+from dispatch.config import (
+    PARTICIPANT_ACTIVITY_FLUSH_INTERVAL,
+    PARTICIPANT_ACTIVITY_FLUSH_THRESHOLD,
+)
+from dispatch.database.core import SessionLocal, get_organization_session
+from dispatch.participant_role.models import ParticipantRole
+
+from . import service as participant_activity_service
+from .models import ParticipantActivityCreate
+
+log = logging.getLogger(__name__)
+
+
+class ParticipantRoleActivityBuffer:
+    """Write-behind buffer of participant role activity counters.
+
+    Increments are coalesced per organization and participant role in memory and
+    written with one batched `UPDATE` per organization, every `flush_interval` seconds
+    or as soon as `flush_threshold` increments are pending, whichever comes first.
+    Updates are relative (`activity = activity + n`), so concurrent processes don't
+    overwrite each other's counts.
+
+    Callers that act on a counter's value (e.g. promoting observers after three
+    messages) should update it directly instead of buffering it.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = PARTICIPANT_ACTIVITY_FLUSH_INTERVAL,
+        flush_threshold: int = PARTICIPANT_ACTIVITY_FLUSH_THRESHOLD,
+    ):
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        # (organization, participant role id) -> pending increment
+        self._pending = {}
+        self._count = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._stopped = threading.Event()
+
+        atexit.register(self.flush)
+        # threads don't survive a fork, the child starts its own flusher
+        os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def increment(self, organization: str, participant_role_id: int, count: int = 1) -> None:
+        """Adds to the activity counter of a participant role."""
+        key = (organization, participant_role_id)
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0) + count
+            self._count += count
+            should_flush = self._count >= self.flush_threshold
+
+        if self._thread is None:
+            self._start()
+
+        if should_flush:
+            self.flush()
+
+    def pending(self, organization: str, participant_role_id: int) -> int:
+        """Returns the increment not yet written for a participant role."""
+        with self._lock:
+            return self._pending.get((organization, participant_role_id), 0)
+
+    def _start(self):
+        with self._flush_lock:
+            if self._thread is not None:
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="dispatch-participant-activity-flusher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def _reset_after_fork(self):
+        self._pending = {}
+        self._count = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+
+    def stop(self):
+        """Stops the background flusher, writing the pending increments."""
+        self._stopped.set()
+        self.flush()
+
+    def drain(self) -> dict[str, dict[int, int]]:
+        """Takes the pending increments, grouped by organization."""
+        with self._lock:
+            pending, self._pending, self._count = self._pending, {}, 0
+
+        increments = {}
+        for (organization, participant_role_id), count in pending.items():
+            increments.setdefault(organization, {})[participant_role_id] = count
+        return increments
+
+    def flush(self):
+        """Writes the pending increments."""
+        with self._flush_lock:
+            for organization, increments in self.drain().items():
+                try:
+                    with get_organization_session(organization) as db_session:
+                        self.write(db_session, increments)
+                except Exception as e:
+                    log.warning(
+                        f"Unable to write participant role activity for {organization}: {e}"
+                    )
+                    # keep the increments for the next flush
+                    with self._lock:
+                        for participant_role_id, count in increments.items():
+                            key = (organization, participant_role_id)
+                            self._pending[key] = self._pending.get(key, 0) + count
+                            self._count += count
+
+    @staticmethod
+    def write(db_session: SessionLocal, increments: dict[int, int]) -> None:
+        """Adds increments to participant role activity counters with a single batched update."""
+        if not increments:
+            return
+
+        table = ParticipantRole.__table__
+        db_session.execute(
+            update(table)
+            .where(table.c.id == bindparam("participant_role_id"))
+            .values(activity=func.coalesce(table.c.activity, 0) + bindparam("increment")),
+            [
+                {"participant_role_id": participant_role_id, "increment": count}
+                for participant_role_id, count in sorted(increments.items())
+            ],
+        )
+
+
+class ParticipantActivityBuffer:
+    """Coalesces the activities of participants before recording them.
+
+    Activities of a participant for the same plugin event that overlap are merged into
+    a single span, so recording them takes one `create_or_update` per span instead of
+    one per activity, with the same resulting activities and response time.
+    """
+
+    def __init__(self):
+        # (participant id, plugin event id) -> [activity]
+        self._spans = {}
+
+    def add(self, activity_in: ParticipantActivityCreate) -> None:
+        key = (activity_in.participant.id, activity_in.plugin_event.id)
+        spans = self._spans.setdefault(key, [])
+
+        if spans and activity_in.started_at < spans[-1].ended_at:
+            spans[-1] = spans[-1].model_copy(update={"ended_at": activity_in.ended_at})
+            return
+        spans.append(activity_in)
+
+    def flush(self, db_session: SessionLocal) -> timedelta:
+        """Records the buffered activities.
+
+        Returns the change of the participants' total response time.
+        """
+        spans, self._spans = self._spans, {}
+
+        delta = timedelta(seconds=0)
+        for key in spans:
+            for activity_in in spans[key]:
+                delta += participant_activity_service.create_or_update(
+                    db_session=db_session, activity_in=activity_in
+                )
+        return delta
+
+
+participant_role_activity_buffer = ParticipantRoleActivityBuffer()
@@ -0,0 +1,58 @@
+"""
+.. module: dispatch.plugin.cache
+    :platform: Unix
+    :copyright: (c) 2019 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+
+import hashlib
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from cachetools import LRUCache
+
+
+class PluginConfigurationCache:
+    """Caches parsed plugin instance configurations.
+
+    Entries are keyed by plugin instance id, plugin slug and a hash of the stored
+    configuration, so an edited configuration is parsed again even if the entry of
+    its previous version hasn't been invalidated yet (e.g. in another process).
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._cache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def version(configuration: str) -> str:
+        """Returns the version of a stored configuration."""
+        return hashlib.sha256(configuration.encode("utf-8")).hexdigest()
+
+    def get(
+        self, plugin_instance_id: int, slug: str, configuration: str, parse: Callable[[str], Any]
+    ) -> Any:
+        """Returns the parsed configuration, parsing it if it isn't cached yet."""
+        key = (plugin_instance_id, slug, self.version(configuration))
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+
+        parsed = parse(configuration)
+        with self._lock:
+            self._cache[key] = parsed
+        return parsed
+
+    def invalidate(self, plugin_instance_id: int) -> None:
+        """Drops all cached configurations of a plugin instance."""
+        with self._lock:
+            for key in [k for k in self._cache if k[0] == plugin_instance_id]:
+                del self._cache[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+plugin_configuration_cache = PluginConfigurationCache()
@@ -18,6 +18,8 @@ from dispatch.plugins.base import plugins
 from dispatch.project.models import ProjectRead
 from typing import Any
 
+from .cache import plugin_configuration_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -102,7 +104,8 @@ class PluginInstance(Base, ProjectMixin):
     def instance(self):
         """Fetches a plugin instance that matches this record."""
         try:
-            plugin = plugins.get(self.plugin.slug)
+            # plugins are singletons, bind a new object instead of mutating the shared one
+            plugin = plugins.get(self.plugin.slug).__class__()
             plugin.configuration = self.configuration
             plugin.project_id = self.project_id
             return plugin
@@ -138,7 +141,14 @@ class PluginInstance(Base, ProjectMixin):
         try:
             if self._configuration:
                 plugin = plugins.get(self.plugin.slug)
-                return plugin.configuration_schema.parse_raw(self._configuration)
+                if self.id is None:
+                    return plugin.configuration_schema.parse_raw(self._configuration)
+                return plugin_configuration_cache.get(
+                    self.id,
+                    self.plugin.slug,
+                    self._configuration,
+                    plugin.configuration_schema.parse_raw,
+                )
         except Exception as e:
             logger.warning(
                 f"Error trying to load plugin {self.plugin.title} {self.plugin.description} with error {e}"
@@ -7,6 +7,7 @@ from dispatch.plugins.bases import OncallPlugin
 from dispatch.project import service as project_service
 from dispatch.service import service as service_service
 
+from .cache import plugin_configuration_cache
 from .models import (
     Plugin,
     PluginInstance,
@@ -166,6 +167,7 @@ def update_instance(
     plugin_instance.configuration = plugin_instance_in.configuration
 
     db_session.commit()
+    plugin_configuration_cache.invalidate(plugin_instance.id)
     return plugin_instance
 
 
@@ -173,6 +175,7 @@ def delete_instance(*, db_session: Session, plugin_instance_id: int):
     """Deletes a plugin instance."""
     db_session.query(PluginInstance).filter(PluginInstance.id == plugin_instance_id).delete()
     db_session.commit()
+    plugin_configuration_cache.invalidate(plugin_instance_id)
 
 
 def get_plugin_event_by_id(*, db_session: Session, plugin_event_id: int) -> PluginEvent | None:
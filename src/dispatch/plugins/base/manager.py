@@ -15,31 +15,56 @@ logger = logging.getLogger(__name__)
 
 # inspired by https://github.com/getsentry/sentry
 class PluginManager(InstanceManager):
+    def __init__(self, class_list=None, instances=True):
+        # (source instances, sorted plugins, slug -> plugin, type -> sorted plugins)
+        self._index = (None, [], {}, {})
+        super(PluginManager, self).__init__(class_list, instances)
+
     def __iter__(self):
         return iter(self.all())
 
     def __len__(self):
         return sum(1 for i in self.all())
 
+    def _get_index(self):
+        """Returns the plugin indexes, rebuilding them when the instance cache was wiped."""
+        index = self._index
+        if self.cache is not None and index[0] is self.cache:
+            return index
+
+        instances = super(PluginManager, self).all()
+        ordered = sorted(instances, key=lambda x: x.get_title())
+
+        # version 1 plugins take precedence over version 2 plugins with the same slug
+        by_slug = {}
+        for version in (1, 2):
+            for plugin in ordered:
+                if plugin.__version__ == version:
+                    by_slug.setdefault(plugin.slug, plugin)
+
+        by_type = {}
+        for plugin in ordered:
+            by_type.setdefault(getattr(plugin, "type", None), []).append(plugin)
+
+        index = (instances, ordered, by_slug, by_type)
+        self._index = index
+        return index
+
     def all(self, version=1, plugin_type=None):
-        for plugin in sorted(super(PluginManager, self).all(), key=lambda x: x.get_title()):
-            if not plugin.type == plugin_type and plugin_type:
-                continue
+        _, ordered, _, by_type = self._get_index()
+        if plugin_type:
+            ordered = by_type.get(plugin_type, [])
+        for plugin in ordered:
             if version is not None and plugin.__version__ != version:
                 continue
             yield plugin
 
     def get(self, slug):
-        for plugin in self.all(version=1):
-            if plugin.slug == slug:
-                return plugin
-        for plugin in self.all(version=2):
-            if plugin.slug == slug:
-                return plugin
-        logger.error(
-            f"Unable to find slug: {slug} in self.all version 1: {self.all(version=1)} or version 2: {self.all(version=2)}"
-        )
-        raise KeyError(slug)
+        plugin = self._get_index()[2].get(slug)
+        if plugin is None:
+            logger.error("Unable to find plugin with slug: %s", slug)
+            raise KeyError(slug)
+        return plugin
 
     def first(self, func_name, *args, **kwargs):
         version = kwargs.pop("version", 1)
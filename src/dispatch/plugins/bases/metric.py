@@ -20,3 +20,12 @@ class MetricPlugin(Plugin):
 
     def timer(self, name, value, tags=None):
         raise NotImplementedError
+
+    def histogram(self, name, values, tags=None):
+        """Sends the timer values recorded for a tag set since the last flush.
+
+        Providers that support distributions should override this, by default each
+        value is sent as a timer.
+        """
+        for value in values:
+            self.timer(name, value, tags=tags)
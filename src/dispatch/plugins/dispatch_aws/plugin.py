@@ -13,9 +13,8 @@ import zlib
 from typing import TypedDict
 
 import boto3
-from psycopg2.errors import UniqueViolation
 from pydantic import ValidationError
-from sqlalchemy.exc import IntegrityError, ResourceClosedError
+from sqlalchemy.exc import ResourceClosedError
 from sqlalchemy.orm import Session
 
 from dispatch.metrics import provider as metrics_provider
@@ -23,7 +22,7 @@ from dispatch.plugins.bases import SignalConsumerPlugin
 from dispatch.plugins.dispatch_aws.config import AWSSQSConfiguration
 from dispatch.project.models import Project
 from dispatch.signal import service as signal_service
-from dispatch.signal.models import SignalInstanceCreate
+from dispatch.signal.models import SignalInstanceBulkCreateStatus, SignalInstanceCreate
 
 from . import __version__
 
@@ -72,7 +71,7 @@ class AWSSQSSignalConsumerPlugin(SignalConsumerPlugin):
                 log.info("No messages received from SQS.")
                 continue
 
-            entries: list[SqsEntries] = []
+            messages: list[tuple[dict, SignalInstanceCreate]] = []
             for message in response["Messages"]:
                 try:
                     message_body = json.loads(message["Body"])
@@ -98,58 +97,57 @@ class AWSSQSSignalConsumerPlugin(SignalConsumerPlugin):
                     )
                     continue
 
-                # if the signal has an existing uuid we check if it already exists
-                if signal_instance_in.raw and signal_instance_in.raw.get("id"):
-                    if signal_service.get_signal_instance(
-                        db_session=db_session, signal_instance_id=signal_instance_in.raw["id"]
-                    ):
-                        log.info(
-                            f"Received a signal that already exists in the database. Skipping signal instance creation: {signal_instance_in.raw['id']}"
-                        )
-                        continue
+                messages.append((message, signal_instance_in))
 
-                try:
-                    with db_session.begin_nested():
-                        signal_instance = signal_service.create_signal_instance(
-                            db_session=db_session,
-                            signal_instance_in=signal_instance_in,
-                        )
-                except IntegrityError as e:
-                    if isinstance(e.orig, UniqueViolation):
-                        log.info(
-                            f"Received a signal that already exists in the database. Skipping signal instance creation: {e}"
-                        )
-                    else:
-                        log.exception(
-                            f"Encountered an integrity error when trying to create a signal instance: {e}"
-                        )
-                    continue
-                except ResourceClosedError as e:
-                    log.warning(
-                        f"Encountered an error when trying to create a signal instance. The plugin will retry again as the message hasn't been deleted from the SQS queue. Signal name/variant: {signal_instance_in.raw['name'] if signal_instance_in.raw and signal_instance_in.raw['name'] else signal_instance_in.raw['variant']}. Error: {e}"
+            if not messages:
+                continue
+
+            try:
+                results = signal_service.create_instances_bulk(
+                    db_session=db_session,
+                    signal_instances_in=[signal_instance_in for _, signal_instance_in in messages],
+                )
+                db_session.commit()
+            except ResourceClosedError as e:
+                log.warning(
+                    f"Encountered an error when trying to create {len(messages)} signal instances. The plugin will retry again as the messages haven't been deleted from the SQS queue. Error: {e}"
+                )
+                db_session.rollback()
+                continue
+            except Exception as e:
+                log.exception(
+                    f"Encountered an error when trying to create {len(messages)} signal instances. Error: {e}"
+                )
+                db_session.rollback()
+                continue
+
+            entries: list[SqsEntries] = []
+            for (message, signal_instance_in), result in zip(messages, results, strict=True):
+                if result.status == SignalInstanceBulkCreateStatus.duplicate:
+                    log.info(
+                        f"Received a signal that already exists in the database. Skipping signal instance creation: {result.id}"
                     )
-                    db_session.rollback()
                     continue
-                except Exception as e:
-                    log.exception(
-                        f"Encountered an error when trying to create a signal instance. Signal name/variant: {signal_instance_in.raw['name'] if signal_instance_in.raw and signal_instance_in.raw['name'] else signal_instance_in.raw['variant']}. Error: {e}"
+
+                if result.status == SignalInstanceBulkCreateStatus.failed:
+                    log.warning(
+                        f"Encountered an error when trying to create a signal instance. Signal name/variant: {signal_instance_in.raw.get('name') or signal_instance_in.raw.get('variant')}. Error: {result.msg}"
                     )
-                    db_session.rollback()
                     continue
-                else:
-                    metrics_provider.counter(
-                        "aws-sqs-signal-consumer.signal.received",
-                        tags={
-                            "signalName": signal_instance.signal.name,
-                            "externalId": signal_instance.signal.external_id,
-                        },
-                    )
-                    log.debug(
-                        f"Received a signal with name {signal_instance.signal.name} and id {signal_instance.signal.id}"
-                    )
-                    entries.append(
-                        {"Id": message["MessageId"], "ReceiptHandle": message["ReceiptHandle"]}
-                    )
+
+                metrics_provider.counter(
+                    "aws-sqs-signal-consumer.signal.received",
+                    tags={
+                        "signalName": result.signal.name,
+                        "externalId": result.signal.external_id,
+                    },
+                )
+                log.debug(
+                    f"Received a signal with name {result.signal.name} and id {result.signal.id}"
+                )
+                entries.append(
+                    {"Id": message["MessageId"], "ReceiptHandle": message["ReceiptHandle"]}
+                )
 
             if entries:
                 client.delete_message_batch(QueueUrl=queue_url, Entries=entries)
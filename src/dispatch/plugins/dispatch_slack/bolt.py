@@ -29,6 +29,7 @@ from .middleware import (
     user_middleware,
     select_context_middleware,
 )
+from .service import update_user
 
 app = App(token="xoxb-valid", request_verification_enabled=False, token_verification_enabled=False)
 logging.basicConfig(level=logging.DEBUG)
@@ -156,3 +157,10 @@ def handle_message_events(
 ) -> None:
     """Container function for all message functions."""
     message_dispatcher.dispatch(**locals())
+
+
+@app.event("user_change")
+@app.event("team_join")
+def handle_user_change_events(client: WebClient, payload: dict) -> None:
+    """Keeps the directory of the workspace current."""
+    update_user(client, payload["user"])
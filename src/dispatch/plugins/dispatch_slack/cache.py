@@ -0,0 +1,116 @@
+"""
+.. module: dispatch.plugins.dispatch_slack.cache
+    :platform: Unix
+    :copyright: (c) 2019 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from cachetools import TTLCache
+
+from dispatch.config import (
+    SLACK_USER_CACHE_NEGATIVE_TTL,
+    SLACK_USER_CACHE_SIZE,
+    SLACK_USER_CACHE_TTL,
+)
+from dispatch.metrics import provider as metrics_provider
+
+# cache kinds
+USER_INFO_BY_ID = "user_info_by_id"
+USER_INFO_BY_EMAIL = "user_info_by_email"
+USER_PROFILE_BY_ID = "user_profile_by_id"
+USER_PROFILE_BY_EMAIL = "user_profile_by_email"
+USER_EXISTS = "user_exists"
+USER_IDENTITY = "user_identity"
+DISPATCH_USER_ID = "dispatch_user_id"
+
+# namespace of the entries that don't depend on the Slack workspace
+DISPATCH_NAMESPACE = "dispatch"
+
+
+class SlackUserCache:
+    """Bounded cache of Slack user lookups shared by all Slack handlers.
+
+    Entries are keyed by a namespace (the workspace or bot token a lookup was made
+    with), a kind (e.g. `user_info_by_id`) and the looked up value. Lookups that
+    found nothing (unknown users) are cached as well, for a shorter time, so they
+    aren't retried on every interaction.
+
+    Hits and misses are sent as the `slack.user_cache.hit` and `slack.user_cache.miss`
+    counters, tagged with the kind.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = SLACK_USER_CACHE_SIZE,
+        ttl: int = SLACK_USER_CACHE_TTL,
+        negative_ttl: int = SLACK_USER_CACHE_NEGATIVE_TTL,
+    ):
+        self._found = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._not_found = TTLCache(maxsize=maxsize, ttl=negative_ttl)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, namespace: str, kind: str, key: Any, load: Callable[[], Any]) -> Any:
+        """Returns a cached value, loading it on a miss.
+
+        `load` returns None when there's nothing to find, which is cached as a negative entry.
+        """
+        cache_key = (namespace, kind, key)
+        with self._lock:
+            if cache_key in self._found:
+                value, hit = self._found[cache_key], True
+            elif cache_key in self._not_found:
+                value, hit = None, True
+            else:
+                value, hit = None, False
+
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if hit:
+            metrics_provider.counter("slack.user_cache.hit", tags={"kind": kind})
+            return value
+
+        metrics_provider.counter("slack.user_cache.miss", tags={"kind": kind})
+        value = load()
+        self.set(namespace, kind, key, value)
+        return value
+
+    def set(self, namespace: str, kind: str, key: Any, value: Any) -> None:
+        """Caches a value, None being cached as a negative entry."""
+        cache_key = (namespace, kind, key)
+        with self._lock:
+            if value is None:
+                self._found.pop(cache_key, None)
+                self._not_found[cache_key] = True
+            else:
+                self._not_found.pop(cache_key, None)
+                self._found[cache_key] = value
+
+    def invalidate(self, namespace: str, kind: str, key: Any) -> None:
+        with self._lock:
+            self._found.pop((namespace, kind, key), None)
+            self._not_found.pop((namespace, kind, key), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._found.clear()
+            self._not_found.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+slack_user_cache = SlackUserCache()
@@ -18,7 +18,7 @@ from blockkit import (
     Section,
     UsersSelect,
 )
-from slack_bolt import Ack, BoltContext, Respond, BoltRequest
+from slack_bolt import Ack, App, BoltContext, Respond, BoltRequest
 from slack_sdk.errors import SlackApiError
 from slack_sdk.web.client import WebClient
 from sqlalchemy.exc import IntegrityError
@@ -29,7 +29,6 @@ from dispatch.case import flows as case_flows
 from dispatch.case import service as case_service
 from dispatch.case.enums import CaseResolutionReason, CaseStatus, CaseResolutionReasonDescription
 from dispatch.case.models import Case, CaseCreate, CaseRead, CaseUpdate
-from dispatch.case.priority import service as case_priority_service
 from dispatch.case.type import service as case_type_service
 from dispatch.config import DISPATCH_UI_URL
 from dispatch.conversation import flows as conversation_flows
@@ -43,6 +42,7 @@ from dispatch.individual.models import IndividualContactRead
 from dispatch.participant import flows as participant_flows
 from dispatch.participant import service as participant_service
 from dispatch.participant.models import ParticipantUpdate
+from dispatch.participant_activity.buffer import participant_role_activity_buffer
 from dispatch.participant_role import service as participant_role_service
 from dispatch.participant_role.models import ParticipantRoleType
 from dispatch.plugin import service as plugin_service
@@ -68,7 +68,7 @@ from dispatch.plugins.dispatch_slack.case.messages import (
     create_signal_engagement_message,
 )
 from dispatch.plugins.dispatch_slack.config import SlackConversationConfiguration
-from dispatch.plugins.dispatch_slack.decorators import message_dispatcher
+from dispatch.plugins.dispatch_slack.decorators import MessageContext, message_dispatcher
 from dispatch.plugins.dispatch_slack.enums import SlackAPIErrorCode
 from dispatch.plugins.dispatch_slack.fields import (
     DefaultActionIds,
@@ -129,7 +129,7 @@ from dispatch.ticket import flows as ticket_flows
 log = logging.getLogger(__name__)
 
 
-def configure(config: SlackConversationConfiguration):
+def configure(config: SlackConversationConfiguration, app: App = app):
     """Maps commands/events to their functions."""
     case_command_context_middleware = partial(
         command_context_middleware,
@@ -431,9 +431,9 @@ def engage(
         log.error("Case assignee not found")
         return
 
-    user_email = client.users_info(user=form_data[DefaultBlockIds.case_assignee_select]["value"])[
-        "user"
-    ]["profile"]["email"]
+    user_email = dispatch_slack_service.get_user_email(
+        client, form_data[DefaultBlockIds.case_assignee_select]["value"]
+    )
 
     if not user_email:
         log.error("Email for case assignee not found")
@@ -1246,60 +1246,76 @@ def handle_new_participant_message(
     participant.user_conversation_id = context["user_id"]
 
     for participant_role in participant.active_roles:
+        # observer activity is written right away, so promotions happen on the third message
+        if participant_role.role != ParticipantRoleType.observer:
+            participant_role_activity_buffer.increment(
+                organization=context["subject"].organization_slug,
+                participant_role_id=participant_role.id,
+            )
+            continue
+
         participant_role.activity += 1
 
         # re-assign role once threshold is reached
-        if participant_role.role == ParticipantRoleType.observer:
-            if participant_role.activity >= 3:  # three messages sent to the case channel
-                # we change the participant's role to the participant one
-                participant_role_service.renounce_role(
-                    db_session=db_session, participant_role=participant_role
-                )
-                participant_role_service.add_role(
-                    db_session=db_session,
-                    participant_id=participant.id,
-                    participant_role=ParticipantRoleType.participant,
-                )
+        if participant_role.activity >= 3:  # three messages sent to the case channel
+            # we change the participant's role to the participant one
+            participant_role_service.renounce_role(
+                db_session=db_session, participant_role=participant_role
+            )
+            participant_role_service.add_role(
+                db_session=db_session,
+                participant_id=participant.id,
+                participant_role=ParticipantRoleType.participant,
+            )
 
-                # we log the event
-                event_service.log_case_event(
-                    db_session=db_session,
-                    source="Slack Plugin - Conversation Management",
-                    description=(
-                        f"{participant.individual.name}'s role changed from {participant_role.role} to "
-                        f"{ParticipantRoleType.participant} due to activity in the case channel"
-                    ),
-                    case_id=int(context["subject"].id),
-                    type=EventType.participant_updated,
-                )
+            # we log the event
+            event_service.log_case_event(
+                db_session=db_session,
+                source="Slack Plugin - Conversation Management",
+                description=(
+                    f"{participant.individual.name}'s role changed from {participant_role.role} to "
+                    f"{ParticipantRoleType.participant} due to activity in the case channel"
+                ),
+                case_id=int(context["subject"].id),
+                type=EventType.participant_updated,
+            )
 
-        db_session.commit()
+    db_session.commit()
 
 
 @message_dispatcher.add(
     subject=CaseSubjects.case, exclude={"subtype": ["channel_join", "channel_leave"]}
 )  # we ignore channel join and leave messages
 def handle_case_participant_role_activity(
-    ack: Ack, db_session: Session, context: BoltContext, user: DispatchUser
+    ack: Ack,
+    db_session: Session,
+    context: BoltContext,
+    user: DispatchUser,
+    message_context: MessageContext,
 ) -> None:
     ack()
 
-    participant = participant_service.get_by_case_id_and_email(
-        db_session=db_session, case_id=int(context["subject"].id), email=user.email
-    )
+    participant = message_context.participant
 
     if participant:
         for participant_role in participant.active_roles:
-            participant_role.activity += 1
+            if participant_role.role == ParticipantRoleType.observer:
+                participant_role.activity += 1
+            else:
+                participant_role_activity_buffer.increment(
+                    organization=context["subject"].organization_slug,
+                    participant_role_id=participant_role.id,
+                )
     else:
         # we have a new active participant lets add them
         participant = case_flows.case_add_or_reactivate_participant_flow(
             case_id=int(context["subject"].id), user_email=user.email, db_session=db_session
         )
         participant.user_conversation_id = context["user_id"]
+        message_context.participant = participant
 
     # if a participant is active mark the case as being in the triaged state
-    case = case_service.get(db_session=db_session, case_id=int(context["subject"].id))
+    case = message_context.case
 
     if case.status == CaseStatus.new:
         case_flows.case_status_transition_flow_dispatcher(
@@ -1329,6 +1345,7 @@ def handle_case_after_hours_message(
     respond: Respond,
     payload: dict,
     user: DispatchUser,
+    message_context: MessageContext,
 ) -> None:
     """Notifies the user that this case is currently in after hours mode."""
     ack()
@@ -1338,18 +1355,12 @@ def handle_case_after_hours_message(
     if "thread_ts" not in payload:
         return
 
-    case = case_service.get(db_session=db_session, case_id=int(context["subject"].id))
+    case = message_context.case
     owner_email = case.assignee.individual.email
-    participant = participant_service.get_by_case_id_and_email(
-        db_session=db_session, case_id=int(context["subject"].id), email=user.email
-    )
-
-    # get case priority settings and if delayed message warning is disabled, log and return
-    case_priority_data = case_priority_service.get(
-        db_session=db_session, case_priority_id=case.case_priority_id
-    )
+    participant = message_context.participant
 
-    if case_priority_data.disable_delayed_message_warning:
+    # if delayed message warning is disabled for the case priority, log and return
+    if case.case_priority.disable_delayed_message_warning:
         log.debug("delayed messaging is disabled, not sending a warning")
         return
 
@@ -1385,9 +1396,9 @@ def handle_thread_creation(
     ack: Ack,
     client: WebClient,
     payload: dict,
-    db_session: Session,
     context: BoltContext,
     request: BoltRequest,
+    message_context: MessageContext,
 ) -> None:
     """Sends the user an ephemeral message if they use threads in a dedicated case channel."""
     ack()
@@ -1395,7 +1406,7 @@ def handle_thread_creation(
     if not context["config"].ban_threads:
         return
 
-    case = case_service.get(db_session=db_session, case_id=context["subject"].id)
+    case = message_context.case
     if not case.dedicated_channel:
         return
 
@@ -1855,11 +1866,12 @@ def handle_user_mention(
     client: WebClient,
     db_session: Session,
     payload: dict,
+    message_context: MessageContext,
 ) -> None:
     """Handles user posted message events."""
     ack()
 
-    case = case_service.get(db_session=db_session, case_id=int(context["subject"].id))
+    case = message_context.case
     if not case or case.dedicated_channel:
         # we do not need to handle mentions for cases with dedicated channels
         return
@@ -2109,9 +2121,9 @@ def handle_edit_submission_event(
 
     assignee_email = None
     if form_data.get(DefaultBlockIds.case_assignee_select):
-        assignee_email = client.users_info(
-            user=form_data[DefaultBlockIds.case_assignee_select]["value"]
-        )["user"]["profile"]["email"]
+        assignee_email = dispatch_slack_service.get_user_email(
+            client, form_data[DefaultBlockIds.case_assignee_select]["value"]
+        )
 
     resolution_reason = None
     if form_data.get(DefaultBlockIds.case_resolution_reason_select):
@@ -2625,9 +2637,9 @@ def handle_report_submission_event(
     if not assignee_block_id:
         raise ValueError("Assignee block not found in form data")
 
-    assignee_email = client.users_info(user=form_data[assignee_block_id]["value"])["user"][
-        "profile"
-    ]["email"]
+    assignee_email = dispatch_slack_service.get_user_email(
+        client, form_data[assignee_block_id]["value"]
+    )
 
     case_in = CaseCreate(
         title=form_data[DefaultBlockIds.title_input],
@@ -0,0 +1,248 @@
+"""
+.. module: dispatch.plugins.dispatch_slack.client
+    :platform: Unix
+    :copyright: (c) 2019 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any, NamedTuple
+from urllib.parse import urlencode
+
+import requests
+from cachetools import LRUCache
+from requests.adapters import HTTPAdapter
+from slack_sdk.web.client import WebClient
+
+from dispatch.config import SLACK_CLIENT_CACHE_SIZE, SLACK_CLIENT_POOL_SIZE
+
+from .enums import SlackAPIGetEndpoints, SlackAPIPostEndpoints
+
+log = logging.getLogger(__name__)
+
+
+class SlackMethodLimit(NamedTuple):
+    """The number of calls a method allows per minute, and how many can be made at once."""
+
+    per_minute: int
+    burst: int
+    per_channel: bool = False
+
+
+# https://api.slack.com/apis/rate-limits
+TIER_1 = SlackMethodLimit(per_minute=1, burst=1)
+TIER_2 = SlackMethodLimit(per_minute=20, burst=20)
+TIER_3 = SlackMethodLimit(per_minute=50, burst=50)
+TIER_4 = SlackMethodLimit(per_minute=100, burst=100)
+# messages are limited to about one per second per channel, with short bursts
+POST_MESSAGE = SlackMethodLimit(per_minute=60, burst=20, per_channel=True)
+
+_METHOD_LIMITS = {
+    SlackAPIGetEndpoints.chat_permalink: TIER_4,
+    SlackAPIGetEndpoints.conversations_history: TIER_3,
+    SlackAPIGetEndpoints.conversations_info: TIER_3,
+    SlackAPIGetEndpoints.conversations_members: TIER_4,
+    SlackAPIGetEndpoints.conversations_replies: TIER_3,
+    SlackAPIGetEndpoints.team_info: TIER_3,
+    SlackAPIGetEndpoints.users_conversations: TIER_3,
+    SlackAPIGetEndpoints.users_info: TIER_4,
+    SlackAPIGetEndpoints.users_lookup_by_email: TIER_3,
+    SlackAPIGetEndpoints.users_profile_get: TIER_4,
+    SlackAPIPostEndpoints.bookmarks_add: TIER_2,
+    SlackAPIPostEndpoints.canvas_access_set: TIER_3,
+    SlackAPIPostEndpoints.canvas_create: TIER_2,
+    SlackAPIPostEndpoints.canvas_delete: TIER_3,
+    SlackAPIPostEndpoints.canvas_update: TIER_3,
+    SlackAPIPostEndpoints.chat_post_ephemeral: TIER_4,
+    SlackAPIPostEndpoints.chat_post_message: POST_MESSAGE,
+    SlackAPIPostEndpoints.chat_update: TIER_3,
+    SlackAPIPostEndpoints.conversations_archive: TIER_2,
+    SlackAPIPostEndpoints.conversations_create: TIER_2,
+    SlackAPIPostEndpoints.conversations_invite: TIER_3,
+    SlackAPIPostEndpoints.conversations_kick: TIER_3,
+    SlackAPIPostEndpoints.conversations_rename: TIER_2,
+    SlackAPIPostEndpoints.conversations_set_purpose: TIER_2,
+    SlackAPIPostEndpoints.conversations_set_topic: TIER_2,
+    SlackAPIPostEndpoints.conversations_unarchive: TIER_2,
+    SlackAPIPostEndpoints.pins_add: TIER_2,
+    "users.list": TIER_2,
+}
+# keyed by method name, enum members don't hash like their value
+SLACK_METHOD_LIMITS = {str(method): limit for method, limit in _METHOD_LIMITS.items()}
+DEFAULT_METHOD_LIMIT = TIER_3
+
+
+class SlackRateLimiter:
+    """Token buckets of the Slack API methods, shared by all the clients of a process.
+
+    Slack limits calls per app and workspace (bot token) and method, and messages per
+    channel. A call waits until its bucket has a token. When Slack answers `429 Too Many
+    Requests` anyway (e.g. calls made by other processes), the bucket is emptied until
+    the `Retry-After` delay has passed, so the other callers of that method wait too.
+    """
+
+    def __init__(self, limits: dict[str, SlackMethodLimit] = SLACK_METHOD_LIMITS):
+        self.limits = limits
+        self._lock = threading.Lock()
+        # (token, method, channel) -> (tokens, updated at)
+        self._buckets = {}
+
+    def _key(self, token: str, method: str, channel: str | None) -> tuple:
+        limit = self.limits.get(method, DEFAULT_METHOD_LIMIT)
+        return (token, method, channel if limit.per_channel else None), limit
+
+    def acquire(self, token: str, method: str, channel: str | None = None) -> float:
+        """Takes a token from the method's bucket, waiting for one if needed.
+
+        Returns the number of seconds waited.
+        """
+        key, limit = self._key(token, method, channel)
+        rate = limit.per_minute / 60
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, updated_at = self._buckets.get(key, (limit.burst, now))
+                tokens = min(limit.burst, tokens + (now - updated_at) * rate)
+                if tokens >= 1:
+                    self._buckets[key] = (tokens - 1, now)
+                    return waited
+                self._buckets[key] = (tokens, now)
+                wait = (1 - tokens) / rate
+
+            time.sleep(wait)
+            waited += wait
+
+    def block(self, token: str, method: str, channel: str | None, seconds: float) -> None:
+        """Empties the method's bucket so that it only has a token after `seconds`."""
+        key, limit = self._key(token, method, channel)
+        rate = limit.per_minute / 60
+        with self._lock:
+            self._buckets[key] = (-seconds * rate + 1, time.monotonic())
+
+
+class PooledWebClient(WebClient):
+    """A Slack Web API client that reuses its HTTP connections.
+
+    `WebClient` opens a new connection (and TLS session) for each call. This client sends
+    its calls through a shared `requests.Session` that keeps connections to Slack alive
+    between calls. Each call first takes a token from the method's rate limit, and calls
+    answered with `429 Too Many Requests` are retried after their `Retry-After` delay.
+    """
+
+    def __init__(
+        self,
+        *args,
+        session: requests.Session,
+        rate_limiter: SlackRateLimiter | None = None,
+        max_rate_limited_retries: int = 3,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self.max_rate_limited_retries = max_rate_limited_retries
+
+    def _perform_urllib_http_request(self, *, url: str, args: dict[str, dict[str, Any]]) -> dict:
+        # file uploads and custom SSL contexts keep the default transport
+        if args.get("files") or self.ssl is not None:
+            return super()._perform_urllib_http_request(url=url, args=args)
+
+        # like the default transport, query parameters are already part of the url and
+        # arguments are sent as JSON or as a form
+        headers = dict(args["headers"])
+        arguments = args.get("json") or args.get("data") or args.get("params") or {}
+        data = None
+        if args.get("json"):
+            data = json.dumps(args["json"])
+            headers["Content-Type"] = "application/json;charset=utf-8"
+        elif arguments:
+            data = urlencode(arguments)
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        method = url.split("?", 1)[0].rsplit("/", 1)[-1]
+        channel = arguments.get("channel")
+        proxies = {"http": self.proxy, "https": self.proxy} if self.proxy else None
+
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(self.token, method, channel)
+            try:
+                response = self.session.post(
+                    url,
+                    data=data,
+                    headers=headers,
+                    timeout=self.timeout,
+                    proxies=proxies,
+                )
+            except requests.ConnectionError:
+                # like slack_sdk's default handler, retry once on connection errors
+                # (e.g. a kept alive connection that Slack closed)
+                if attempt:
+                    raise
+                attempt += 1
+                continue
+
+            if response.status_code == 429 and attempt < self.max_rate_limited_retries:
+                retry_after = int(response.headers.get("Retry-After", 1))
+                log.warning(f"Slack rate limited {method}, retrying in {retry_after} seconds.")
+                if self.rate_limiter:
+                    self.rate_limiter.block(self.token, method, channel, retry_after)
+                else:
+                    time.sleep(retry_after)
+                attempt += 1
+                continue
+
+            return {
+                "status": response.status_code,
+                "headers": response.headers,
+                "body": response.text,
+            }
+
+
+def create_session(pool_size: int = SLACK_CLIENT_POOL_SIZE) -> requests.Session:
+    """Creates a session keeping up to `pool_size` connections alive per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class SlackClientRegistry:
+    """Keeps a long lived Slack client per bot token.
+
+    All clients share a connection pool and the rate limits of the process.
+    """
+
+    def __init__(
+        self, maxsize: int = SLACK_CLIENT_CACHE_SIZE, pool_size: int = SLACK_CLIENT_POOL_SIZE
+    ):
+        self.pool_size = pool_size
+        self.session = create_session(pool_size)
+        self.rate_limiter = SlackRateLimiter()
+        self._clients = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> PooledWebClient:
+        """Returns the client of a bot token."""
+        with self._lock:
+            client = self._clients.get(token)
+            if client is None:
+                client = PooledWebClient(
+                    token=token, session=self.session, rate_limiter=self.rate_limiter
+                )
+                self._clients[token] = client
+            return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+
+slack_client_registry = SlackClientRegistry()
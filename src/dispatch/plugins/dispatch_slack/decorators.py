@@ -1,9 +1,81 @@
 import logging
 import inspect
+from functools import cached_property
+
+from slack_bolt import BoltContext
+from sqlalchemy.orm import Session
+
+from dispatch.auth.models import DispatchUser
+from dispatch.case import service as case_service
+from dispatch.case.models import Case
+from dispatch.incident import service as incident_service
+from dispatch.incident.models import Incident
+from dispatch.participant import service as participant_service
+from dispatch.participant.models import Participant
+from dispatch.plugin import service as plugin_service
+from dispatch.plugin.models import PluginInstance
+
+from .models import CaseSubjects
 
 log = logging.getLogger(__file__)
 
 
+class MessageContext:
+    """Entities shared by all the functions dispatched for a message.
+
+    Each entity is loaded the first time a function asks for it and reused by the
+    functions that run after it.
+    """
+
+    def __init__(self, db_session: Session, context: BoltContext, user: DispatchUser):
+        self.db_session = db_session
+        self.context = context
+        self.user = user
+        self._plugins = {}
+
+    @property
+    def subject(self):
+        return self.context["subject"]
+
+    @cached_property
+    def incident(self) -> Incident | None:
+        return incident_service.get(db_session=self.db_session, incident_id=int(self.subject.id))
+
+    @cached_property
+    def case(self) -> Case | None:
+        return case_service.get(db_session=self.db_session, case_id=int(self.subject.id))
+
+    @cached_property
+    def project_id(self) -> int | None:
+        if self.subject.project_id:
+            return int(self.subject.project_id)
+
+        instance = self.case if self.subject.type == CaseSubjects.case else self.incident
+        return instance.project_id if instance else None
+
+    @cached_property
+    def participant(self) -> Participant | None:
+        """The participant of the user who sent the message."""
+        if not self.user:
+            return None
+
+        if self.subject.type == CaseSubjects.case:
+            return participant_service.get_by_case_id_and_email(
+                db_session=self.db_session, case_id=int(self.subject.id), email=self.user.email
+            )
+        return participant_service.get_by_incident_id_and_email(
+            db_session=self.db_session, incident_id=int(self.subject.id), email=self.user.email
+        )
+
+    def active_plugins(self, plugin_type: str) -> list[PluginInstance]:
+        """The project's active plugin instances of a type."""
+        if plugin_type not in self._plugins:
+            self._plugins[plugin_type] = plugin_service.get_active_instances(
+                db_session=self.db_session, project_id=self.project_id, plugin_type=plugin_type
+            )
+        return self._plugins[plugin_type]
+
+
 class MessageDispatcher:
     """Dispatches current message to any registered function: https://github.com/slackapi/bolt-python/issues/786"""
 
@@ -22,6 +94,8 @@ class MessageDispatcher:
                 {
                     "name": name,
                     "func": func,
+                    # only inject the args the function cares about
+                    "args": tuple(inspect.getfullargspec(inspect.unwrap(func)).args),
                     "subject": kwargs.pop("subject"),
                     "exclude": kwargs.pop("exclude", []),
                 }
@@ -31,28 +105,32 @@ class MessageDispatcher:
 
     def dispatch(self, *args, **kwargs):
         """Runs all registered functions."""
-        for f in self.registered_funcs:
-            # only inject the args the function cares about
-            func_args = inspect.getfullargspec(inspect.unwrap(f["func"])).args
-            injected_args = (kwargs[a] for a in func_args)
+        subject_meta = kwargs.get("context", {}).get("subject")
+        subtype: str = kwargs.get("body", {}).get("event", {}).get("subtype", "")
 
+        if "message_context" not in kwargs:
+            kwargs["message_context"] = MessageContext(
+                db_session=kwargs.get("db_session"),
+                context=kwargs.get("context"),
+                user=kwargs.get("user"),
+            )
+
+        for f in self.registered_funcs:
             if subject := f["subject"]:
-                if subject_meta := kwargs.get("context", {}).get("subject"):
-                    if subject_meta:
-                        if subject != subject_meta.type:
-                            log.debug(
-                                f"Skipping dispatch function due to subject exclusion. ({f['name']})"
-                            )
-                            continue
+                if subject_meta:
+                    if subject != subject_meta.type:
+                        log.debug(
+                            f"Skipping dispatch function due to subject exclusion. ({f['name']})"
+                        )
+                        continue
 
             if exclude := f["exclude"]:
-                subtype: str = kwargs.get("body", {}).get("event", {}).get("subtype", "")
                 if subtype in exclude.get("subtype", []):
                     log.debug(f"Skipping dispatched function due to event exclusion. ({f['name']})")
                     continue
 
             try:
-                f["func"](*injected_args)
+                f["func"](*(kwargs[a] for a in f["args"]))
             except Exception as e:
                 log.exception(e)
                 log.debug(f"Failed to run dispatched function {f['name']}. Reason: ({e})")
@@ -0,0 +1,239 @@
+"""
+.. module: dispatch.plugins.dispatch_slack.directory
+    :platform: Unix
+    :copyright: (c) 2019 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+
+import logging
+import os
+import threading
+import time
+
+from slack_sdk.web.client import WebClient
+
+from dispatch.config import (
+    SLACK_DIRECTORY_ENABLED,
+    SLACK_DIRECTORY_MAX_AGE,
+    SLACK_DIRECTORY_REFRESH_INTERVAL,
+)
+
+log = logging.getLogger(__name__)
+
+# users.list returns at most 200 users per page
+PAGE_SIZE = 200
+# the most pages loaded for a workspace (a million users)
+MAX_PAGES = 5000
+
+
+def list_users(client: WebClient, max_pages: int = MAX_PAGES) -> list[dict]:
+    """Lists all the users of a workspace, one users.list page after the other.
+
+    Stops after `max_pages` pages, or when Slack returns a cursor it already returned.
+    """
+    users = []
+    cursor = None
+    cursors = set()
+    for _ in range(max_pages):
+        response = client.users_list(limit=PAGE_SIZE, cursor=cursor)
+        users.extend(response["members"])
+
+        cursor = response.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            return users
+        if cursor in cursors:
+            log.warning("Slack returned a users.list cursor twice, the directory is incomplete.")
+            return users
+        cursors.add(cursor)
+
+    log.warning(f"Stopped listing Slack users after {max_pages} pages.")
+    return users
+
+
+def get_email(user: dict) -> str | None:
+    """Returns the normalized email of a user."""
+    email = (user.get("profile") or {}).get("email")
+    return email.lower() if email else None
+
+
+class WorkspaceDirectory:
+    """The users of a Slack workspace, by id and email."""
+
+    def __init__(self, users: list[dict], loaded_at: float):
+        self.loaded_at = loaded_at
+        self.users_by_id = {}
+        self.ids_by_email = {}
+        for user in users:
+            self.add(user)
+
+    def add(self, user: dict) -> None:
+        """Adds or replaces a user."""
+        if previous := self.users_by_id.get(user["id"]):
+            email = get_email(previous)
+            if email and self.ids_by_email.get(email) == user["id"]:
+                del self.ids_by_email[email]
+
+        self.users_by_id[user["id"]] = user
+        # like users.lookupByEmail, deactivated users can't be found by email
+        if not user.get("deleted") and (email := get_email(user)):
+            self.ids_by_email[email] = user["id"]
+
+
+class SlackDirectory:
+    """In-memory directory of the users of the Slack workspaces a process talks to.
+
+    Workspaces are registered by their bot token the first time a user is looked up
+    with it. A background thread then loads each workspace with users.list, and
+    reloads it every `refresh_interval` seconds. In between, `user_change` events
+    keep it current.
+
+    Lookups return None when the directory can't answer them, because the workspace
+    isn't loaded yet, is older than `max_age` seconds, or doesn't have the user (e.g.
+    one who joined after the last load), and callers fall back to single lookups.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: int = SLACK_DIRECTORY_REFRESH_INTERVAL,
+        max_age: int = SLACK_DIRECTORY_MAX_AGE,
+        enabled: bool = SLACK_DIRECTORY_ENABLED,
+    ):
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        # token -> WorkspaceDirectory
+        self._workspaces = {}
+        # token -> client used to load the workspace
+        self._clients = {}
+        # token -> users changed while the workspace is loading
+        self._loading = {}
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+
+        # threads don't survive a fork, the child starts its own loader
+        os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def _workspace(self, token: str) -> WorkspaceDirectory | None:
+        workspace = self._workspaces.get(token)
+        if workspace and time.monotonic() - workspace.loaded_at <= self.max_age:
+            return workspace
+        return None
+
+    def get_by_id(self, client: WebClient, user_id: str) -> dict | None:
+        """Returns a user of the client's workspace by id."""
+        if not self.enabled:
+            return None
+
+        self.register(client)
+        with self._lock:
+            if workspace := self._workspace(client.token):
+                return workspace.users_by_id.get(user_id)
+        return None
+
+    def get_by_email(self, client: WebClient, email: str) -> dict | None:
+        """Returns a user of the client's workspace by email."""
+        if not self.enabled:
+            return None
+
+        self.register(client)
+        with self._lock:
+            if workspace := self._workspace(client.token):
+                if user_id := workspace.ids_by_email.get(email.lower()):
+                    return workspace.users_by_id[user_id]
+        return None
+
+    def update(self, token: str, user: dict) -> None:
+        """Updates a user of a workspace, e.g. on `user_change` or `team_join` events."""
+        with self._lock:
+            if token in self._loading:
+                self._loading[token].append(user)
+            if workspace := self._workspaces.get(token):
+                workspace.add(user)
+
+    def register(self, client: WebClient) -> None:
+        """Registers the workspace of a client, to be loaded and kept fresh."""
+        if client.token not in self._clients:
+            with self._lock:
+                registered = self._clients.setdefault(client.token, client) is client
+            if registered:
+                self._wakeup.set()
+
+        if self._thread is None:
+            self._start()
+
+    def load(self, client: WebClient) -> int:
+        """Loads the directory of a client's workspace, returning its number of users."""
+        started_at = time.monotonic()
+        with self._lock:
+            self._loading[client.token] = []
+
+        try:
+            users = list_users(client)
+        finally:
+            with self._lock:
+                changed = self._loading.pop(client.token)
+
+        workspace = WorkspaceDirectory(users, loaded_at=started_at)
+        # users changed while loading may be missing from the pages loaded before
+        for user in changed:
+            workspace.add(user)
+
+        with self._lock:
+            self._workspaces[client.token] = workspace
+        return len(workspace.users_by_id)
+
+    def refresh(self) -> None:
+        """Loads the registered workspaces that are due."""
+        now = time.monotonic()
+        with self._lock:
+            due = [
+                client
+                for token, client in self._clients.items()
+                if token not in self._workspaces
+                or now - self._workspaces[token].loaded_at >= self.refresh_interval
+            ]
+
+        for client in due:
+            try:
+                count = self.load(client)
+                log.debug(f"Loaded {count} users into the Slack directory.")
+            except Exception as e:
+                log.warning(f"Unable to load the Slack directory: {e}")
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="dispatch-slack-directory-loader", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.clear()
+            self.refresh()
+            self._wakeup.wait(self.refresh_interval)
+
+    def _reset_after_fork(self):
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._loading = {}
+        self._thread = None
+
+    def stop(self):
+        """Stops the background loader."""
+        self._stopped.set()
+        self._wakeup.set()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._workspaces.clear()
+            self._clients.clear()
+
+
+slack_directory = SlackDirectory()
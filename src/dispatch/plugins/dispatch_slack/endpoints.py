@@ -4,20 +4,11 @@ import json
 from fastapi import APIRouter, HTTPException, Depends
 from starlette.background import BackgroundTask
 from starlette.responses import JSONResponse
-from slack_sdk.signature import SignatureVerifier
-from sqlalchemy import true
-from starlette.requests import Request, Headers
+from starlette.requests import Request
 
-from dispatch.database.core import refetch_db_session
-from dispatch.plugin.models import Plugin, PluginInstance
-
-from .bolt import app
-from .case.interactive import configure as case_configure
 from .handler import SlackRequestHandler
-from .incident.interactive import configure as incident_configure
-from .feedback.interactive import configure as feedback_configure
-from .workflow import configure as workflow_configure
 from .messaging import get_incident_conversation_command_message
+from .registry import slack_app_registry
 
 router = APIRouter()
 
@@ -37,43 +28,16 @@ async def parse_request(request: Request):
     return request
 
 
-def is_current_configuration(
-    body: bytes, headers: Headers, plugin_instance: PluginInstance
-) -> bool:
-    """Uses the signing secret to determine which configuration to use."""
-
-    verifier = SignatureVerifier(
-        signing_secret=plugin_instance.configuration.signing_secret.get_secret_value()
-    )
-
-    return verifier.is_valid_request(body, headers)
-
-
 def get_request_handler(request: Request, body: bytes, organization: str) -> SlackRequestHandler:
-    """Creates a slack request handler for use by the api."""
-    session = refetch_db_session(organization)
-    plugin_instances: list[PluginInstance] = (
-        session.query(PluginInstance)
-        .join(Plugin)
-        .filter(PluginInstance.enabled == true(), Plugin.slug == "slack-conversation")
-        .all()
-    )
-    for p in plugin_instances:
-        if is_current_configuration(body=body, headers=request.headers, plugin_instance=p):
-            case_configure(p.configuration)
-            feedback_configure(p.configuration)
-            incident_configure(p.configuration)
-            workflow_configure(p.configuration)
-            app._configuration = p.configuration
-            app._token = p.configuration.api_bot_token.get_secret_value()
-            app._signing_secret = p.configuration.signing_secret.get_secret_value()
-            session.close()
-            return SlackRequestHandler(app)
-
-    session.close()
-    raise HTTPException(
-        status_code=HTTPStatus.FORBIDDEN.value, detail=[{"msg": "Invalid request signature"}]
+    """Returns the slack request handler of the configuration that signed the request."""
+    handler = slack_app_registry.find_handler(
+        organization=organization, body=body, headers=request.headers
     )
+    if not handler:
+        raise HTTPException(
+            status_code=HTTPStatus.FORBIDDEN.value, detail=[{"msg": "Invalid request signature"}]
+        )
+    return handler
 
 
 @router.post(
@@ -118,7 +82,7 @@ async def slack_commands(organization: str, request: Request, body: bytes = Depe
     request_body_form = await request.form()
     command = request_body_form._dict.get("command")
     message = get_incident_conversation_command_message(
-        config=app._configuration, command_string=command
+        config=handler.app._configuration, command_string=command
     )
     return JSONResponse(
         background=task,
@@ -11,7 +11,7 @@ from blockkit import (
     PlainTextInput,
     Section,
 )
-from slack_bolt import Ack, BoltContext, Respond
+from slack_bolt import Ack, App, BoltContext, Respond
 from slack_sdk.web.client import WebClient
 from sqlalchemy.orm import Session
 from datetime import datetime
@@ -58,7 +58,7 @@ from dispatch.messaging.strings import (
 log = logging.getLogger(__file__)
 
 
-def configure(config):
+def configure(config, app: App = app):
     """Placeholder configure function."""
     pass
 
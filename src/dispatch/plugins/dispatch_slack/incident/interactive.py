@@ -24,7 +24,7 @@ from blockkit import (
     UsersSelect,
 )
 from dispatch.ai.constants import TACTICAL_REPORT_SLACK_ACTION
-from slack_bolt import Ack, BoltContext, BoltRequest, Respond
+from slack_bolt import Ack, App, BoltContext, BoltRequest, Respond
 from slack_sdk.errors import SlackApiError
 from slack_sdk.web.client import WebClient
 from sqlalchemy.orm import Session
@@ -45,20 +45,20 @@ from dispatch.incident import flows as incident_flows
 from dispatch.incident import service as incident_service
 from dispatch.incident.enums import IncidentStatus
 from dispatch.incident.models import IncidentCreate, IncidentRead, IncidentUpdate
-from dispatch.incident.priority import service as incident_priority_service
 from dispatch.individual import service as individual_service
 from dispatch.individual.models import IndividualContactRead
 from dispatch.monitor import service as monitor_service
 from dispatch.monitor.models import MonitorCreate
 from dispatch.participant import service as participant_service
 from dispatch.participant.models import ParticipantUpdate
+from dispatch.participant_activity.buffer import participant_role_activity_buffer
 from dispatch.participant_role import service as participant_role_service
 from dispatch.incident.severity import service as incident_severity_service
 from dispatch.participant_role.enums import ParticipantRoleType
 from dispatch.plugin import service as plugin_service
 from dispatch.plugins.dispatch_slack import service as dispatch_slack_service
 from dispatch.plugins.dispatch_slack.bolt import app
-from dispatch.plugins.dispatch_slack.decorators import message_dispatcher
+from dispatch.plugins.dispatch_slack.decorators import MessageContext, message_dispatcher
 from dispatch.plugins.dispatch_slack.enums import SlackAPIErrorCode
 from dispatch.plugins.dispatch_slack.exceptions import CommandError, EventError
 from dispatch.plugins.dispatch_slack.fields import (
@@ -159,7 +159,7 @@ def is_target_reaction(reaction: str) -> bool:
     return is_target
 
 
-def configure(config):
+def configure(config, app: App = app):
     """Maps commands/events to their functions."""
     incident_command_context_middleware = partial(
         command_context_middleware,
@@ -623,7 +623,7 @@ def handle_list_tasks_command(
         caller_only = True
 
     if caller_only:
-        email = (client.users_info(user=payload["user_id"]))["user"]["profile"]["email"]
+        email = dispatch_slack_service.get_user_email(client, payload["user_id"])
         tasks = filter_tasks_by_assignee_and_creator(tasks, email, email)
 
     draw_task_modal(
@@ -782,8 +782,8 @@ def handle_not_configured_reaction_event(
 def get_user_name_from_id(client: Any, user_id: str) -> str:
     """Returns the user's name given their user ID."""
     try:
-        user = client.users_info(user=user_id)
-        return user["user"]["profile"]["real_name"]
+        user = dispatch_slack_service.get_user_info_by_id(client, user_id)
+        return user["profile"]["real_name"]
     except SlackApiError:
         # if can't find user, just return the original text
         return user_id
@@ -949,47 +949,52 @@ def handle_timeline_added_event(
     subject=IncidentSubjects.incident, exclude={"subtype": ["channel_join", "channel_leave"]}
 )  # we ignore channel join and leave messages
 def handle_participant_role_activity(
-    ack: Ack, db_session: Session, context: BoltContext, user: DispatchUser
+    ack: Ack, db_session: Session, context: BoltContext, message_context: MessageContext
 ) -> None:
     """
     Increments the participant role's activity counter and assesses the need of changing
     a participant's role based on its activity and changes it if needed.
     """
     ack()
-    participant = participant_service.get_by_incident_id_and_email(
-        db_session=db_session, incident_id=int(context["subject"].id), email=user.email
-    )
+    participant = message_context.participant
 
     if participant:
         for participant_role in participant.active_roles:
+            # observer activity is written right away, so promotions happen on the third message
+            if participant_role.role != ParticipantRoleType.observer:
+                participant_role_activity_buffer.increment(
+                    organization=context["subject"].organization_slug,
+                    participant_role_id=participant_role.id,
+                )
+                continue
+
             participant_role.activity += 1
 
             # re-assign role once threshold is reached
-            if participant_role.role == ParticipantRoleType.observer:
-                if participant_role.activity >= 3:  # three messages sent to the incident channel
-                    # we change the participant's role to the participant one
-                    participant_role_service.renounce_role(
-                        db_session=db_session, participant_role=participant_role
-                    )
-                    participant_role_service.add_role(
-                        db_session=db_session,
-                        participant_id=participant.id,
-                        participant_role=ParticipantRoleType.participant,
-                    )
+            if participant_role.activity >= 3:  # three messages sent to the incident channel
+                # we change the participant's role to the participant one
+                participant_role_service.renounce_role(
+                    db_session=db_session, participant_role=participant_role
+                )
+                participant_role_service.add_role(
+                    db_session=db_session,
+                    participant_id=participant.id,
+                    participant_role=ParticipantRoleType.participant,
+                )
 
-                    # we log the event
-                    event_service.log_incident_event(
-                        db_session=db_session,
-                        source="Slack Plugin - Conversation Management",
-                        description=(
-                            f"{participant.individual.name}'s role changed from {participant_role.role} to "
-                            f"{ParticipantRoleType.participant} due to activity in the incident channel"
-                        ),
-                        incident_id=int(context["subject"].id),
-                        type=EventType.participant_updated,
-                    )
+                # we log the event
+                event_service.log_incident_event(
+                    db_session=db_session,
+                    source="Slack Plugin - Conversation Management",
+                    description=(
+                        f"{participant.individual.name}'s role changed from {participant_role.role} to "
+                        f"{ParticipantRoleType.participant} due to activity in the incident channel"
+                    ),
+                    incident_id=int(context["subject"].id),
+                    type=EventType.participant_updated,
+                )
 
-            db_session.commit()
+        db_session.commit()
 
 
 @message_dispatcher.add(
@@ -997,27 +1002,21 @@ def handle_participant_role_activity(
 )  # we ignore user channel and group join messages
 def handle_after_hours_message(
     ack: Ack,
-    context: BoltContext,
     client: WebClient,
     db_session: Session,
     payload: dict,
     user: DispatchUser,
+    message_context: MessageContext,
 ) -> None:
     """Notifies the user that this incident is currently in after hours mode."""
     ack()
 
-    incident = incident_service.get(db_session=db_session, incident_id=int(context["subject"].id))
+    incident = message_context.incident
     owner_email = incident.commander.individual.email
-    participant = participant_service.get_by_incident_id_and_email(
-        db_session=db_session, incident_id=int(context["subject"].id), email=user.email
-    )
-
-    # get incident priority settings and if delayed message warning is disabled, log and return
-    incident_priority_data = incident_priority_service.get(
-        db_session=db_session, incident_priority_id=incident.incident_priority_id
-    )
+    participant = message_context.participant
 
-    if incident_priority_data.disable_delayed_message_warning:
+    # if delayed message warning is disabled for the incident priority, log and return
+    if incident.incident_priority.disable_delayed_message_warning:
         log.debug("delayed messaging is disabled, not sending a warning")
         return
 
@@ -1086,17 +1085,16 @@ def handle_message_monitor(
     context: BoltContext,
     client: WebClient,
     db_session: Session,
+    message_context: MessageContext,
 ) -> None:
     """Looks for strings that are available for monitoring (e.g. links)."""
     ack()
 
-    incident = incident_service.get(db_session=db_session, incident_id=int(context["subject"].id))
-    project_id = incident.project.id
-
-    plugins = plugin_service.get_active_instances(
-        db_session=db_session, project_id=project_id, plugin_type="monitor"
-    )
+    plugins = message_context.active_plugins(plugin_type="monitor")
+    if not plugins:
+        return
 
+    incident = message_context.incident
     for p in plugins:
         for matcher in p.instance.get_matchers():
             for match in matcher.finditer(payload["text"]):
@@ -2,12 +2,14 @@ import logging
 import json
 from typing import Callable, NamedTuple
 from slack_bolt import BoltContext, BoltRequest
+from slack_sdk.errors import SlackApiError
 from slack_sdk.web import WebClient
 from sqlalchemy.orm.session import Session
 
 from dispatch.auth import service as user_service
 from dispatch.auth.models import DispatchUser, UserRegister
 from dispatch.conversation import service as conversation_service
+from dispatch.conversation.index import ConversationSubject, conversation_index
 from dispatch.database.core import get_session, get_organization_session, refetch_db_session
 from dispatch.decorators import timer
 from dispatch.enums import SubjectNames
@@ -19,7 +21,10 @@ from dispatch.plugins.dispatch_slack.models import SlackCommandPayload
 from dispatch.plugins.dispatch_slack.exceptions import CommandError
 from dispatch.project import service as project_service
 
+from .cache import DISPATCH_NAMESPACE, DISPATCH_USER_ID, USER_IDENTITY, slack_user_cache
+from .enums import SlackAPIErrorCode
 from .exceptions import ContextError, RoleError
+from .service import get_user_info_by_id
 from .models import (
     EngagementMetadata,
     SubjectMetadata,
@@ -34,12 +39,50 @@ log = logging.getLogger(__file__)
 Subject = NamedTuple("Subject", subject=SubjectMetadata, db_session=Session)
 
 
+def _subject_from_conversation_subject(
+    conversation_subject: ConversationSubject,
+) -> SubjectMetadata:
+    return SubjectMetadata(
+        type=conversation_subject.type,
+        id=conversation_subject.id,
+        organization_slug=conversation_subject.organization_slug,
+        project_id=conversation_subject.project_id,
+    )
+
+
+def _conversation_subject(
+    organization_slug: str, conversation, cached: ConversationSubject | None = None
+) -> ConversationSubject:
+    """Returns the subject a conversation currently belongs to."""
+    if conversation.incident_id:
+        subject_type, subject_id = IncidentSubjects.incident, conversation.incident_id
+    else:
+        subject_type, subject_id = CaseSubjects.case, conversation.case_id
+
+    # the cached subject is still current, no need to load it
+    if cached and (cached.type, cached.id) == (subject_type, subject_id):
+        return cached
+
+    subject = conversation.incident if conversation.incident_id else conversation.case
+    return ConversationSubject(
+        organization_slug=organization_slug,
+        type=subject_type,
+        id=subject_id,
+        project_id=subject.project_id,
+    )
+
+
 @timer
 def resolve_context_from_conversation(channel_id: str, thread_id: str = None) -> Subject | None:
     """Attempts to resolve a conversation based on the channel id and thread_id."""
-    organization_slugs = []
-    with get_session() as db_session:
-        organization_slugs = [o.slug for o in organization_service.get_all(db_session=db_session)]
+    cached = conversation_index.get(channel_id, thread_id)
+    if cached:
+        organization_slugs = [cached.organization_slug]
+    else:
+        with get_session() as db_session:
+            organization_slugs = [
+                o.slug for o in organization_service.get_all(db_session=db_session)
+            ]
 
     for slug in organization_slugs:
         with get_organization_session(slug) as scoped_db_session:
@@ -48,21 +91,20 @@ def resolve_context_from_conversation(channel_id: str, thread_id: str = None) ->
             )
 
             if conversation:
-                if conversation.incident:
-                    subject = SubjectMetadata(
-                        type=IncidentSubjects.incident,
-                        id=conversation.incident_id,
-                        organization_slug=slug,
-                        project_id=conversation.incident.project_id,
-                    )
-                else:
-                    subject = SubjectMetadata(
-                        type=CaseSubjects.case,
-                        id=conversation.case_id,
-                        organization_slug=slug,
-                        project_id=conversation.case.project_id,
-                    )
-                return Subject(subject, db_session=scoped_db_session)
+                # cached entries are confirmed against the conversation, as other processes
+                # may have reassigned it (e.g. a case escalated to an incident)
+                conversation_subject = _conversation_subject(slug, conversation, cached)
+                if conversation_subject != cached:
+                    conversation_index.set(channel_id, thread_id, conversation_subject)
+                return Subject(
+                    _subject_from_conversation_subject(conversation_subject),
+                    db_session=scoped_db_session,
+                )
+
+    if cached:
+        # the conversation moved to another organization, or was deleted
+        conversation_index.invalidate(channel_id)
+        return resolve_context_from_conversation(channel_id, thread_id)
 
 
 def select_context_middleware(payload: dict, context: BoltContext, next: Callable) -> None:
@@ -261,43 +303,70 @@ def user_middleware(
         )
         db_session = refetch_db_session(slug)
 
-    participant = None
-    # in the case of creating new incidents or cases we don't have a subject yet
-    if context["subject"].id:
-        if context["subject"].type == "incident":
-            participant = participant_service.get_by_incident_id_and_conversation_id(
-                db_session=db_session,
-                incident_id=context["subject"].id,
-                user_conversation_id=user_id,
-            )
-        else:
-            participant = participant_service.get_by_case_id_and_conversation_id(
-                db_session=db_session, case_id=context["subject"].id, user_conversation_id=user_id
-            )
-
-    user = None
-    if participant:
-        user = user_service.get_or_create(
-            db_session=db_session,
-            organization=context["subject"].organization_slug,
-            user_in=UserRegister(email=participant.individual.email),
-        )
-    else:
-        user_info = client.users_info(user=user_id).get("user", {})
+    def load_identity() -> dict | None:
+        """Resolves the Slack user's email, from its participant if possible."""
+        # in the case of creating new incidents or cases we don't have a subject yet
+        if context["subject"].id:
+            if context["subject"].type == "incident":
+                participant = participant_service.get_by_incident_id_and_conversation_id(
+                    db_session=db_session,
+                    incident_id=context["subject"].id,
+                    user_conversation_id=user_id,
+                )
+            else:
+                participant = participant_service.get_by_case_id_and_conversation_id(
+                    db_session=db_session,
+                    case_id=context["subject"].id,
+                    user_conversation_id=user_id,
+                )
+            if participant:
+                return {"email": participant.individual.email, "is_bot": False}
+
+        try:
+            user_info = get_user_info_by_id(client, user_id)
+        except SlackApiError as e:
+            # unknown users are cached as negative entries
+            if e.response["error"] == SlackAPIErrorCode.USER_NOT_FOUND:
+                return None
+            raise
 
         if user_info.get("is_bot", False):
-            return context.ack()
+            return {"email": None, "is_bot": True}
 
         email = user_info.get("profile", {}).get("email")
+        # users without an email address are cached as negative entries
+        return {"email": email, "is_bot": False} if email else None
 
-        if not email:
-            raise ContextError("Unable to get user email address.")
+    identity = slack_user_cache.get(
+        context.get("team_id") or client.token, USER_IDENTITY, user_id, load_identity
+    )
+    if identity and identity["is_bot"]:
+        return context.ack()
 
+    if not identity:
+        raise ContextError("Unable to get user email address.")
+
+    # dispatch users live in the core schema, their ids are the same for all organizations
+    email = identity["email"]
+    dispatch_user_id = slack_user_cache.get(
+        DISPATCH_NAMESPACE,
+        DISPATCH_USER_ID,
+        email,
+        lambda: getattr(user_service.get_by_email(db_session=db_session, email=email), "id", None),
+    )
+
+    user = None
+    if dispatch_user_id:
+        user = user_service.get(db_session=db_session, user_id=dispatch_user_id)
+
+    if not user:
         user = user_service.get_or_create(
             db_session=db_session,
             organization=context["subject"].organization_slug,
             user_in=UserRegister(email=email),
         )
+        if user:
+            slack_user_cache.set(DISPATCH_NAMESPACE, DISPATCH_USER_ID, email, user.id)
 
     if not user:
         raise ContextError("Unable to determine user from context.")
@@ -0,0 +1,223 @@
+"""
+.. module: dispatch.plugins.dispatch_slack.registry
+    :platform: Unix
+    :copyright: (c) 2019 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+
+import json
+import threading
+import time
+from typing import NamedTuple
+from urllib.parse import parse_qs
+
+from slack_bolt.app import App
+from slack_sdk.signature import SignatureVerifier
+from sqlalchemy import true
+from starlette.datastructures import Headers
+
+from dispatch.database.core import get_organization_session
+from dispatch.plugin.cache import plugin_configuration_cache
+from dispatch.plugin.models import Plugin, PluginInstance
+
+from .bolt import app, app_error_handler
+from .case.interactive import configure as case_configure
+from .config import SlackConversationConfiguration
+from .feedback.interactive import configure as feedback_configure
+from .handler import SlackRequestHandler
+from .incident.interactive import configure as incident_configure
+from .workflow import configure as workflow_configure
+
+
+class SlackConfigurationEntry(NamedTuple):
+    """An enabled Slack configuration of an organization."""
+
+    plugin_instance_id: int
+    version: str
+    configuration: SlackConversationConfiguration
+
+    @property
+    def key(self) -> tuple[int, str]:
+        return self.plugin_instance_id, self.version
+
+    def verify(self, body: bytes, headers: Headers) -> bool:
+        """Whether the request was signed with this configuration's signing secret."""
+        verifier = SignatureVerifier(
+            signing_secret=self.configuration.signing_secret.get_secret_value()
+        )
+        return verifier.is_valid_request(body, headers)
+
+
+def get_request_route(body: bytes) -> tuple[str, str] | None:
+    """Returns the Slack app and team ids of a request, from its JSON or form encoded payload."""
+    try:
+        text = body.decode("utf-8")
+        if text.startswith("{"):
+            # events
+            payload = json.loads(text)
+        else:
+            form = {key: values[0] for key, values in parse_qs(text).items()}
+            # interactions have a JSON payload, commands are plain forms
+            payload = json.loads(form["payload"]) if "payload" in form else form
+    except (UnicodeDecodeError, ValueError, KeyError):
+        return None
+
+    team_id = payload.get("team_id")
+    if not team_id and isinstance(payload.get("team"), dict):
+        team_id = payload["team"].get("id")
+
+    api_app_id = payload.get("api_app_id")
+    if not api_app_id and not team_id:
+        return None
+    return api_app_id, team_id
+
+
+def build_app(configuration: SlackConversationConfiguration) -> App:
+    """Builds a bolt app for a Slack configuration.
+
+    The app gets the listeners registered on the module level bolt app when the
+    interactive modules were imported, and the configuration's commands.
+    """
+    slack_app = App(
+        token=configuration.api_bot_token.get_secret_value(),
+        signing_secret=configuration.signing_secret.get_secret_value(),
+        request_verification_enabled=False,
+        token_verification_enabled=False,
+    )
+    slack_app._listeners = list(app._listeners)
+    slack_app.error(app_error_handler)
+
+    case_configure(configuration, app=slack_app)
+    feedback_configure(configuration, app=slack_app)
+    incident_configure(configuration, app=slack_app)
+    workflow_configure(configuration, app=slack_app)
+
+    slack_app._configuration = configuration
+    return slack_app
+
+
+class SlackAppRegistry:
+    """Keeps a bolt app and request handler per Slack configuration.
+
+    The enabled `slack-conversation` plugin instances of an organization are loaded
+    once every `ttl` seconds. Handlers are built once per instance and configuration
+    version, so requests never reconfigure a shared app.
+
+    Requests are routed by the Slack app and team ids of their payload to the
+    configuration that verified the previous request of that route, so their signature
+    is checked against a single signing secret. Requests of unknown routes are checked
+    against every configuration of the organization, and reload the configurations
+    (at most every `min_reload_interval` seconds) if none matches.
+    """
+
+    def __init__(self, ttl: int = 60, min_reload_interval: int = 5):
+        self.ttl = ttl
+        self.min_reload_interval = min_reload_interval
+        self._lock = threading.Lock()
+        # organization -> (loaded at, entries)
+        self._entries = {}
+        # (organization, api app id, team id) -> entry key
+        self._routes = {}
+        # (organization, entry key) -> handler
+        self._handlers = {}
+
+    def load_entries(self, organization: str) -> list[SlackConfigurationEntry]:
+        """Loads the enabled Slack configurations of an organization."""
+        with get_organization_session(organization) as db_session:
+            plugin_instances = (
+                db_session.query(PluginInstance)
+                .join(Plugin)
+                .filter(PluginInstance.enabled == true(), Plugin.slug == "slack-conversation")
+                .all()
+            )
+            entries = []
+            for plugin_instance in plugin_instances:
+                if not plugin_instance._configuration:
+                    continue
+                configuration = plugin_instance.configuration
+                if configuration is None:
+                    continue
+                entries.append(
+                    SlackConfigurationEntry(
+                        plugin_instance_id=plugin_instance.id,
+                        version=plugin_configuration_cache.version(plugin_instance._configuration),
+                        configuration=configuration,
+                    )
+                )
+            return entries
+
+    def get_entries(self, organization: str, reload: bool = False) -> list[SlackConfigurationEntry]:
+        """Returns the enabled Slack configurations of an organization."""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(organization)
+
+        if cached:
+            loaded_at, entries = cached
+            age = now - loaded_at
+            if age < self.ttl and not (reload and age >= self.min_reload_interval):
+                return entries
+
+        entries = self.load_entries(organization)
+        keys = {entry.key for entry in entries}
+        with self._lock:
+            self._entries[organization] = (now, entries)
+            # drop the handlers of configurations that were changed or disabled
+            for key in [k for k in self._handlers if k[0] == organization and k[1] not in keys]:
+                del self._handlers[key]
+            for route in [
+                r for r, key in self._routes.items() if r[0] == organization and key not in keys
+            ]:
+                del self._routes[route]
+        return entries
+
+    def get_handler(self, organization: str, entry: SlackConfigurationEntry) -> SlackRequestHandler:
+        """Returns the request handler of a configuration, building it if needed."""
+        with self._lock:
+            handler = self._handlers.get((organization, entry.key))
+        if handler:
+            return handler
+
+        handler = SlackRequestHandler(build_app(entry.configuration))
+        with self._lock:
+            return self._handlers.setdefault((organization, entry.key), handler)
+
+    def find_handler(
+        self, organization: str, body: bytes, headers: Headers
+    ) -> SlackRequestHandler | None:
+        """Returns the handler of the configuration that signed a request."""
+        route = get_request_route(body)
+        route_key = (organization, *route) if route else None
+
+        previous = None
+        for reload in (False, True):
+            entries = self.get_entries(organization, reload=reload)
+            if entries is previous:
+                # the configurations were loaded too recently to be reloaded
+                break
+            previous = entries
+
+            with self._lock:
+                key = self._routes.get(route_key) if route_key else None
+            if key:
+                entry = next((e for e in entries if e.key == key), None)
+                if entry and entry.verify(body, headers):
+                    return self.get_handler(organization, entry)
+
+            for entry in entries:
+                if entry.key != key and entry.verify(body, headers):
+                    if route_key:
+                        with self._lock:
+                            self._routes[route_key] = entry.key
+                    return self.get_handler(organization, entry)
+
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._routes.clear()
+            self._handlers.clear()
+
+
+slack_app_registry = SlackAppRegistry()
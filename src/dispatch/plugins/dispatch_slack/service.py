@@ -18,7 +18,17 @@ from tenacity import (
     wait_exponential,
 )
 
+from .cache import (
+    USER_EXISTS,
+    USER_INFO_BY_EMAIL,
+    USER_INFO_BY_ID,
+    USER_PROFILE_BY_EMAIL,
+    USER_PROFILE_BY_ID,
+    slack_user_cache,
+)
+from .client import slack_client_registry
 from .config import SlackConversationConfiguration
+from .directory import slack_directory
 from .enums import SlackAPIErrorCode, SlackAPIGetEndpoints, SlackAPIPostEndpoints
 
 Conversation = dict[str, str]
@@ -44,8 +54,8 @@ class WebClientWrapper:
 
 
 def create_slack_client(config: SlackConversationConfiguration) -> WebClient:
-    """Creates a Slack Web API client."""
-    return WebClient(token=config.api_bot_token.get_secret_value())
+    """Returns the long lived Slack Web API client of the configuration's bot token."""
+    return slack_client_registry.get(config.api_bot_token.get_secret_value())
 
 
 def resolve_user(client: WebClient, user_id: str) -> dict:
@@ -207,72 +217,113 @@ def get_domain(client: WebClient) -> str:
     return _get_domain(WebClientWrapper(client))
 
 
-@functools.lru_cache()
-def _get_user_info_by_id(wrapper: WebClientWrapper, user_id: str) -> dict:
-    return make_call(wrapper.client, SlackAPIGetEndpoints.users_info, user=user_id)["user"]
+def get_cached_user(
+    client: WebClient,
+    kind: str,
+    key: str,
+    endpoint: str,
+    not_found: SlackAPIErrorCode,
+    **kwargs,
+) -> dict:
+    """Looks up a user through the user cache.
+
+    Users Slack can't find are cached as negative entries, and looking them up again
+    raises the same error without calling Slack.
+    """
+
+    def lookup():
+        try:
+            return make_call(client, endpoint, **kwargs)["user"]
+        except SlackApiError as e:
+            if e.response["error"] == not_found:
+                return None
+            raise
+
+    user = slack_user_cache.get(client.token, kind, key, lookup)
+    if user is None:
+        raise SlackApiError(f"Unable to find Slack user {key}.", {"ok": False, "error": not_found})
+    return user
 
 
 def get_user_info_by_id(client: WebClient, user_id: str) -> dict:
     """Gets profile information about a user by id."""
-    return _get_user_info_by_id(WebClientWrapper(client), user_id)
-
+    if user := slack_directory.get_by_id(client, user_id):
+        return user
 
-@functools.lru_cache()
-def _get_user_info_by_email(wrapper: WebClientWrapper, email: str) -> dict:
-    """Gets profile information about a user by email."""
-    return make_call(wrapper.client, SlackAPIGetEndpoints.users_lookup_by_email, email=email)[
-        "user"
-    ]
+    return get_cached_user(
+        client,
+        USER_INFO_BY_ID,
+        user_id,
+        SlackAPIGetEndpoints.users_info,
+        SlackAPIErrorCode.USER_NOT_FOUND,
+        user=user_id,
+    )
 
 
 def get_user_info_by_email(client: WebClient, email: str) -> dict:
     """Gets profile information about a user by email."""
-    return _get_user_info_by_email(WebClientWrapper(client), email)
-
+    if user := slack_directory.get_by_email(client, email):
+        return user
 
-@functools.lru_cache()
-def _does_user_exist(wrapper: WebClientWrapper, email: str) -> bool:
-    """Checks if a user exists in the Slack workspace by their email."""
-    try:
-        get_user_info_by_email(wrapper.client, email)
-        return True
-    except SlackApiError as e:
-        if e.response["error"] == SlackAPIErrorCode.USERS_NOT_FOUND:
-            return False
-        else:
-            raise
+    return get_cached_user(
+        client,
+        USER_INFO_BY_EMAIL,
+        email,
+        SlackAPIGetEndpoints.users_lookup_by_email,
+        SlackAPIErrorCode.USERS_NOT_FOUND,
+        email=email,
+    )
 
 
 def does_user_exist(client: WebClient, email: str) -> bool:
     """Checks if a user exists in the Slack workspace by their email."""
-    return _does_user_exist(WebClientWrapper(client), email)
 
+    def lookup():
+        try:
+            get_user_info_by_email(client, email)
+            return True
+        except SlackApiError as e:
+            if e.response["error"] == SlackAPIErrorCode.USERS_NOT_FOUND:
+                # cached as a negative entry
+                return None
+            raise
 
-@functools.lru_cache()
-def _get_user_profile_by_id(wrapper: WebClientWrapper, user_id: str) -> dict:
-    """Gets profile information about a user by id."""
-    return make_call(wrapper.client, SlackAPIGetEndpoints.users_profile_get, user_id=user_id)[
-        "profile"
-    ]
+    return bool(slack_user_cache.get(client.token, USER_EXISTS, email, lookup))
 
 
 def get_user_profile_by_id(client: WebClient, user_id: str) -> dict:
     """Gets profile information about a user by id."""
-    return _get_user_profile_by_id(WebClientWrapper(client), user_id)
+    return slack_user_cache.get(
+        client.token,
+        USER_PROFILE_BY_ID,
+        user_id,
+        lambda: make_call(client, SlackAPIGetEndpoints.users_profile_get, user_id=user_id)[
+            "profile"
+        ],
+    )
 
 
-@functools.lru_cache()
-def _get_user_profile_by_email(wrapper: WebClientWrapper, email: str) -> SlackResponse:
+def get_user_profile_by_email(client: WebClient, email: str) -> SlackResponse:
     """Gets extended profile information about a user by email."""
-    user = get_user_info_by_email(wrapper.client, email)
-    profile = get_user_profile_by_id(wrapper.client, user["id"])
-    profile["tz"] = user["tz"]
-    return profile
 
+    def lookup():
+        user = get_user_info_by_email(client, email)
+        profile = dict(get_user_profile_by_id(client, user["id"]))
+        profile["tz"] = user["tz"]
+        return profile
 
-def get_user_profile_by_email(client: WebClient, email: str) -> SlackResponse:
-    """Gets extended profile information about a user by email."""
-    return _get_user_profile_by_email(WebClientWrapper(client), email)
+    return slack_user_cache.get(client.token, USER_PROFILE_BY_EMAIL, email, lookup)
+
+
+def update_user(client: WebClient, user: dict) -> None:
+    """Updates the directory and cached lookups of a user that changed."""
+    slack_directory.update(client.token, user)
+
+    slack_user_cache.invalidate(client.token, USER_INFO_BY_ID, user["id"])
+    slack_user_cache.invalidate(client.token, USER_PROFILE_BY_ID, user["id"])
+    if email := (user.get("profile") or {}).get("email"):
+        for kind in (USER_INFO_BY_EMAIL, USER_PROFILE_BY_EMAIL, USER_EXISTS):
+            slack_user_cache.invalidate(client.token, kind, email)
 
 
 def get_user_email(client: WebClient, user_id: str) -> str | None:
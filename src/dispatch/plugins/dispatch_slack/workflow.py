@@ -1,5 +1,5 @@
 from blockkit import Context, Input, MarkdownText, Modal, PlainTextInput, Section
-from slack_bolt import Ack, BoltContext
+from slack_bolt import Ack, App, BoltContext
 from slack_sdk.web import WebClient
 from sqlalchemy.orm import Session
 
@@ -42,7 +42,7 @@ class RunWorkflowActions(DispatchEnum):
     workflow_select = "run-workflow-workflow-select"
 
 
-def configure(config):
+def configure(config, app: App = app):
     """Maps commands/events to their functions."""
     middleware = [
         command_context_middleware,
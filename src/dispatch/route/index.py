@@ -0,0 +1,484 @@
+"""
+.. module: dispatch.route.index
+    :platform: Unix
+    :copyright: (c) 2019 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+
+import copy
+import logging
+import threading
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+from cachetools import LRUCache
+from sqlalchemy import func, inspect, literal, select, union_all
+
+from dispatch.database.core import Base, get_class_by_tablename, get_table_name_by_class_instance
+from dispatch.search_filter import service as search_filter_service
+from dispatch.search_filter.evaluation import like_to_regex, sql_and, sql_not, sql_or
+from dispatch.search_filter.models import SearchFilter
+
+log = logging.getLogger(__name__)
+
+
+# the models a routing filter may test, per subject, mirroring the joins made when
+# matching the filter in SQL (see `apply_filter_specific_joins`):
+# (subject, model) -> (relationship, is collection, relationship of the related entity)
+ROUTING_JOINS = {
+    ("incident", "Project"): ("project", False, None),
+    ("incident", "IncidentType"): ("incident_type", False, None),
+    ("incident", "IncidentPriority"): ("incident_priority", False, None),
+    ("incident", "IncidentSeverity"): ("incident_severity", False, None),
+    ("incident", "Tag"): ("tags", True, None),
+    ("incident", "TagType"): ("tags", True, "tag_type"),
+    ("incident", "Term"): ("terms", True, None),
+    ("case", "Project"): ("project", False, None),
+    ("case", "CaseType"): ("case_type", False, None),
+    ("case", "CasePriority"): ("case_priority", False, None),
+    ("case", "CaseSeverity"): ("case_severity", False, None),
+    ("case", "Tag"): ("tags", True, None),
+    ("case", "TagType"): ("tags", True, "tag_type"),
+}
+
+# models that are matched as another model (see `Filter.format_for_sqlalchemy`)
+MODEL_ALIASES = {"TagAll": "Tag", "NotCaseType": "CaseType"}
+
+COMPARISON_OPERATORS = {
+    "==": lambda f, a: f == a,
+    "eq": lambda f, a: f == a,
+    "!=": lambda f, a: f != a,
+    "ne": lambda f, a: f != a,
+    ">": lambda f, a: f > a,
+    "gt": lambda f, a: f > a,
+    "<": lambda f, a: f < a,
+    "lt": lambda f, a: f < a,
+    ">=": lambda f, a: f >= a,
+    "ge": lambda f, a: f >= a,
+    "<=": lambda f, a: f <= a,
+    "le": lambda f, a: f <= a,
+}
+LIKE_OPERATORS = {"like", "ilike", "not_ilike"}
+IN_OPERATORS = {"in", "not_in"}
+NULL_OPERATORS = {"is_null", "is_not_null"}
+
+
+class UncompilableFilter(Exception):
+    """The filter can't be evaluated in memory and is matched in SQL instead."""
+
+
+def _is_iterable(spec) -> bool:
+    return isinstance(spec, Iterable) and not isinstance(spec, (str, dict))
+
+
+class FilterCompiler:
+    """Compiles a search filter expression to a predicate evaluated in memory.
+
+    Predicates are nested tuples: `("and", nodes)`, `("or", nodes)`, `("not", node)` and
+    `("leaf", model, field, operator, value)`, evaluated with SQL's three-valued logic
+    (`None` being unknown) against a row of joined entities.
+    """
+
+    def __init__(self, subject: str):
+        self.subject = subject
+        try:
+            self.subject_cls = get_class_by_tablename(subject)
+        except Exception:
+            raise UncompilableFilter(f"Unknown subject {subject}.") from None
+        self.models = set()
+
+    def model_class(self, model: str):
+        if model == self.subject_cls.__name__:
+            return self.subject_cls
+
+        join = ROUTING_JOINS.get((self.subject, model))
+        if not join:
+            raise UncompilableFilter(f"Model {model} can't be routed for {self.subject}.")
+
+        attribute, _, via = join
+        model_cls = inspect(self.subject_cls).relationships[attribute].mapper.class_
+        if via:
+            model_cls = inspect(model_cls).relationships[via].mapper.class_
+        return model_cls
+
+    def compile(self, spec) -> list[tuple]:
+        """Compiles a filter spec, flattening nested lists like `build_filters` does."""
+        if _is_iterable(spec):
+            return [node for item in spec for node in self.compile(item)]
+
+        if not isinstance(spec, dict):
+            raise UncompilableFilter(f"Filter spec {spec} should be a dictionary.")
+
+        for key in ("or", "and", "not"):
+            if key in spec:
+                args = spec[key]
+                if not _is_iterable(args):
+                    raise UncompilableFilter(f"{key} value must be an iterable.")
+                nodes = self.compile(args)
+                if key == "not":
+                    if len(nodes) != 1:
+                        raise UncompilableFilter("not must have one argument.")
+                    return [("not", nodes[0])]
+                if not nodes:
+                    raise UncompilableFilter(f"{key} must have one or more arguments.")
+                return [(key, nodes)]
+
+        return [self.compile_leaf(spec)]
+
+    def compile_leaf(self, spec: dict) -> tuple:
+        if "field" not in spec:
+            raise UncompilableFilter("field is a mandatory filter attribute.")
+
+        model = spec.get("model") or self.subject_cls.__name__
+        model = MODEL_ALIASES.get(model, model)
+        field = spec["field"]
+        op = spec.get("op") or "=="
+        value = spec.get("value")
+
+        columns = inspect(self.model_class(model)).column_attrs
+        if field not in columns:
+            raise UncompilableFilter(f"{model}.{field} isn't a column.")
+
+        if op in NULL_OPERATORS:
+            self.models.add(model)
+            return ("leaf", model, field, op, None)
+
+        try:
+            python_type = columns[field].expression.type.python_type
+        except NotImplementedError:
+            raise UncompilableFilter(f"{model}.{field} has no python type.") from None
+
+        def check(v):
+            # values SQL would have to coerce are left to SQL
+            if isinstance(v, python_type) or (python_type is float and isinstance(v, int)):
+                return
+            raise UncompilableFilter(f"{v!r} isn't a {python_type.__name__}.")
+
+        if op in COMPARISON_OPERATORS:
+            check(value)
+        elif op in LIKE_OPERATORS:
+            if python_type is not str or not isinstance(value, str):
+                raise UncompilableFilter(f"{op} requires text.")
+            value = like_to_regex(value, ignore_case=op != "like")
+        elif op in IN_OPERATORS:
+            if not _is_iterable(value):
+                raise UncompilableFilter(f"{op} requires a list.")
+            for v in value:
+                check(v)
+            value = tuple(value)
+        else:
+            raise UncompilableFilter(f"Operator {op} can't be routed.")
+
+        self.models.add(model)
+        return ("leaf", model, field, op, value)
+
+
+def evaluate(node: tuple, row: dict) -> bool | None:
+    """Evaluates a compiled predicate against a row of joined entities."""
+    kind = node[0]
+    if kind == "and":
+        return sql_and(evaluate(n, row) for n in node[1])
+    if kind == "or":
+        return sql_or(evaluate(n, row) for n in node[1])
+    if kind == "not":
+        return sql_not(evaluate(node[1], row))
+
+    _, model, field, op, a = node
+    entity = row.get(model)
+    f = getattr(entity, field) if entity is not None else None
+
+    if op == "is_null":
+        return f is None
+    if op == "is_not_null":
+        return f is not None
+    if f is None:
+        return None
+
+    if op in COMPARISON_OPERATORS:
+        return COMPARISON_OPERATORS[op](f, a)
+    if op in LIKE_OPERATORS:
+        matched = a.fullmatch(f) is not None
+        return not matched if op == "not_ilike" else matched
+
+    # `in`, `not_in`
+    if f in a:
+        return op == "in"
+    if None in a:
+        return None
+    return op == "not_in"
+
+
+def necessary_tokens(node: tuple) -> frozenset | None:
+    """Returns the (model, field, value) tokens of which a row must have one to match.
+
+    Returns None when the predicate can't be reduced to such a set.
+    """
+    kind = node[0]
+    if kind == "and":
+        sets = [s for s in (necessary_tokens(n) for n in node[1]) if s is not None]
+        return min(sets, key=len) if sets else None
+    if kind == "or":
+        sets = [necessary_tokens(n) for n in node[1]]
+        if any(s is None for s in sets):
+            return None
+        return frozenset().union(*sets)
+    if kind == "not":
+        return None
+
+    _, model, field, op, value = node
+    if op in ("==", "eq") and value is not None and isinstance(value, Hashable):
+        return frozenset([(model, field, value)])
+    if op == "in" and all(v is not None and isinstance(v, Hashable) for v in value):
+        return frozenset((model, field, v) for v in value)
+    return None
+
+
+class RoutingDocument:
+    """The entities a routing filter can test for a class instance.
+
+    Rows mirror the rows the SQL match would join: the instance with one entity per
+    to-one relationship (no rows if it's missing) and one row per element of its
+    collections (a row of nulls if the collection is empty).
+    """
+
+    def __init__(self, class_instance: Base):
+        self.class_instance = class_instance
+        self.subject = get_table_name_by_class_instance(class_instance)
+        self._rows = {}
+        self._values = {}
+
+    def rows(self, models: frozenset) -> list[dict]:
+        rows = self._rows.get(models)
+        if rows is not None:
+            return rows
+
+        instance = self.class_instance
+        rows = [{instance.__class__.__name__: instance}]
+
+        joins = {}
+        for model in models:
+            join = ROUTING_JOINS.get((self.subject, model))
+            if join:
+                joins.setdefault((join[0], join[1]), []).append((model, join[2]))
+
+        for (attribute, is_collection), joined in sorted(joins.items()):
+            related = getattr(instance, attribute)
+            elements = (list(related) or [None]) if is_collection else [related]
+
+            joined_rows = []
+            for row in rows:
+                for element in elements:
+                    joined_row = dict(row)
+                    for model, via in joined:
+                        entity = getattr(element, via) if via and element is not None else element
+                        # to-one and secondary models are inner joined
+                        if entity is None and (via or not is_collection):
+                            break
+                        joined_row[model] = entity
+                    else:
+                        joined_rows.append(joined_row)
+            rows = joined_rows
+
+        self._rows[models] = rows
+        return rows
+
+    def values(self, model: str, field: str) -> set:
+        """Returns the non null values of a field of the instance's entities."""
+        key = (model, field)
+        values = self._values.get(key)
+        if values is None:
+            values = set()
+            for row in self.rows(frozenset([model])):
+                entity = row.get(model)
+                value = getattr(entity, field) if entity is not None else None
+                if value is not None and isinstance(value, Hashable):
+                    values.add(value)
+            self._values[key] = values
+        return values
+
+
+class RoutingFilter:
+    """A search filter compiled for routing."""
+
+    def __init__(self, search_filter_id: int, subject: str, expression: Any):
+        self.id = search_filter_id
+        self.subject = subject
+        self.expression = expression
+        self.predicate = None
+        self.models = frozenset()
+        self.tokens = None
+
+        try:
+            compiler = FilterCompiler(subject)
+            self.predicate = ("and", compiler.compile(expression))
+            self.models = frozenset(compiler.models)
+            self.tokens = necessary_tokens(self.predicate) if self.predicate[1] else None
+        except UncompilableFilter as e:
+            log.debug(f"Search filter {search_filter_id} will be matched in SQL: {e}")
+            self.predicate = None
+
+    def matches(self, db_session, document: RoutingDocument) -> bool:
+        if self.subject != document.subject:
+            return False
+
+        if self.predicate is not None:
+            try:
+                return any(
+                    evaluate(self.predicate, row) is True for row in document.rows(self.models)
+                )
+            except TypeError:
+                pass
+
+        # matching the filter modifies its spec
+        return bool(
+            search_filter_service.match_many(
+                db_session=db_session,
+                subject=self.subject,
+                filter_spec=copy.deepcopy(self.expression),
+                class_instances=[document.class_instance],
+            )
+        )
+
+
+class RoutingIndex:
+    """An inverted index of the routing filters of a project's resources.
+
+    Filters are indexed by the (subject, model, field, value) tokens they require, so
+    routing a class instance only evaluates the filters that can match it, plus the
+    ones that couldn't be indexed.
+    """
+
+    def __init__(self, version: tuple, resources: list[tuple], filters: list[tuple]):
+        self.version = version
+        # filter id -> [(model name, resource id)]
+        self.resources = {}
+        for model_name, resource_id, search_filter_id in resources:
+            self.resources.setdefault(search_filter_id, []).append((model_name, resource_id))
+
+        self.filters = {}
+        self.by_token = {}
+        self.fields = {}
+        self.unindexed = {}
+        for search_filter_id, subject, expression in filters:
+            routing_filter = RoutingFilter(search_filter_id, subject, expression)
+            self.filters[search_filter_id] = routing_filter
+
+            if routing_filter.tokens is None:
+                self.unindexed.setdefault(subject, []).append(search_filter_id)
+                continue
+
+            for model, field, value in routing_filter.tokens:
+                self.fields.setdefault(subject, set()).add((model, field))
+                self.by_token.setdefault((subject, model, field, value), set()).add(
+                    search_filter_id
+                )
+
+    def candidates(self, document: RoutingDocument) -> set[int]:
+        """Returns the ids of the filters that may match a class instance."""
+        subject = document.subject
+        candidates = set(self.unindexed.get(subject, []))
+        for model, field in self.fields.get(subject, ()):
+            for value in document.values(model, field):
+                candidates.update(self.by_token.get((subject, model, field, value), ()))
+        return candidates
+
+    def match(self, db_session, class_instance: Base) -> dict[str, set[int]]:
+        """Returns the ids of the resources matching a class instance, per model name."""
+        document = RoutingDocument(class_instance)
+
+        matched = set()
+        for search_filter_id in sorted(self.candidates(document)):
+            resources = self.resources.get(search_filter_id, [])
+            # a resource matches if any of its filters does
+            if all(resource in matched for resource in resources):
+                continue
+            if self.filters[search_filter_id].matches(db_session, document):
+                matched.update(resources)
+
+        matches = {}
+        for model_name, resource_id in matched:
+            matches.setdefault(model_name, set()).add(resource_id)
+        return matches
+
+
+def _resource_filters(model_cls, project_id: int, *columns):
+    return (
+        select(literal(model_cls.__name__), *columns)
+        .select_from(model_cls)
+        .join(model_cls.filters)
+        .where(model_cls.project_id == project_id)
+    )
+
+
+class RoutingIndexCache:
+    """Caches the routing index of each project and set of resource models.
+
+    Each lookup checks the index is current with a single aggregate query over the
+    resources, their filters and the associations between them, and rebuilds it when
+    a resource or filter was created, changed or deleted since it was built.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self._cache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def version(db_session, project_id: int, models: list) -> tuple:
+        statement = union_all(
+            *[
+                _resource_filters(
+                    model_cls,
+                    project_id,
+                    func.count(),
+                    func.max(model_cls.updated_at),
+                    func.max(SearchFilter.updated_at),
+                )
+                for model_cls in models
+            ]
+        )
+        return tuple(sorted(tuple(row) for row in db_session.execute(statement)))
+
+    @staticmethod
+    def build(db_session, project_id: int, models: list, version: tuple) -> RoutingIndex:
+        statement = union_all(
+            *[
+                _resource_filters(model_cls, project_id, model_cls.id, SearchFilter.id)
+                for model_cls in models
+            ]
+        )
+        resources = [tuple(row) for row in db_session.execute(statement)]
+
+        search_filter_ids = {search_filter_id for _, _, search_filter_id in resources}
+        filters = []
+        if search_filter_ids:
+            filters = [
+                tuple(row)
+                for row in db_session.execute(
+                    select(SearchFilter.id, SearchFilter.subject, SearchFilter.expression).where(
+                        SearchFilter.id.in_(search_filter_ids)
+                    )
+                )
+            ]
+        return RoutingIndex(version=version, resources=resources, filters=filters)
+
+    def get(self, db_session, project_id: int, models: list) -> RoutingIndex:
+        """Returns the current routing index of a project's resources."""
+        key = (project_id, tuple(sorted(model_cls.__name__ for model_cls in models)))
+        version = self.version(db_session, project_id, models)
+
+        with self._lock:
+            index = self._cache.get(key)
+        if index is not None and index.version == version:
+            return index
+
+        index = self.build(db_session, project_id, models, version)
+        with self._lock:
+            self._cache[key] = index
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+routing_index_cache = RoutingIndexCache()
@@ -9,27 +9,73 @@
 """
 
 import logging
+import multiprocessing
+import random
+import threading
 import time
+from datetime import datetime
 
 from multiprocessing.pool import ThreadPool
 
 import schedule
 
+from dispatch.metrics import provider as metrics_provider
+
 log = logging.getLogger(__name__)
 
+THREAD_EXECUTOR = "thread"
+PROCESS_EXECUTOR = "process"
+
+
+def _run_in_process(func):
+    """Entry point of tasks run with the process executor."""
+    from dispatch.database.core import engine
+
+    # connections inherited from the parent can't be shared with it
+    engine.dispose(close=False)
+    try:
+        func()
+    finally:
+        # the process exits without running atexit handlers
+        metrics_provider.flush()
+
 
 #  See: https://schedule.readthedocs.io/en/stable/ for documentation on job syntax
 class Scheduler:
-    """Simple scheduler class that holds all scheduled functions."""
+    """Simple scheduler class that holds all scheduled functions.
+
+    Each task can be configured with:
+        max_concurrency: The number of runs allowed at the same time. Runs that come due
+            while the limit is reached are skipped.
+        timeout: The number of seconds after which a run is considered timed out. Runs
+            using the process executor are terminated, thread runs can't be interrupted
+            and are only reported (they keep their concurrency slot until they finish).
+        jitter: The maximum number of seconds a run is randomly delayed by, to spread out
+            tasks that come due at the same time.
+        executor: `thread` (default) or `process`, for CPU bound tasks.
+    """
 
     registered_tasks = []
     running = True
 
     def __init__(self, num_workers=100):
         self.pool = ThreadPool(processes=num_workers)
-
-    def add(self, job, *args, **kwargs):
+        self._lock = threading.Lock()
+        self._running_counts = {}
+
+    def add(
+        self,
+        job,
+        *args,
+        max_concurrency: int = 1,
+        timeout: int | None = None,
+        jitter: int | None = None,
+        executor: str = THREAD_EXECUTOR,
+        **kwargs,
+    ):
         """Adds a task to the scheduler."""
+        if executor not in (THREAD_EXECUTOR, PROCESS_EXECUTOR):
+            raise ValueError(f"Unknown scheduler executor: {executor}")
 
         def decorator(func):
             if not kwargs.get("name"):
@@ -37,9 +83,17 @@ class Scheduler:
             else:
                 name = kwargs.pop("name")
 
-            self.registered_tasks.append(
-                {"name": name, "func": func, "job": job.do(self.pool.apply_async, func)}
-            )
+            task = {
+                "name": name,
+                "func": func,
+                "max_concurrency": max_concurrency,
+                "timeout": timeout,
+                "jitter": jitter,
+                "executor": executor,
+            }
+            task["job"] = job.do(self.submit, task)
+            self.registered_tasks.append(task)
+            return func
 
         return decorator
 
@@ -47,6 +101,76 @@ class Scheduler:
         """Removes a task from the scheduler."""
         schedule.cancel_job(task["job"])
 
+    def submit(self, task):
+        """Submits a due task to the worker pool, unless it's already running too often."""
+        # the job hasn't been rescheduled yet, next_run is the time it was due
+        due_at = task["job"].next_run or datetime.now()
+        tags = {"task": task["name"]}
+
+        with self._lock:
+            running = self._running_counts.get(task["name"], 0)
+            if running >= task["max_concurrency"]:
+                log.warning(
+                    "Skipping scheduled task %s, %s run(s) still in progress.",
+                    task["name"],
+                    running,
+                )
+                metrics_provider.counter("scheduler.task.skipped", tags=tags)
+                return
+            self._running_counts[task["name"]] = running + 1
+
+        self.pool.apply_async(self.run, (task, due_at))
+
+    def run(self, task, due_at: datetime):
+        """Runs a task, recording its lag and duration."""
+        tags = {"task": task["name"]}
+
+        try:
+            if task["jitter"]:
+                time.sleep(random.uniform(0, task["jitter"]))
+
+            lag = (datetime.now() - due_at).total_seconds()
+            metrics_provider.timer("scheduler.task.lag", value=lag, tags=tags)
+
+            start = time.perf_counter()
+            if task["executor"] == PROCESS_EXECUTOR:
+                completed = self._run_process(task)
+            else:
+                task["func"]()
+                completed = True
+            elapsed_time = time.perf_counter() - start
+
+            metrics_provider.timer("scheduler.task.duration", value=elapsed_time, tags=tags)
+            if not completed or (task["timeout"] and elapsed_time > task["timeout"]):
+                log.warning(
+                    "Scheduled task %s timed out after %.2f seconds.", task["name"], elapsed_time
+                )
+                metrics_provider.counter("scheduler.task.timeout", tags=tags)
+        except Exception as e:
+            log.error(f"Error trying to run scheduled task: {task['name']}")
+            log.exception(e)
+            metrics_provider.counter("scheduler.task.error", tags=tags)
+        finally:
+            with self._lock:
+                self._running_counts[task["name"]] -= 1
+
+    def _run_process(self, task) -> bool:
+        """Runs a task in a child process, returns False if it had to be terminated."""
+        process = multiprocessing.Process(
+            target=_run_in_process, args=(task["func"],), name=f"scheduler-{task['name']}"
+        )
+        process.start()
+        process.join(task["timeout"])
+
+        if process.is_alive():
+            process.terminate()
+            process.join()
+            return False
+
+        if process.exitcode:
+            raise RuntimeError(f"Process exited with code {process.exitcode}")
+        return True
+
     def start(self):
         """Runs all scheduled tasks."""
         log.info("Starting scheduler...")
@@ -0,0 +1,63 @@
+"""
+.. module: dispatch.search_filter.evaluation
+    :platform: Unix
+    :copyright: (c) 2019 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+
+Building blocks of the in-memory evaluators of filter expressions (signal filters and
+routing filters). They follow SQL's three-valued logic, None being unknown, so that
+expressions match in memory exactly the rows they match in the database.
+"""
+
+import re
+from collections.abc import Iterable
+
+
+def like_to_regex(pattern: str, ignore_case: bool = False) -> re.Pattern:
+    """Translates a SQL `LIKE` pattern to a regular expression matched with `fullmatch`.
+
+    Like Postgres, a backslash escapes the next character, so `\\%` and `\\_` match
+    themselves.
+    """
+    regex = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            regex.append(re.escape(char))
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == "%":
+            regex.append(".*")
+        elif char == "_":
+            regex.append(".")
+        else:
+            regex.append(re.escape(char))
+    return re.compile("".join(regex), re.DOTALL | (re.IGNORECASE if ignore_case else 0))
+
+
+def sql_and(values: Iterable[bool | None]) -> bool | None:
+    """SQL `AND`: false if any value is false, otherwise unknown if any value is unknown."""
+    result = True
+    for value in values:
+        if value is False:
+            return False
+        if value is None:
+            result = None
+    return result
+
+
+def sql_or(values: Iterable[bool | None]) -> bool | None:
+    """SQL `OR`: true if any value is true, otherwise unknown if any value is unknown."""
+    result = False
+    for value in values:
+        if value is True:
+            return True
+        if value is None:
+            result = None
+    return result
+
+
+def sql_not(value: bool | None) -> bool | None:
+    """SQL `NOT`: the negation of a value, unknown stays unknown."""
+    return None if value is None else not value
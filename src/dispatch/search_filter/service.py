@@ -7,6 +7,9 @@ from dispatch.project import service as project_service
 
 from .models import SearchFilter, SearchFilterCreate, SearchFilterUpdate
 
+# the maximum number of ids sent in a single `IN (...)` clause when matching in bulk
+MATCH_MANY_CHUNK_SIZE = 1000
+
 
 def get(*, db_session, search_filter_id: int) -> SearchFilter | None:
     """Gets a search filter by id."""
@@ -39,6 +42,50 @@ def match(*, db_session, subject: str, filter_spec: list[dict], class_instance:
     return query.filter(model_cls.id == class_instance.id).one_or_none()
 
 
+def match_many(
+    *, db_session, subject: str, filter_spec: list[dict], class_instances: list[Base]
+) -> set[int]:
+    """Matches many class instances with a given search filter, returning the ids of the matches.
+
+    Issues a single query per chunk of instances instead of one query per instance.
+    """
+    class_instances = [i for i in class_instances if get_table_name_by_class_instance(i) == subject]
+
+    # this filter doesn't apply to any of the class instances
+    if not class_instances:
+        return set()
+
+    model_cls = get_class_by_tablename(subject)
+    ids = list({i.id for i in class_instances})
+
+    matched_ids = set()
+    for start in range(0, len(ids), MATCH_MANY_CHUNK_SIZE):
+        query = db_session.query(model_cls)
+        query = apply_filter_specific_joins(model_cls, filter_spec, query)
+        query = apply_filters(query, filter_spec)
+        query = query.filter(model_cls.id.in_(ids[start : start + MATCH_MANY_CHUNK_SIZE]))
+        matched_ids.update(row.id for row in query.with_entities(model_cls.id).distinct())
+    return matched_ids
+
+
+def match_all(
+    *, db_session, search_filters: list[SearchFilter], class_instances: list[Base]
+) -> dict[int, set[int]]:
+    """Matches class instances against many search filters.
+
+    Returns a mapping of search filter id to the ids of the matching class instances.
+    """
+    return {
+        search_filter.id: match_many(
+            db_session=db_session,
+            subject=search_filter.subject,
+            filter_spec=search_filter.expression,
+            class_instances=class_instances,
+        )
+        for search_filter in search_filters
+    }
+
+
 def get_or_create(*, db_session, search_filter_in) -> SearchFilter:
     if search_filter_in.id:
         q = db_session.query(SearchFilter).filter(SearchFilter.id == search_filter_in.id)
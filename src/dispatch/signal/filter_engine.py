@@ -0,0 +1,327 @@
+"""
+In-process evaluation of signal filter expressions.
+
+Signal filter expressions are sqlalchemy-filters style specs that are normally
+applied as SQL. Evaluating them for every incoming signal instance costs a query
+per filter, so we compile each expression once into a Python predicate and
+evaluate it against the instance (and the entities) that are already loaded.
+Expressions we can't faithfully evaluate compile to `None` and callers fall back
+to SQL.
+
+The predicates follow SQL three-valued logic: comparisons against NULL are
+unknown, and only rows that evaluate to true match.
+"""
+
+import json
+import threading
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import NamedTuple
+
+from cachetools import LRUCache
+
+from dispatch.entity.models import Entity
+from dispatch.entity_type.models import EntityType
+from dispatch.search_filter.evaluation import like_to_regex, sql_and, sql_not, sql_or
+
+from .models import SignalFilter, SignalInstance
+
+# filter spec models and the row attribute holding their instance
+SUPPORTED_MODELS = {
+    "SignalInstance": "signal_instance",
+    "Entity": "entity",
+    "EntityType": "entity_type",
+}
+ENTITY_MODELS = ("Entity", "EntityType")
+
+
+class FilterNotCompilable(Exception):
+    """Raised when an expression can't be evaluated in Python."""
+
+
+class FilterRow(NamedTuple):
+    """A row of the `signal_instance LEFT JOIN entity LEFT JOIN entity_type` relation."""
+
+    signal_instance: SignalInstance
+    entity: Entity | None = None
+    entity_type: EntityType | None = None
+
+
+Predicate = Callable[[FilterRow], bool | None]
+
+
+def _coerce(attribute, value):
+    """Coerces a filter value to the python type of the attribute it's compared with."""
+    if attribute is None or value is None or type(attribute) is type(value):
+        return value
+    if isinstance(attribute, bool):
+        if isinstance(value, str):
+            return value.lower() in ("true", "t", "1", "yes")
+        return bool(value)
+    if isinstance(attribute, str):
+        if isinstance(value, (int, float)):
+            return str(value)
+        raise FilterNotCompilable(f"Can't compare {type(attribute)} with {type(value)}")
+    if isinstance(attribute, (int, float)) and isinstance(value, (int, float)):
+        return value
+    if isinstance(attribute, datetime):
+        # timezone handling differs between python and postgres, let the database decide
+        raise FilterNotCompilable("Datetime comparisons are evaluated in SQL")
+    if isinstance(value, str):
+        try:
+            return type(attribute)(value)
+        except (TypeError, ValueError):
+            raise FilterNotCompilable(f"Can't coerce {value!r} to {type(attribute)}") from None
+    raise FilterNotCompilable(f"Can't compare {type(attribute)} with {type(value)}")
+
+
+def _compare(function: Callable) -> Callable:
+    def apply(attribute, value):
+        if attribute is None or value is None:
+            return None
+        return function(attribute, _coerce(attribute, value))
+
+    return apply
+
+
+def _contains(attribute, values):
+    if attribute is None:
+        return None
+    coerced = [_coerce(attribute, v) for v in values if v is not None]
+    if attribute in coerced:
+        return True
+    # `x IN (a, NULL)` is unknown rather than false when x isn't found
+    return None if len(coerced) != len(values) else False
+
+
+def _not_contains(attribute, values):
+    result = _contains(attribute, values)
+    return None if result is None else not result
+
+
+def _equals(attribute, value):
+    # sqlalchemy renders `== None` as `IS NULL`
+    if value is None:
+        return attribute is None
+    return _compare(lambda a, v: a == v)(attribute, value)
+
+
+def _not_equals(attribute, value):
+    if value is None:
+        return attribute is not None
+    return _compare(lambda a, v: a != v)(attribute, value)
+
+
+UNARY_OPERATORS = {
+    "is_null": lambda a: a is None,
+    "is_not_null": lambda a: a is not None,
+}
+
+BINARY_OPERATORS = {
+    "==": _equals,
+    "eq": _equals,
+    "!=": _not_equals,
+    "ne": _not_equals,
+    ">": _compare(lambda a, v: a > v),
+    "gt": _compare(lambda a, v: a > v),
+    "<": _compare(lambda a, v: a < v),
+    "lt": _compare(lambda a, v: a < v),
+    ">=": _compare(lambda a, v: a >= v),
+    "ge": _compare(lambda a, v: a >= v),
+    "<=": _compare(lambda a, v: a <= v),
+    "le": _compare(lambda a, v: a <= v),
+    "in": _contains,
+    "not_in": _not_contains,
+}
+
+LIKE_OPERATORS = {
+    "like": (False, False),
+    "ilike": (True, False),
+    "not_ilike": (True, True),
+}
+
+
+def _compile_leaf(spec: dict) -> tuple[Predicate, set[str]]:
+    field = spec.get("field")
+    model = spec.get("model", "SignalInstance")
+    op = spec.get("op") or "=="
+
+    if not isinstance(field, str) or model not in SUPPORTED_MODELS:
+        raise FilterNotCompilable(f"Unsupported filter: {spec}")
+
+    row_attribute = SUPPORTED_MODELS[model]
+
+    def get_attribute(row: FilterRow):
+        instance = getattr(row, row_attribute)
+        # the columns of an outer joined entity that's missing are NULL
+        if instance is None:
+            return None
+        try:
+            return getattr(instance, field)
+        except AttributeError:
+            raise FilterNotCompilable(f"{model} has no attribute {field}") from None
+
+    if op in UNARY_OPERATORS:
+        function = UNARY_OPERATORS[op]
+        return (lambda row: function(get_attribute(row))), {model}
+
+    if "value" not in spec:
+        raise FilterNotCompilable(f"Filter is missing a value: {spec}")
+    value = spec["value"]
+
+    if op in BINARY_OPERATORS:
+        if op in ("in", "not_in") and not isinstance(value, (list, tuple)):
+            raise FilterNotCompilable(f"`{op}` requires a list of values: {spec}")
+        function = BINARY_OPERATORS[op]
+        return (lambda row: function(get_attribute(row), value)), {model}
+
+    if op in LIKE_OPERATORS:
+        if not isinstance(value, str):
+            raise FilterNotCompilable(f"`{op}` requires a string pattern: {spec}")
+        ignore_case, negate = LIKE_OPERATORS[op]
+        regex = like_to_regex(value, ignore_case)
+
+        def like(row: FilterRow):
+            attribute = get_attribute(row)
+            if attribute is None:
+                return None
+            return bool(regex.fullmatch(str(attribute))) != negate
+
+        return like, {model}
+
+    raise FilterNotCompilable(f"Unsupported operator `{op}`")
+
+
+def _and(predicates: list[Predicate]) -> Predicate:
+    return lambda row: sql_and(predicate(row) for predicate in predicates)
+
+
+def _or(predicates: list[Predicate]) -> Predicate:
+    return lambda row: sql_or(predicate(row) for predicate in predicates)
+
+
+def _not(predicate: Predicate) -> Predicate:
+    return lambda row: sql_not(predicate(row))
+
+
+def _compile(spec) -> tuple[list[Predicate], set[str]]:
+    """Mirrors `dispatch.database.service.build_filters`, nested lists are flattened."""
+    if isinstance(spec, (list, tuple)):
+        predicates, models = [], set()
+        for item in spec:
+            item_predicates, item_models = _compile(item)
+            predicates.extend(item_predicates)
+            models |= item_models
+        return predicates, models
+
+    if not isinstance(spec, dict):
+        raise FilterNotCompilable(f"Filter spec {spec} should be a dictionary")
+
+    for key in ("or", "and", "not"):
+        if key in spec:
+            arguments, models = _compile(spec[key])
+            if not arguments or (key == "not" and len(arguments) != 1):
+                raise FilterNotCompilable(f"Invalid arguments for `{key}`")
+            if key == "or":
+                return [_or(arguments)], models
+            if key == "and":
+                return [_and(arguments)], models
+            return [_not(arguments[0])], models
+
+    predicate, models = _compile_leaf(spec)
+    return [predicate], models
+
+
+class CompiledSignalFilter:
+    """A signal filter expression compiled into a Python predicate."""
+
+    def __init__(self, predicate: Predicate, models: set[str]):
+        self.predicate = predicate
+        self.models = frozenset(models)
+
+    @property
+    def references_entities(self) -> bool:
+        """Whether the expression filters on entities or entity types."""
+        return bool(self.models & set(ENTITY_MODELS))
+
+    @property
+    def references_signal_instance(self) -> bool:
+        """Whether the expression filters on signal instance columns."""
+        return "SignalInstance" in self.models
+
+    def _rows(self, signal_instance: SignalInstance) -> Iterable[FilterRow]:
+        if not self.references_entities:
+            yield FilterRow(signal_instance)
+            return
+        # entities are outer joined, an instance without entities has a single row
+        # with NULL entity columns
+        if not signal_instance.entities:
+            yield FilterRow(signal_instance)
+            return
+        for entity in signal_instance.entities:
+            yield FilterRow(signal_instance, entity, entity.entity_type)
+
+    def matches(self, signal_instance: SignalInstance) -> bool:
+        """Whether the signal instance matches the expression.
+
+        Raises:
+            FilterNotCompilable: If a value can't be compared in Python.
+        """
+        return any(self.predicate(row) is True for row in self._rows(signal_instance))
+
+    def matching_entities(self, signal_instance: SignalInstance) -> list[Entity]:
+        """Returns the entities of the signal instance that match the expression.
+
+        Raises:
+            FilterNotCompilable: If a value can't be compared in Python.
+        """
+        return [
+            row.entity
+            for row in self._rows(signal_instance)
+            if row.entity is not None and self.predicate(row) is True
+        ]
+
+
+def compile_expression(expression) -> CompiledSignalFilter | None:
+    """Compiles a filter expression, returns None if it has to be evaluated in SQL."""
+    if not expression:
+        return None
+    try:
+        predicates, models = _compile(expression)
+    except FilterNotCompilable:
+        return None
+    return CompiledSignalFilter(_and(predicates), models)
+
+
+class SignalFilterCache:
+    """Caches compiled signal filter expressions.
+
+    Entries are keyed by filter id and the serialized expression, so edited
+    filters are recompiled without explicit invalidation.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._cache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, signal_filter: SignalFilter) -> CompiledSignalFilter | None:
+        """Returns the compiled expression of a signal filter."""
+        key = (
+            signal_filter.id,
+            json.dumps(signal_filter.expression, sort_keys=True, default=str),
+        )
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+
+        compiled = compile_expression(signal_filter.expression)
+        with self._lock:
+            self._cache[key] = compiled
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+signal_filter_cache = SignalFilterCache()
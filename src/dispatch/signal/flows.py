@@ -1,5 +1,7 @@
 import logging
+import socket
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import timedelta
 
 from cachetools import TTLCache
@@ -13,14 +15,16 @@ from dispatch.case import flows as case_flows
 from dispatch.case import service as case_service
 from dispatch.case.enums import CaseStatus
 from dispatch.case.models import CaseCreate
-from dispatch.database.core import get_organization_session, get_session
+from dispatch.database.core import engine, get_organization_session, get_session
 from dispatch.entity import service as entity_service
+from dispatch.entity.extractor import EntityExtractor
 from dispatch.entity_type import service as entity_type_service
 from dispatch.entity_type.models import EntityScopeEnum
 from dispatch.enums import Visibility
 from dispatch.exceptions import DispatchException
 from dispatch.individual.models import IndividualContactRead
 from dispatch.messaging.strings import CASE_RESOLUTION_DEFAULT
+from dispatch.metrics import provider as metrics_provider
 from dispatch.organization.service import get_all as get_all_organizations
 from dispatch.participant.models import ParticipantUpdate
 from dispatch.plugin import service as plugin_service
@@ -37,15 +41,24 @@ log = logging.getLogger(__name__)
 # Constants for signal processing
 BATCH_SIZE = 50  # Process signals in batches of 50
 LOOP_DELAY = 60  # seconds
+WORKER_BUSY_DELAY = 1  # seconds between passes of a pool worker that found work
 MAX_PROCESSING_TIME = (
     300  # Maximum time to process signals before refreshing organization list (5 minutes)
 )
 
 
+def get_global_entity_extractor(db_session: Session) -> EntityExtractor:
+    """Returns an extractor for the entity types associated with all signal definitions."""
+    return entity_service.get_entity_extractor(
+        entity_type_service.get_all(db_session=db_session, scope=EntityScopeEnum.all).all()
+    )
+
+
 def signal_instance_create_flow(
     signal_instance_id: int,
     db_session: Session = None,
     current_user: DispatchUser = None,
+    global_entity_extractor: EntityExtractor | None = None,
 ):
     """Create flow used by the API."""
     signal_instance = signal_service.get_signal_instance(
@@ -55,16 +68,19 @@ def signal_instance_create_flow(
         log.error("signal_instance is None for id: %%s", signal_instance_id)
         return None
     # fetch `all` entities that should be associated with all signal definitions
-    entity_types = entity_type_service.get_all(
-        db_session=db_session, scope=EntityScopeEnum.all
-    ).all()
-    entity_types = signal_instance.signal.entity_types + entity_types
+    if global_entity_extractor is None:
+        global_entity_extractor = get_global_entity_extractor(db_session=db_session)
 
-    if entity_types:
+    entity_extractor = (
+        entity_service.get_entity_extractor(signal_instance.signal.entity_types)
+        + global_entity_extractor
+    )
+
+    if entity_extractor:
         entities = entity_service.find_entities(
             db_session=db_session,
             signal_instance=signal_instance,
-            entity_types=entity_types,
+            extractor=entity_extractor,
         )
         signal_instance.entities = entities
         db_session.commit()
@@ -371,11 +387,15 @@ def process_signal_batch(db_session: Session, signal_instance_ids: list[int]) ->
         db_session (Session): The database session.
         signal_instance_ids (list[int]): List of signal instance IDs to process.
     """
+    # entity types scoped to all signals are shared by every instance in the batch
+    global_entity_extractor = get_global_entity_extractor(db_session=db_session)
+
     for signal_instance_id in signal_instance_ids:
         try:
             signal_flows.signal_instance_create_flow(
                 db_session=db_session,
                 signal_instance_id=signal_instance_id,
+                global_entity_extractor=global_entity_extractor,
             )
             # Commit after each successful processing to ensure progress is saved
             db_session.commit()
@@ -420,6 +440,114 @@ def process_organization_signals(organization_slug: str) -> None:
         log.exception(f"Error processing signals for organization {organization_slug}: {e}")
 
 
+def claim_and_process_organization_signals(organization_slug: str, limit: int = 500) -> int:
+    """Claims a disjoint batch of unprocessed signals for an organization and processes it.
+
+    Safe to run concurrently from many workers and pods; see
+    `signal_service.claim_unprocessed_signal_instance_ids`.
+
+    Args:
+        organization_slug (str): The slug of the organization whose signals need to be processed.
+        limit (int): The maximum number of signals to claim.
+
+    Returns:
+        int: The number of signals processed.
+    """
+    schema_engine = engine.execution_options(
+        schema_translate_map={
+            None: f"dispatch_organization_{organization_slug}",
+        }
+    )
+    with schema_engine.connect() as claim_connection:
+        try:
+            signal_instance_ids = signal_service.claim_unprocessed_signal_instance_ids(
+                claim_connection, limit=limit
+            )
+            if not signal_instance_ids:
+                return 0
+
+            with get_organization_session(organization_slug) as db_session:
+                for i in range(0, len(signal_instance_ids), BATCH_SIZE):
+                    process_signal_batch(db_session, signal_instance_ids[i : i + BATCH_SIZE])
+            return len(signal_instance_ids)
+        finally:
+            signal_service.release_signal_instance_claims(claim_connection)
+
+
+def worker_processing_loop(worker_id: str, limit: int = 500) -> None:
+    """Processing loop run by each worker of the signal processing pool.
+
+    Every pass claims one batch per organization, so a slow organization only holds
+    up the worker processing it. Workers only sleep when a pass finds no work.
+
+    Args:
+        worker_id (str): An identifier for the worker, used to tag metrics.
+        limit (int): The maximum number of signals to claim per organization per pass.
+    """
+    while True:
+        processed = 0
+        try:
+            with get_session() as session:
+                organization_slugs = [o.slug for o in get_all_organizations(db_session=session)]
+
+            for organization_slug in organization_slugs:
+                tags = {"worker": worker_id, "organization": organization_slug}
+                start = time.perf_counter()
+                try:
+                    count = claim_and_process_organization_signals(organization_slug, limit=limit)
+                except Exception as e:
+                    log.exception(
+                        f"Worker {worker_id} failed processing signals for {organization_slug}: {e}"
+                    )
+                    metrics_provider.counter("signal.processing.worker.error", tags=tags)
+                    continue
+
+                if count:
+                    elapsed = time.perf_counter() - start
+                    processed += count
+                    metrics_provider.counter(
+                        "signal.processing.worker.processed", value=count, tags=tags
+                    )
+                    metrics_provider.timer(
+                        "signal.processing.worker.batch.elapsed", value=elapsed, tags=tags
+                    )
+                    metrics_provider.gauge(
+                        "signal.processing.worker.throughput", value=count / elapsed, tags=tags
+                    )
+        except Exception as e:
+            log.exception(f"Error in signal processing worker {worker_id}: {e}")
+
+        time.sleep(WORKER_BUSY_DELAY if processed else LOOP_DELAY)
+
+
+def _init_worker_process() -> None:
+    """Drops pooled connections inherited from the parent process."""
+    engine.dispose(close=False)
+
+
+def parallel_processing_loop(num_workers: int, worker_type: str = "thread", limit: int = 500):
+    """Runs `num_workers` signal processing workers in a thread or process pool.
+
+    Args:
+        num_workers (int): The number of workers to run.
+        worker_type (str): Either `thread` or `process`.
+        limit (int): The maximum number of signals a worker claims per organization per pass.
+    """
+    if worker_type == "process":
+        executor = ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker_process)
+    else:
+        executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="signal-worker")
+
+    hostname = socket.gethostname()
+    with executor:
+        futures = [
+            executor.submit(worker_processing_loop, f"{hostname}-{i}", limit)
+            for i in range(num_workers)
+        ]
+        for future in futures:
+            future.result()
+
+
 def main_processing_loop() -> None:
     """Main processing loop that iterates through all organizations and processes their signals.
 
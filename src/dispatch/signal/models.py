@@ -8,6 +8,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     PrimaryKeyConstraint,
     String,
@@ -19,6 +20,7 @@ from sqlalchemy.orm import relationship
 from sqlalchemy_utils import TSVectorType
 
 from dispatch.auth.models import DispatchUser
+from dispatch.config import SIGNAL_INSTANCE_BULK_CREATE_MAX_SIZE
 from dispatch.case.models import CaseReadMinimal
 from dispatch.case.priority.models import CasePriority, CasePriorityRead
 from dispatch.case.type.models import CaseType, CaseTypeRead
@@ -83,6 +85,7 @@ assoc_signal_instance_entities = Table(
     ),
     Column("entity_id", Integer, ForeignKey("entity.id", ondelete="CASCADE")),
     PrimaryKeyConstraint("signal_instance_id", "entity_id"),
+    Index("ix_assoc_signal_instance_entities_entity_id", "entity_id", "signal_instance_id"),
 )
 
 assoc_signal_entity_types = Table(
@@ -218,6 +221,11 @@ class SignalFilter(Base, ProjectMixin, EvergreenMixin, TimeStampMixin):
 class SignalInstance(Base, TimeStampMixin, ProjectMixin):
     """Class that represents a detection alert and its properties."""
 
+    __table_args__ = (
+        # used by the deduplication window lookups
+        Index("ix_signal_instance_signal_id_created_at", "signal_id", "created_at"),
+    )
+
     id = Column(UUID(as_uuid=True), primary_key=True, default=lambda: str(uuid.uuid4()))
     case = relationship("Case", backref="signal_instances")
     case_id = Column(Integer, ForeignKey("case.id", ondelete="CASCADE"))
@@ -413,5 +421,26 @@ class SignalInstanceRead(SignalInstanceBase):
 class SignalInstancePagination(Pagination):
     items: list[SignalInstanceRead]
 
+
+class SignalInstanceBulkCreateStatus(DispatchEnum):
+    created = "Created"
+    duplicate = "Duplicate"
+    failed = "Failed"
+
+
+class SignalInstanceBulkCreate(DispatchBase):
+    instances: list[SignalInstanceCreate] = Field(max_length=SIGNAL_INSTANCE_BULK_CREATE_MAX_SIZE)
+
+
+class SignalInstanceBulkCreateResult(DispatchBase):
+    id: str | None = None
+    status: SignalInstanceBulkCreateStatus
+    msg: str | None = None
+    signal: SignalRead | None = None
+
+
+class SignalInstanceBulkCreateRead(DispatchBase):
+    items: list[SignalInstanceBulkCreateResult]
+
 # Update forward references
 SignalFilterRead.model_rebuild()
@@ -5,11 +5,12 @@ from datetime import datetime, timedelta, timezone
 from collections import defaultdict
 from fastapi import HTTPException, status
 from pydantic import ValidationError
-from sqlalchemy import asc, desc, or_, func, and_, select, cast
+from sqlalchemy import String, asc, desc, or_, func, and_, select, cast
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.query import Query
-from sqlalchemy.sql.expression import true
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql.expression import column, table, true
+from sqlalchemy.dialects.postgresql import JSONB, OID, insert
 
 from dispatch.auth.models import DispatchUser
 from dispatch.case.models import Case
@@ -31,6 +32,7 @@ from .exceptions import (
     SignalNotDefinedException,
     SignalNotIdentifiedException,
 )
+from .filter_engine import FilterNotCompilable, signal_filter_cache
 from .models import (
     assoc_signal_instance_entities,
     Signal,
@@ -46,6 +48,8 @@ from .models import (
     SignalFilterRead,
     SignalFilterUpdate,
     SignalInstance,
+    SignalInstanceBulkCreateResult,
+    SignalInstanceBulkCreateStatus,
     SignalInstanceCreate,
     SignalStats,
     SignalUpdate,
@@ -722,6 +726,219 @@ def create_instance(
     return signal_instance
 
 
+# the maximum number of rows sent in a single bulk `INSERT ... ON CONFLICT DO NOTHING`
+BULK_INSERT_CHUNK_SIZE = 500
+
+
+def _resolve_signal_definition(
+    *, db_session: Session, project_id: int, signal_instance_in: SignalInstanceCreate
+) -> Signal:
+    """Resolves the signal definition of an instance the same way `create_signal_instance` does."""
+    if signal_instance_in.signal:
+        return get(db_session=db_session, signal_id=signal_instance_in.signal.id)
+
+    external_id = signal_instance_in.external_id
+
+    # this assumes the external_ids are uuids
+    if not external_id:
+        msg = "A detection external id must be provided in order to get the signal definition."
+        raise SignalNotIdentifiedException(msg)
+
+    signal_definition = (
+        db_session.query(Signal).filter(Signal.external_id == external_id).one_or_none()
+    )
+
+    if not signal_definition:
+        # we get the default signal definition
+        signal_definition = get_default(db_session=db_session, project_id=project_id)
+        msg = f"Default signal definition used for signal instance with external id {external_id}"
+        log.warn(msg)
+
+    if not signal_definition:
+        msg = f"No signal definition could be found by external id {external_id}, and no default exists."
+        raise SignalNotDefinedException(msg)
+
+    return signal_definition
+
+
+def _insert_instance_rows(*, db_session: Session, rows: list[dict]) -> set[str]:
+    """Inserts signal instance rows, skipping existing ids, and returns the inserted ids."""
+    statement = (
+        insert(SignalInstance)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=[SignalInstance.id])
+        .returning(SignalInstance.id)
+    )
+    return {str(id) for id in db_session.execute(statement).scalars()}
+
+
+def create_instances_bulk(
+    *, db_session: Session, signal_instances_in: list[SignalInstanceCreate]
+) -> list[SignalInstanceBulkCreateResult]:
+    """Creates many signal instances at once.
+
+    Projects, signal definitions and case attributes are resolved once per batch,
+    existing ids are looked up with a single query and new rows are written with
+    `INSERT ... ON CONFLICT DO NOTHING`. Chunks the database rejects are retried row by
+    row in savepoints. One result is returned per input instance, in order, so callers
+    can report partial failures.
+    """
+    results: list[SignalInstanceBulkCreateResult | None] = [None] * len(signal_instances_in)
+    rows: dict[str, tuple[int, dict, Signal]] = {}
+
+    projects, signals, case_priorities, case_types, oncall_services = {}, {}, {}, {}, {}
+    now = datetime.now(timezone.utc)
+
+    for index, signal_instance_in in enumerate(signal_instances_in):
+        signal_instance_id = (signal_instance_in.raw or {}).get("id") or str(uuid.uuid4())
+        try:
+            if not is_valid_uuid(signal_instance_id):
+                raise ValueError(
+                    f"Invalid signal id format. Expecting UUIDv4 format. Signal id: {signal_instance_id}."
+                )
+            signal_instance_id = str(uuid.UUID(str(signal_instance_id)))
+
+            project_key = signal_instance_in.project.name if signal_instance_in.project else None
+            if project_key not in projects:
+                projects[project_key] = project_service.get_by_name_or_default(
+                    db_session=db_session, project_in=signal_instance_in.project
+                )
+            project = projects[project_key]
+
+            signal_key = (
+                project.id,
+                signal_instance_in.signal.id if signal_instance_in.signal else None,
+                signal_instance_in.external_id,
+            )
+            if signal_key not in signals:
+                signals[signal_key] = _resolve_signal_definition(
+                    db_session=db_session,
+                    project_id=project.id,
+                    signal_instance_in=signal_instance_in,
+                )
+            signal = signals[signal_key]
+
+            # remove non-serializable entities from the raw JSON
+            raw = signal_instance_in.raw.copy()
+            if signal_instance_in.oncall_service:
+                raw.pop("oncall_service", None)
+
+            row = {
+                "id": uuid.UUID(signal_instance_id),
+                "canary": signal_instance_in.canary,
+                "conversation_target": signal_instance_in.conversation_target,
+                "filter_action": signal_instance_in.filter_action,
+                "raw": json.loads(json.dumps(raw)),
+                "project_id": project.id,
+                "signal_id": signal.id,
+                "case_priority_id": None,
+                "case_type_id": None,
+                "oncall_service_id": None,
+                "created_at": signal_instance_in.created_at or now,
+                "updated_at": now,
+            }
+
+            if signal_instance_in.case_priority:
+                key = (project.id, signal_instance_in.case_priority.name)
+                if key not in case_priorities:
+                    case_priorities[key] = case_priority_service.get_by_name_or_default(
+                        db_session=db_session,
+                        project_id=project.id,
+                        case_priority_in=signal_instance_in.case_priority,
+                    )
+                row["case_priority_id"] = getattr(case_priorities[key], "id", None)
+
+            if signal_instance_in.case_type:
+                key = (project.id, signal_instance_in.case_type.name)
+                if key not in case_types:
+                    case_types[key] = case_type_service.get_by_name_or_default(
+                        db_session=db_session,
+                        project_id=project.id,
+                        case_type_in=signal_instance_in.case_type,
+                    )
+                row["case_type_id"] = getattr(case_types[key], "id", None)
+
+            if signal_instance_in.oncall_service:
+                key = (project.id, signal_instance_in.oncall_service.name)
+                if key not in oncall_services:
+                    oncall_services[key] = service_service.get_by_name(
+                        db_session=db_session,
+                        project_id=project.id,
+                        name=signal_instance_in.oncall_service.name,
+                    )
+                row["oncall_service_id"] = getattr(oncall_services[key], "id", None)
+        except Exception as e:
+            log.warning(f"Unable to create signal instance {signal_instance_id}: {e}")
+            results[index] = SignalInstanceBulkCreateResult(
+                id=str(signal_instance_id),
+                status=SignalInstanceBulkCreateStatus.failed,
+                msg=str(e),
+            )
+            continue
+
+        if signal_instance_id in rows:
+            results[index] = SignalInstanceBulkCreateResult(
+                id=signal_instance_id,
+                status=SignalInstanceBulkCreateStatus.duplicate,
+                msg="A signal instance with this id is already part of the batch.",
+            )
+            continue
+
+        rows[signal_instance_id] = (index, row, signal)
+
+    if rows:
+        existing_ids = {
+            str(signal_instance_id)
+            for (signal_instance_id,) in db_session.query(SignalInstance.id).filter(
+                SignalInstance.id.in_([row["id"] for _, row, _ in rows.values()])
+            )
+        }
+        new_rows = [row for id, (_, row, _) in rows.items() if id not in existing_ids]
+
+        inserted_ids, failed_ids = set(), {}
+        for start in range(0, len(new_rows), BULK_INSERT_CHUNK_SIZE):
+            chunk = new_rows[start : start + BULK_INSERT_CHUNK_SIZE]
+            try:
+                with db_session.begin_nested():
+                    inserted_ids.update(_insert_instance_rows(db_session=db_session, rows=chunk))
+            except Exception as e:
+                # a single bad row fails the whole statement, we retry the rows one by one
+                # so that only the rows the database rejects are reported as failed
+                log.warning(f"Unable to bulk insert {len(chunk)} signal instances: {e}")
+                for row in chunk:
+                    try:
+                        with db_session.begin_nested():
+                            inserted_ids.update(
+                                _insert_instance_rows(db_session=db_session, rows=[row])
+                            )
+                    except Exception as e:
+                        log.warning(f"Unable to create signal instance {row['id']}: {e}")
+                        failed_ids[str(row["id"])] = str(e)
+
+        for signal_instance_id, (index, _, signal) in rows.items():
+            if signal_instance_id in failed_ids:
+                results[index] = SignalInstanceBulkCreateResult(
+                    id=signal_instance_id,
+                    status=SignalInstanceBulkCreateStatus.failed,
+                    msg=failed_ids[signal_instance_id],
+                )
+            elif signal_instance_id in inserted_ids:
+                results[index] = SignalInstanceBulkCreateResult(
+                    id=signal_instance_id,
+                    status=SignalInstanceBulkCreateStatus.created,
+                    signal=signal,
+                )
+            else:
+                results[index] = SignalInstanceBulkCreateResult(
+                    id=signal_instance_id,
+                    status=SignalInstanceBulkCreateStatus.duplicate,
+                    msg="A signal instance with this id already exists.",
+                    signal=signal,
+                )
+
+    return results
+
+
 def update_instance(
     *, db_session: Session, signal_instance_in: SignalInstanceCreate
 ) -> SignalInstance:
@@ -739,6 +956,103 @@ def update_instance(
     return signal_instance
 
 
+def _matches_snooze_filter(
+    *, db_session: Session, signal_instance: SignalInstance, signal_filter: SignalFilter
+) -> bool:
+    """Whether the signal instance matches the expression of a snooze filter.
+
+    The expression is evaluated in Python against the instance and its loaded entities,
+    expressions that can't be compiled are evaluated in SQL.
+    """
+    compiled = signal_filter_cache.get(signal_filter)
+    if compiled:
+        try:
+            return compiled.matches(signal_instance)
+        except FilterNotCompilable:
+            pass
+
+    query = db_session.query(SignalInstance).filter(
+        SignalInstance.signal_id == signal_instance.signal_id
+    )
+    query = apply_filter_specific_joins(SignalInstance, signal_filter.expression, query)
+    query = apply_filters(query, signal_filter.expression)
+    return bool(query.filter(SignalInstance.id == signal_instance.id).all())
+
+
+# sentinel distinguishing "no duplicate found" from a duplicate that has no case yet
+_NO_MATCH = object()
+
+
+def _find_dedup_case_id(
+    *,
+    db_session: Session,
+    signal_instance: SignalInstance,
+    signal_filter: SignalFilter,
+    window: datetime,
+):
+    """Returns the case of the earliest instance the signal instance is a duplicate of.
+
+    A duplicate is an earlier instance of the same signal, created within the window, that
+    shares an entity matching the filter expression. When the expression only filters on
+    entities we select the matching entities in Python and only the window lookup goes to
+    the database; other expressions are evaluated in SQL.
+
+    Returns `_NO_MATCH` if the signal instance isn't a duplicate.
+    """
+    compiled = signal_filter_cache.get(signal_filter)
+    entity_ids = None
+    if compiled and not compiled.references_signal_instance:
+        try:
+            entity_ids = [e.id for e in compiled.matching_entities(signal_instance)]
+        except FilterNotCompilable:
+            entity_ids = None
+
+    if entity_ids is not None:
+        if not entity_ids:
+            return _NO_MATCH
+
+        instance = (
+            db_session.query(SignalInstance.case_id)
+            .join(
+                assoc_signal_instance_entities,
+                assoc_signal_instance_entities.c.signal_instance_id == SignalInstance.id,
+            )
+            .filter(
+                assoc_signal_instance_entities.c.entity_id.in_(entity_ids),
+                SignalInstance.signal_id == signal_instance.signal_id,
+                ~SignalInstance.canary,  # Ignore canary signals in deduplication
+                SignalInstance.created_at >= window,
+                SignalInstance.id != signal_instance.id,
+            )
+            .order_by(asc(SignalInstance.created_at))
+            .first()
+        )
+        return instance.case_id if instance else _NO_MATCH
+
+    query = db_session.query(SignalInstance).filter(
+        SignalInstance.signal_id == signal_instance.signal_id,
+        ~SignalInstance.canary,  # Ignore canary signals in deduplication
+    )
+    # First join entities
+    query = query.join(SignalInstance.entities)
+
+    # Then join entity_type through entities
+    query = query.join(Entity.entity_type)
+
+    # Now apply filters
+    query = apply_filters(query, signal_filter.expression)
+
+    query = query.filter(SignalInstance.created_at >= window)
+    query = query.join(SignalInstance.entities).filter(
+        Entity.id.in_([e.id for e in signal_instance.entities])
+    )
+    query = query.filter(SignalInstance.id != signal_instance.id)
+
+    # get the earliest instance
+    instance = query.order_by(asc(SignalInstance.created_at)).first()
+    return instance.case_id if instance else _NO_MATCH
+
+
 def filter_snooze(*, db_session: Session, signal_instance: SignalInstance) -> SignalInstance:
     """
     Apply snooze filter actions to the signal instance.
@@ -772,19 +1086,14 @@ def filter_snooze(*, db_session: Session, signal_instance: SignalInstance) -> Si
         if f.expiration.replace(tzinfo=timezone.utc) <= datetime.now(timezone.utc):
             continue
 
-        query = db_session.query(SignalInstance).filter(
-            SignalInstance.signal_id == signal_instance.signal_id
-        )
-        query = apply_filter_specific_joins(SignalInstance, f.expression, query)
-        query = apply_filters(query, f.expression)
         # an expression is not required for snoozing, if absent we snooze regardless of entity
-        if f.expression:
-            instances = query.filter(SignalInstance.id == signal_instance.id).all()
+        if not f.expression:
+            signal_instance.filter_action = SignalFilterAction.snooze
+            break
 
-            if instances:
-                signal_instance.filter_action = SignalFilterAction.snooze
-                break
-        else:
+        if _matches_snooze_filter(
+            db_session=db_session, signal_instance=signal_instance, signal_filter=f
+        ):
             signal_instance.filter_action = SignalFilterAction.snooze
             break
 
@@ -834,33 +1143,14 @@ def filter_dedup(*, db_session: Session, signal_instance: SignalInstance) -> Sig
         if f.action != SignalFilterAction.deduplicate:
             continue
 
-        query = db_session.query(SignalInstance).filter(
-            SignalInstance.signal_id == signal_instance.signal_id,
-            ~SignalInstance.canary,  # Ignore canary signals in deduplication
-        )
-        # First join entities
-        query = query.join(SignalInstance.entities)
-
-        # Then join entity_type through entities
-        query = query.join(Entity.entity_type)
-
-        # Now apply filters
-        query = apply_filters(query, f.expression)
-
         window = datetime.now(timezone.utc) - timedelta(minutes=f.window)
-        query = query.filter(SignalInstance.created_at >= window)
-        query = query.join(SignalInstance.entities).filter(
-            Entity.id.in_([e.id for e in signal_instance.entities])
+        case_id = _find_dedup_case_id(
+            db_session=db_session, signal_instance=signal_instance, signal_filter=f, window=window
         )
-        query = query.filter(SignalInstance.id != signal_instance.id)
 
-        # get the earliest instance
-        query = query.order_by(asc(SignalInstance.created_at))
-        instances = query.all()
-
-        if instances:
+        if case_id is not _NO_MATCH:
             # associate with existing case
-            signal_instance.case_id = instances[0].case_id
+            signal_instance.case_id = case_id
             signal_instance.filter_action = SignalFilterAction.deduplicate
             break
 
@@ -920,6 +1210,76 @@ def get_unprocessed_signal_instance_ids(session: Session) -> list[int]:
     )
 
 
+# advisory lock class used to mark signal instances claimed by a processing worker
+SIGNAL_INSTANCE_CLAIM_LOCK_CLASS = 4040
+
+pg_locks = table(
+    "pg_locks",
+    column("locktype"),
+    column("classid"),
+    column("objid"),
+    column("objsubid"),
+    schema="pg_catalog",
+)
+
+
+def _signal_instance_claim_key(signal_instance_id):
+    """Returns the advisory lock key for a signal instance id (UUIDs don't fit in an int4)."""
+    return func.hashtext(cast(signal_instance_id, String))
+
+
+def claim_unprocessed_signal_instance_ids(
+    connection: Connection, limit: int = 500
+) -> list[uuid.UUID]:
+    """Claims a batch of unprocessed signal instances for the calling worker.
+
+    Candidate rows are selected with `FOR UPDATE SKIP LOCKED`, so concurrent workers
+    never pick the same rows, and each one is then held with a session-level advisory
+    lock on `connection`. Unlike row locks, advisory locks survive the commits made while
+    the instance is processed and don't block updates to the row. Claims are held until
+    `release_signal_instance_claims` is called or the connection is closed.
+
+    Args:
+        connection (Connection): A dedicated connection that holds the claims.
+        limit (int): The maximum number of signal instances to claim.
+
+    Returns:
+        list[uuid.UUID]: The IDs of the claimed signal instances.
+    """
+    claimed_by_other_worker = (
+        select(pg_locks.c.objid)
+        .where(pg_locks.c.locktype == "advisory")
+        .where(pg_locks.c.classid == SIGNAL_INSTANCE_CLAIM_LOCK_CLASS)
+        .where(pg_locks.c.objsubid == 2)
+        .where(pg_locks.c.objid == cast(_signal_instance_claim_key(SignalInstance.id), OID))
+        .exists()
+    )
+    candidates = (
+        select(SignalInstance.id)
+        .where(SignalInstance.filter_action == None)  # noqa
+        .where(SignalInstance.case_id == None)  # noqa
+        .where(~claimed_by_other_worker)
+        .order_by(SignalInstance.created_at.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True, of=SignalInstance)
+        .subquery()
+    )
+    claim = select(candidates.c.id).where(
+        func.pg_try_advisory_lock(
+            SIGNAL_INSTANCE_CLAIM_LOCK_CLASS, _signal_instance_claim_key(candidates.c.id)
+        )
+    )
+
+    with connection.begin():
+        return list(connection.execute(claim).scalars())
+
+
+def release_signal_instance_claims(connection: Connection) -> None:
+    """Releases all signal instance claims held by a connection."""
+    connection.execute(select(func.pg_advisory_unlock_all()))
+    connection.commit()
+
+
 def get_instances_in_case(db_session: Session, case_id: int) -> Query:
     """
     Retrieves signal instances associated with a given case.
@@ -16,7 +16,11 @@ from sqlalchemy.exc import IntegrityError
 from dispatch.auth.permissions import PermissionsDependency, SensitiveProjectActionPermission
 from dispatch.auth.service import CurrentUser
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    CursorParameters,
+    search_filter_sort_paginate,
+)
 from dispatch.models import OrganizationSlug, PrimaryKey
 from dispatch.project import service as project_service
 from dispatch.rate_limiter import limiter
@@ -32,6 +36,8 @@ from .models import (
     SignalFilterPagination,
     SignalFilterRead,
     SignalFilterUpdate,
+    SignalInstanceBulkCreate,
+    SignalInstanceBulkCreateRead,
     SignalInstanceCreate,
     SignalInstancePagination,
     SignalInstanceRead,
@@ -62,9 +68,9 @@ log = logging.getLogger(__name__)
 
 
 @router.get("/instances", response_model=SignalInstancePagination)
-def get_signal_instances(common: CommonParameters):
+def get_signal_instances(common: CommonParameters, cursor: CursorParameters):
     """Gets all signal instances."""
-    return search_filter_sort_paginate(model="SignalInstance", **common)
+    return search_filter_sort_paginate(model="SignalInstance", **common, **cursor)
 
 
 @router.post("/instances", response_model=SignalInstanceRead)
@@ -129,6 +135,23 @@ def create_signal_instance(
     return signal_instance
 
 
+@router.post("/instances/bulk", response_model=SignalInstanceBulkCreateRead)
+@limiter.limit("100/minute")
+def create_signal_instances_bulk(
+    db_session: DbSession,
+    organization: OrganizationSlug,
+    signal_instances_in: SignalInstanceBulkCreate,
+    request: Request,
+    response: Response,
+):
+    """Creates many signal instances at once, reporting the outcome of each one."""
+    results = signal_service.create_instances_bulk(
+        db_session=db_session, signal_instances_in=signal_instances_in.instances
+    )
+    db_session.commit()
+    return SignalInstanceBulkCreateRead(items=results)
+
+
 @router.get("/filters", response_model=SignalFilterPagination)
 def get_signal_filters(common: CommonParameters):
     """Gets all signal filters."""
@@ -6,12 +6,13 @@
 """
 
 import logging
-from collections import defaultdict
-from typing import Any
+import os
 import tempfile
-import pandas as pd
-from pandas.core.frame import DataFrame
+import threading
+from typing import Any
 
+import numpy as np
+from scipy import sparse
 from sqlalchemy.orm import Session
 
 from dispatch.tag import service as tag_service
@@ -19,121 +20,132 @@ from dispatch.tag import service as tag_service
 log = logging.getLogger(__name__)
 
 
-def save_model(dataframe: DataFrame, organization_slug: str, project_slug: str, model_name: str):
-    """Saves a correlation dataframe to disk."""
-    file_name = f"{tempfile.gettempdir()}/{organization_slug}-{project_slug}-{model_name}.pkl"
-    dataframe.to_pickle(file_name)
-
-
-def load_model(organization_slug: str, project_slug: str, model_name: str):
-    """Loads a correlation dataframe from disk."""
-    file_name = f"{tempfile.gettempdir()}/{organization_slug}-{project_slug}-{model_name}.pkl"
-    return pd.read_pickle(file_name)
-
-
-def correlation(df, tag_a, tag_b):
-    """Determine the probability of correlation/association."""
-    # Find all rows where a AND b == True
-    a_and_b = df[(df[tag_a]) & (df[tag_b])]
-
-    # Find all rows where a == True AND b != True
-    a_not_b = df[(df[tag_a]) & ~(df[tag_b])]
-    # Find all rows where b == True AND a != True
-    b_not_a = df[(df[tag_b]) & ~(df[tag_a])]
-
-    # Calculate the number of positive and possible outcomes using the shape attribute
-    possible_outcomes = (
-        a_and_b.shape[0] + a_not_b.shape[0] + b_not_a.shape[0]
-    )  # shape[0] returns the number of rows
-    positive_outcomes = a_and_b.shape[0]
-
-    # Calculate the final correlation coefficient
-    r = positive_outcomes / possible_outcomes
-
-    return r
-
-
-def correlate_with_every_tag(df, tag_a):
-    """Create correlations between every tag."""
-
-    unique_tags = list(df.columns)
-    # Loop through every tag and store the correlation in a list
-    correlation_list = []
-    for tag_b in unique_tags:
-        correlation_list.append(correlation(df, tag_a, tag_b))
-    return correlation_list
-
-
-def get_unique_tags(items: list[Any]):
-    """Get unique tags."""
-    unique_tags = {}
-    for i in items:
-        for t in i.tags:
-            unique_tags[t.id] = t.id
-    return unique_tags
-
-
-def create_correlation_dataframe(dataframe):
-    """Create the correlation dataframe based on the boolean dataframe."""
-    unique_tags = list(dataframe.columns)
-
-    correlation_matrix_dict = {}
+class TagModel:
+    """Tag co-occurrence model.
+
+    Holds the symmetric tag co-occurrence matrix (`cooccurrence[a, b]` is the number of
+    items tagged with both `a` and `b`, the diagonal is the number of items per tag).
+    The correlation of two tags is the share of items tagged with either of them that
+    are tagged with both.
+    """
+
+    def __init__(self, tag_ids: np.ndarray, cooccurrence: sparse.csr_matrix):
+        self.tag_ids = tag_ids
+        self.cooccurrence = cooccurrence
+        self.counts = cooccurrence.diagonal()
+        self.index = {int(tag_id): i for i, tag_id in enumerate(tag_ids)}
+
+    def correlations(self, tag_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the ids and correlations of the tags co-occurring with a tag, best first."""
+        i = self.index.get(tag_id)
+        if i is None:
+            return np.empty(0, dtype=self.tag_ids.dtype), np.empty(0)
+
+        row = self.cooccurrence.getrow(i)
+        columns, both = row.indices, row.data
+        mask = columns != i
+        columns, both = columns[mask], both[mask]
+
+        scores = both / (self.counts[i] + self.counts[columns] - both)
+        order = np.argsort(-scores, kind="stable")
+        return self.tag_ids[columns[order]], scores[order]
+
+
+def build_incidence_matrix(items: list[Any]) -> tuple[np.ndarray, sparse.csr_matrix]:
+    """Builds the sparse item x tag incidence matrix."""
+    rows, tag_ids = [], []
+    for row, item in enumerate(items):
+        for tag_id in {t.id for t in item.tags}:
+            rows.append(row)
+            tag_ids.append(tag_id)
+
+    unique_tag_ids, columns = np.unique(np.array(tag_ids, dtype=np.int64), return_inverse=True)
+    incidence = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (np.array(rows, dtype=np.int64), columns)),
+        shape=(len(items), len(unique_tag_ids)),
+    )
+    return unique_tag_ids, incidence
 
-    for tag_a in unique_tags:
-        correlation_matrix_dict[tag_a] = correlate_with_every_tag(dataframe, tag_a)
 
-    correlated_dataframe = pd.DataFrame(correlation_matrix_dict)
-    correlated_dataframe["index"] = unique_tags
-    return correlated_dataframe.set_index("index")
+def create_model(items: list[Any]) -> TagModel:
+    """Creates the tag co-occurrence model for items."""
+    tag_ids, incidence = build_incidence_matrix(items)
+    cooccurrence = (incidence.T @ incidence).tocsr()
+    cooccurrence.sort_indices()
+    return TagModel(tag_ids, cooccurrence)
 
 
-def create_boolean_dataframe(items: list[Any]):
-    """Create a boolean dataframe with tag and item data."""
-    unique_tags = get_unique_tags(items)
-    boolean_df = pd.DataFrame(columns=unique_tags.values())
+def get_model_path(organization_slug: str, project_slug: str, model_name: str) -> str:
+    """Returns the path of a model file."""
+    return f"{tempfile.gettempdir()}/{organization_slug}-{project_slug}-{model_name}.npz"
 
-    data_dict = defaultdict(list)
-    for col in boolean_df:
-        for i in items:
-            tag_ids = [t.id for t in i.tags]
-            data_dict[col].append(col in tag_ids)
 
-    for col in boolean_df:
-        boolean_df[col] = data_dict[col]
+def save_model(model: TagModel, organization_slug: str, project_slug: str, model_name: str):
+    """Saves a tag model to disk."""
+    file_name = get_model_path(organization_slug, project_slug, model_name)
 
-    return boolean_df
+    # write to a temporary file first so readers never see a partial model
+    fd, tmp_file_name = tempfile.mkstemp(dir=os.path.dirname(file_name), suffix=".npz")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(
+                f,
+                tag_ids=model.tag_ids,
+                data=model.cooccurrence.data,
+                indices=model.cooccurrence.indices,
+                indptr=model.cooccurrence.indptr,
+                shape=np.array(model.cooccurrence.shape),
+            )
+        os.replace(tmp_file_name, file_name)
+    except Exception:
+        os.unlink(tmp_file_name)
+        raise
+
+
+def load_model(organization_slug: str, project_slug: str, model_name: str) -> TagModel:
+    """Loads a tag model from disk."""
+    file_name = get_model_path(organization_slug, project_slug, model_name)
+    with np.load(file_name) as f:
+        cooccurrence = sparse.csr_matrix(
+            (f["data"], f["indices"], f["indptr"]), shape=tuple(f["shape"])
+        )
+        return TagModel(f["tag_ids"], cooccurrence)
 
 
-def find_correlations(dataframe, tag):
-    """Find all correlations for the given tag."""
-    # Setup empty list
-    correlations = []
-    columns = []
+class TagModelCache:
+    """Keeps loaded tag models in memory, reloading them when the file on disk changes."""
 
-    # Loop through all column at the row with the tag as its index
-    for i, corr in enumerate(dataframe.loc[tag, :]):
-        # Find the column
-        col = dataframe.columns[i]
+    def __init__(self):
+        self._models = {}
+        self._lock = threading.Lock()
 
-        # Append the correlation to the list
-        correlations.append(corr)
-        columns.append(col)
+    def get(self, organization_slug: str, project_slug: str, model_name: str) -> TagModel:
+        """Returns a tag model.
 
-    # Create a df out of the lists
-    results_df = pd.DataFrame({"tag": columns, "correlation": correlations})
+        Raises:
+            FileNotFoundError: If the model hasn't been built.
+        """
+        file_name = get_model_path(organization_slug, project_slug, model_name)
+        stat = os.stat(file_name)
+        # models are replaced rather than rewritten, the inode changes even if mtime doesn't
+        version = (stat.st_mtime_ns, stat.st_ino)
 
-    return results_df
+        with self._lock:
+            cached = self._models.get(file_name)
+        if cached and cached[0] == version:
+            return cached[1]
 
+        model = load_model(organization_slug, project_slug, model_name)
+        with self._lock:
+            self._models[file_name] = (version, model)
+        return model
 
-def find_highest_correlations(correlated_dataframe, recommendations):
-    """Find the correlations with the highest relevancy."""
-    # Sort the input df
-    corr_df_sorted = correlated_dataframe.sort_values(by=["correlation"], ascending=False)
+    def clear(self):
+        with self._lock:
+            self._models.clear()
 
-    # Extract the relevant correlations
-    corr_df_sliced = corr_df_sorted.iloc[1 : recommendations + 1]  # noqa
 
-    return corr_df_sliced
+tag_model_cache = TagModelCache()
 
 
 def get_recommendations(
@@ -146,37 +158,32 @@ def get_recommendations(
 ):
     """Get recommendations based on current tag."""
     try:
-        correlation_dataframe = load_model(organization_slug, project_slug, model_name)
+        model = tag_model_cache.get(organization_slug, project_slug, model_name)
     except FileNotFoundError:
         log.warning(
-            f"Unable to recommend tag(s). No correlation dataframe file found for project name {project_slug} and model name {model_name}."
+            f"Unable to recommend tag(s). No tag model file found for project name {project_slug} and model name {model_name}."
         )
         return []
 
-    recommendations_dataframe = pd.DataFrame()
+    recommended_tag_ids = []
     for tag_id in tag_ids:
-        correlated_dataframe = find_correlations(correlation_dataframe, tag_id)
-        recommendations_dataframe = pd.concat(
-            [
-                recommendations_dataframe,
-                find_highest_correlations(correlated_dataframe, recommendations),
-            ],
-            ignore_index=True,
-        )
+        correlated_tag_ids, _ = model.correlations(int(tag_id))
+        recommended_tag_ids.extend(correlated_tag_ids[:recommendations].tolist())
 
     # convert back to tag objects
     tags = []
-    for t in recommendations_dataframe["tag"][:recommendations]:
+    for t in recommended_tag_ids[:recommendations]:
         tags.append(tag_service.get(db_session=db_session, tag_id=int(t)))
 
     log.debug(
-        f"Recommending the following tag(s) for model name {model_name}: {','.join([t.name for t in tags])}"
+        "Recommending the following tag(s) for model name %s: %s",
+        model_name,
+        ",".join([t.name for t in tags]),
     )
     return tags
 
 
 def build_model(items: list[Any], organization_slug: str, project_slug: str, model_name: str):
-    """Builds the correlation dataframe for items."""
-    boolean_dataframe = create_boolean_dataframe(items)
-    correlation_dataframe = create_correlation_dataframe(boolean_dataframe)
-    save_model(correlation_dataframe, organization_slug, project_slug, model_name)
+    """Builds the tag co-occurrence model for items."""
+    model = create_model(items)
+    save_model(model, organization_slug, project_slug, model_name)
@@ -8,10 +8,11 @@
 import logging
 from schedule import every
 from typing import NoReturn
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from dispatch.decorators import scheduled_project_task, timer
 from dispatch.incident import service as incident_service
+from dispatch.incident.models import Incident
 from dispatch.plugin import service as plugin_service
 from dispatch.project.models import Project
 from dispatch.scheduler import scheduler
@@ -49,12 +50,16 @@ def sync_tags(db_session: Session, project: Project) -> NoReturn:
         tag_service.get_or_create(db_session=db_session, tag_in=tag_in)
 
 
-@scheduler.add(every(1).day, name="build-tag-models")
+@scheduler.add(every(1).day, name="build-tag-models", executor="process", timeout=3600)
 @timer
 @scheduled_project_task
 def build_tag_models(db_session: Session, project: Project) -> NoReturn:
     """Builds the incident tag recommendation models."""
-    incidents = incident_service.get_all(db_session=db_session, project_id=project.id).all()
+    incidents = (
+        incident_service.get_all(db_session=db_session, project_id=project.id)
+        .options(selectinload(Incident.tags))
+        .all()
+    )
 
     log.debug(f"Building the incident tag recommendation models for project {project.name}...")
 
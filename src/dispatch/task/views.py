@@ -1,10 +1,9 @@
-import json
 from fastapi import APIRouter, HTTPException, Query, status, Depends
 
 
 from dispatch.auth.service import CurrentUser
 from dispatch.auth.permissions import PermissionsDependency, IncidentTaskCreateEditPermission
-from dispatch.common.utils.views import create_pydantic_include
+from dispatch.common.utils.views import PydanticJSONResponse, create_pydantic_include
 from dispatch.database.core import DbSession
 from dispatch.database.service import CommonParameters, search_filter_sort_paginate
 from dispatch.models import PrimaryKey
@@ -40,8 +39,8 @@ def get_tasks(common: CommonParameters, include: list[str] = Query([], alias="in
             "total": ...,
         }
 
-        return json.loads(TaskPagination(**pagination).json(include=include_fields))
-    return json.loads(TaskPagination(**pagination).json())
+        return PydanticJSONResponse(TaskPagination(**pagination), include=include_fields)
+    return PydanticJSONResponse(TaskPagination(**pagination))
 
 
 @router.post(
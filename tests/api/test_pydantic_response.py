@@ -0,0 +1,18 @@
+def test_pydantic_json_response(session, incidents):
+    import json
+
+    from dispatch.common.utils.views import PydanticJSONResponse, create_pydantic_include
+    from dispatch.incident.models import IncidentExpandedPagination
+
+    pagination = IncidentExpandedPagination(
+        items=incidents, itemsPerPage=len(incidents), page=1, total=len(incidents)
+    )
+    include_fields = {
+        "items": {"__all__": create_pydantic_include(["id", "project.name"])},
+        "total": ...,
+    }
+
+    response = PydanticJSONResponse(pagination, include=include_fields)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == json.loads(pagination.json(include=include_fields))
@@ -0,0 +1,39 @@
+from fastapi import APIRouter
+
+
+def _router():
+    router = APIRouter()
+
+    @router.get("/{organization}/incidents/{incident_id}")
+    def get_incident():
+        pass
+
+    @router.get("/{organization}/incidents")
+    def get_incidents():
+        pass
+
+    return router
+
+
+def test_route_matcher_match():
+    from dispatch.main import RouteMatcher
+
+    matcher = RouteMatcher()
+    matcher.build(_router().routes)
+
+    template, params = matcher.match("/default/incidents/1")
+    assert template == "/{organization}/incidents/{incident_id}"
+    assert params == {"organization": "default", "incident_id": "1"}
+
+    template, params = matcher.match("/default/incidents")
+    assert template == "/{organization}/incidents"
+    assert params == {"organization": "default"}
+
+
+def test_route_matcher_no_match():
+    from dispatch.main import RouteMatcher
+
+    matcher = RouteMatcher()
+    matcher.build(_router().routes)
+
+    assert matcher.match("/healthcheck/a/b/c") == (None, {})
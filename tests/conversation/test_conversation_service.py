@@ -208,3 +208,24 @@ def test_get_by_channel_id_ignoring_channel_type_incident_message_fallback(sessi
 
     assert result is not None
     assert result.id == created_conversation.id
+
+
+def test_update_invalidates_index(session, conversation):
+    from dispatch.conversation.index import ConversationSubject, conversation_index
+    from dispatch.conversation.service import update
+    from dispatch.conversation.models import ConversationUpdate
+
+    conversation_index.set(
+        conversation.channel_id,
+        None,
+        ConversationSubject(organization_slug="default", type="incident", id=1, project_id=1),
+    )
+    assert conversation_index.get(conversation.channel_id)
+
+    old_channel_id = conversation.channel_id
+    update(
+        db_session=session,
+        conversation=conversation,
+        conversation_in=ConversationUpdate(channel_id="new_channel_id"),
+    )
+    assert not conversation_index.get(old_channel_id)
@@ -0,0 +1,29 @@
+def test_schema_registry_exists(db):
+    from dispatch.database.core import engine
+    from dispatch.database.registry import SchemaRegistry
+
+    registry = SchemaRegistry(engine, ttl=60)
+    assert registry.organization_exists("default")
+    assert not registry.organization_exists("does-not-exist")
+
+
+def test_schema_registry_invalidate(db):
+    from dispatch.database.core import engine
+    from dispatch.database.registry import SchemaRegistry
+
+    registry = SchemaRegistry(engine, ttl=60)
+    registry.refresh()
+    assert registry._loaded_at is not None
+
+    registry.invalidate()
+    assert registry._loaded_at is None
+    assert "dispatch_core" in registry.get_schema_names()
+
+
+def test_schema_registry_reuses_scoped_session(db):
+    from dispatch.database.core import engine
+    from dispatch.database.registry import SchemaRegistry
+
+    registry = SchemaRegistry(engine, ttl=60)
+    session = registry.get_scoped_session("dispatch_organization_default")
+    assert session is registry.get_scoped_session("dispatch_organization_default")
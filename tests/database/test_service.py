@@ -177,6 +177,82 @@ def test_unlimited_pagination(session, incidents, admin_user):
     assert len(result["items"]) == result["total"]  # All items
 
 
+def test_cursor_pagination(session, incidents, admin_user):
+    """Test that following cursors returns every item once, in order."""
+    from dispatch.database.service import PaginationCount
+
+    expected = search_filter_sort_paginate(
+        db_session=session,
+        model="Incident",
+        items_per_page=-1,
+        sort_by=["id"],
+        descending=[True],
+        current_user=admin_user,
+        role=UserRoles.admin,
+    )["items"]
+
+    ids, cursor = [], ""
+    while cursor is not None:
+        result = search_filter_sort_paginate(
+            db_session=session,
+            model="Incident",
+            items_per_page=2,
+            sort_by=["id"],
+            descending=[True],
+            current_user=admin_user,
+            role=UserRoles.admin,
+            cursor=cursor,
+            count=PaginationCount.none,
+        )
+        assert result["total"] is None
+        ids.extend(incident.id for incident in result["items"])
+        cursor = result["nextCursor"]
+
+    assert ids == [incident.id for incident in expected]
+
+
+def test_cursor_pagination_empty_page(session, incidents, admin_user):
+    """Test that a cursor page without items has no next cursor."""
+    result = search_filter_sort_paginate(
+        db_session=session,
+        model="Incident",
+        items_per_page=0,
+        current_user=admin_user,
+        role=UserRoles.admin,
+        cursor="",
+    )
+
+    assert result["items"] == []
+    assert result["total"] >= len(incidents)
+    assert result["nextCursor"] is None
+
+
+def test_projected_pagination(session, incidents, admin_user):
+    """Test that only the projected attributes are loaded."""
+    from sqlalchemy.exc import InvalidRequestError
+
+    from dispatch.common.utils.views import create_projected_pagination, create_pydantic_include
+    from dispatch.incident.models import IncidentRead
+
+    include_sets = create_pydantic_include(["title", "project.name", "total_cost"])
+    result = search_filter_sort_paginate(
+        db_session=session,
+        model="Incident",
+        items_per_page=-1,
+        current_user=admin_user,
+        role=UserRoles.admin,
+        projection=include_sets,
+    )
+
+    page = create_projected_pagination(IncidentRead, include_sets)(**result)
+    assert [item.title for item in page.items] == [incident.title for incident in result["items"]]
+    assert all(item.project.name for item in page.items)
+
+    # relationships outside of the projection aren't loaded
+    with pytest.raises(InvalidRequestError):
+        _ = result["items"][0].participants
+
+
 def test_empty_query_string(session, incidents, admin_user):
     """Test behavior with empty query string."""
     result = search_filter_sort_paginate(
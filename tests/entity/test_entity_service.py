@@ -322,3 +322,17 @@ def test_find_entities_multiple_entity_types(session, signal_instance, project):
     values = {getattr(e, "value", None) for e in entities if hasattr(e, "value") and isinstance(e.value, str)}
     assert "arn:aws:iam::123456789012:role/Test" in values
     assert "arn:aws:s3:::ap-northeast-3-123456789012-s3-server-access-logs" in values
+
+
+def test_get_entity_extractor_cached(session, entity_type):
+    from dispatch.entity.extractor import entity_extractor_cache
+    from dispatch.entity.service import get_entity_extractor
+
+    entity_type.jpath = "asset[0].id"
+    session.commit()
+
+    extractor = get_entity_extractor([entity_type])
+    assert extractor is get_entity_extractor([entity_type])
+
+    entity_extractor_cache.invalidate()
+    assert extractor is not get_entity_extractor([entity_type])
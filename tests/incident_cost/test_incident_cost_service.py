@@ -302,6 +302,116 @@ def test_calculate_incident_response_cost_without_cost_model__update_cost(
     assert initial_incident_cost < updated_incident_cost
 
 
+def test_get_classic_response_time_seconds(
+    incident, session, incident_cost_type, participant_role, participant, incident_cost
+):
+    """Tests that the time aggregated in the database matches the classic cost model."""
+    from datetime import datetime, timedelta, timezone
+
+    import pytest
+    from sqlalchemy import update
+
+    from dispatch.incident.enums import IncidentStatus
+    from dispatch.incident_cost.models import IncidentCost
+    from dispatch.incident_cost.service import (
+        get_classic_response_time_seconds,
+        get_total_participant_roles_time_seconds,
+    )
+
+    two_days_ago = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=2)
+    incident.status = IncidentStatus.active
+    incident.incident_type.cost_model = None
+    incident_cost.incident_cost_type = incident_cost_type
+    incident_cost.incident = incident
+    incident_cost.project = incident.project
+    incident_cost.updated_at = two_days_ago
+
+    participant_role.participant = participant
+    participant_role.activity = 1
+    participant_role.assumed_at = two_days_ago
+    participant_role.renounced_at = None
+    incident.participants.append(participant_role.participant)
+    session.add(incident)
+    session.commit()
+    # flushes bump updated_at, move it back without going through the unit of work
+    session.execute(
+        update(IncidentCost)
+        .where(IncidentCost.id == incident_cost.id)
+        .values(updated_at=two_days_ago)
+    )
+    session.commit()
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    expected = get_total_participant_roles_time_seconds(incident, start_at=two_days_ago)
+    rows = get_classic_response_time_seconds(
+        db_session=session,
+        project_id=incident.project.id,
+        incident_cost_type_id=incident_cost_type.id,
+        now=now,
+    )
+
+    assert [row[0] for row in rows] == [incident_cost.id]
+    assert rows[0][2] == pytest.approx(expected, rel=1e-3)
+
+
+def test_update_classic_incidents_response_cost(
+    incident, session, incident_cost_type, participant_role, participant, incident_cost
+):
+    """Tests that the accrued response cost is added to the incident cost in bulk."""
+    from datetime import datetime, timedelta, timezone
+
+    import pytest
+    from sqlalchemy import update
+
+    from dispatch.incident.enums import IncidentStatus
+    from dispatch.incident_cost.models import IncidentCost
+    from dispatch.incident_cost.service import (
+        calculate_response_cost,
+        get_hourly_rate,
+        get_total_participant_roles_time_seconds,
+        update_classic_incidents_response_cost,
+    )
+
+    two_days_ago = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=2)
+    incident.status = IncidentStatus.active
+    incident.incident_type.cost_model = None
+    incident_cost.incident_cost_type = incident_cost_type
+    incident_cost.incident = incident
+    incident_cost.project = incident.project
+
+    participant_role.participant = participant
+    participant_role.activity = 1
+    participant_role.assumed_at = two_days_ago
+    participant_role.renounced_at = None
+    incident.participants.append(participant_role.participant)
+    session.add(incident)
+    session.commit()
+    # flushes bump updated_at, move it back without going through the unit of work
+    session.execute(
+        update(IncidentCost)
+        .where(IncidentCost.id == incident_cost.id)
+        .values(amount=100, updated_at=two_days_ago)
+    )
+    session.commit()
+
+    expected = calculate_response_cost(
+        hourly_rate=get_hourly_rate(incident.project),
+        total_response_time_seconds=get_total_participant_roles_time_seconds(
+            incident, start_at=two_days_ago
+        ),
+    )
+    updated = update_classic_incidents_response_cost(
+        db_session=session,
+        project=incident.project,
+        incident_cost_type_id=incident_cost_type.id,
+    )
+
+    session.refresh(incident_cost)
+    assert updated == 1
+    assert incident_cost.amount == pytest.approx(100 + expected, rel=1e-3)
+    assert incident_cost.updated_at > two_days_ago
+
+
 def test_update_incident_response_cost(incident, session, incident_cost_type):
     from dispatch.incident import service as incident_service
     from dispatch.incident_cost.service import (
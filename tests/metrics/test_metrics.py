@@ -0,0 +1,60 @@
+def test_metrics_aggregation(monkeypatch):
+    from dispatch import metrics
+    from dispatch.plugins.bases.metric import MetricPlugin
+
+    sent = []
+
+    class RecordingPlugin(MetricPlugin):
+        slug = "test-recording-metric"
+
+        def gauge(self, name, value, tags=None):
+            sent.append(("gauge", name, value, tags))
+
+        def counter(self, name, value=None, tags=None):
+            sent.append(("counter", name, value, tags))
+
+        def timer(self, name, value, tags=None):
+            sent.append(("timer", name, value, tags))
+
+    plugin = RecordingPlugin()
+    monkeypatch.setattr(metrics.plugins, "get", lambda slug: plugin)
+
+    provider = metrics.Metrics(providers=["test-recording-metric"], flush_interval=3600)
+    provider.counter("calls", tags={"endpoint": "a"})
+    provider.counter("calls", tags={"endpoint": "a"})
+    provider.counter("calls", value=3, tags={"endpoint": "b"})
+    provider.gauge("size", 1)
+    provider.gauge("size", 2)
+    provider.timer("elapsed", 0.5, tags={"endpoint": "a"})
+    provider.timer("elapsed", 1.5, tags={"endpoint": "a"})
+    provider.flush()
+
+    assert sorted(sent, key=str) == sorted(
+        [
+            ("counter", "calls", 2, {"endpoint": "a"}),
+            ("counter", "calls", 3, {"endpoint": "b"}),
+            ("gauge", "size", 2, None),
+            ("timer", "elapsed", 0.5, {"endpoint": "a"}),
+            ("timer", "elapsed", 1.5, {"endpoint": "a"}),
+        ],
+        key=str,
+    )
+
+    # the buffer was drained
+    sent.clear()
+    provider.flush()
+    assert not sent
+    provider.stop()
+
+
+def test_metrics_buffer_is_bounded():
+    from dispatch.metrics import Metrics
+
+    provider = Metrics(providers=["test-recording-metric"], flush_interval=3600, buffer_size=2)
+    for i in range(5):
+        provider.counter("calls", value=i)
+
+    assert [sample[2] for sample in provider._buffer] == [3, 4]
+    assert provider._dropped == 3
+    provider._buffer.clear()
+    provider.stop()
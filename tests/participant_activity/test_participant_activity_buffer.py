@@ -0,0 +1,53 @@
+def test_participant_role_activity_buffer_write(session, participant_role):
+    from dispatch.participant_activity.buffer import ParticipantRoleActivityBuffer
+
+    participant_role.activity = 1
+    session.commit()
+
+    buffer = ParticipantRoleActivityBuffer(flush_interval=3600, flush_threshold=1000)
+    buffer._thread = object()  # don't start the flusher
+    buffer.increment("default", participant_role.id)
+    buffer.increment("default", participant_role.id, count=2)
+    assert buffer.pending("default", participant_role.id) == 3
+
+    increments = buffer.drain()
+    assert increments == {"default": {participant_role.id: 3}}
+    assert buffer.pending("default", participant_role.id) == 0
+
+    buffer.write(session, increments["default"])
+    session.commit()
+    session.refresh(participant_role)
+    assert participant_role.activity == 4
+
+
+def test_participant_activity_buffer(session, participant_activity):
+    """Tests that overlapping activities are recorded as a single span with the same response time."""
+    from datetime import timedelta
+    from dispatch.participant_activity.buffer import ParticipantActivityBuffer
+    from dispatch.participant_activity.models import ParticipantActivityCreate
+    from dispatch.participant_activity.service import (
+        get_all_incident_participant_activities_for_incident,
+    )
+
+    orig_activities = get_all_incident_participant_activities_for_incident(
+        db_session=session, incident_id=participant_activity.incident.id
+    )
+
+    started_at = participant_activity.ended_at + timedelta(seconds=1)
+    buffer = ParticipantActivityBuffer()
+    for offset in (0, 5, 10):
+        buffer.add(
+            ParticipantActivityCreate(
+                plugin_event=participant_activity.plugin_event,
+                started_at=started_at + timedelta(seconds=offset),
+                ended_at=started_at + timedelta(seconds=offset + 10),
+                participant=participant_activity.participant,
+                incident=participant_activity.incident,
+            )
+        )
+
+    assert buffer.flush(db_session=session) == timedelta(seconds=20)
+    activities = get_all_incident_participant_activities_for_incident(
+        db_session=session, incident_id=participant_activity.incident.id
+    )
+    assert len(activities) == len(orig_activities) + 1
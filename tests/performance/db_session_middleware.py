@@ -0,0 +1,61 @@
+"""
+Micro-benchmark for the per-request overhead of `db_session_middleware`.
+
+Compares the previous behavior (catalog inspection and a new session registry on
+every request) against the cached schema registry.
+
+usage: `DATABASE_HOSTNAME=localhost DATABASE_CREDENTIALS=dispatch:dispatch \
+    python tests/performance/db_session_middleware.py --iterations 1000`
+"""
+
+import argparse
+import time
+import uuid
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from dispatch.database.core import engine
+from dispatch.database.registry import SchemaRegistry
+
+
+def per_request_inspection(schema: str):
+    request_id = str(uuid.uuid1())
+    assert schema in inspect(engine).get_schema_names()
+    schema_engine = engine.execution_options(schema_translate_map={None: schema})
+    session = scoped_session(sessionmaker(bind=schema_engine), scopefunc=lambda: request_id)
+    session().close()
+    session.remove()
+
+
+def cached_registry(registry: SchemaRegistry, schema: str):
+    request_id = str(uuid.uuid1())
+    assert registry.exists(schema)
+    session = registry.get_scoped_session(schema, scopefunc=lambda: request_id)
+    session().close()
+    session.remove()
+
+
+def run(name: str, func, iterations: int):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"{name:>24}: {elapsed / iterations * 1_000_000:10.1f} us/request")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--organization", default="default")
+    args = parser.parse_args()
+
+    schema = f"dispatch_organization_{args.organization}"
+    registry = SchemaRegistry(engine, ttl=60)
+
+    run("per-request inspection", lambda: per_request_inspection(schema), args.iterations)
+    run("cached schema registry", lambda: cached_registry(registry, schema), args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark for signal entity extraction over a corpus of raw signal payloads.
+
+Compares parsing every entity type's JSONPath for each instance (previous behavior)
+against a precompiled `EntityExtractor` reused across instances.
+
+usage: `python tests/performance/entity_extraction.py --instances 10000`
+"""
+
+import argparse
+import random
+import re
+import time
+import uuid
+
+import jsonpath_ng
+
+from dispatch.entity.extractor import CompiledEntityType, EntityExtractor
+
+JPATHS = [
+    "additionalMetadata.user_email",
+    "additionalMetadata.admin_email",
+    "additionalMetadata.ipaddress",
+    "additionalMetadata.role_name",
+    "asset[*].id",
+    "identity.arn",
+    "identity.sessionContext.sessionIssuer.userName",
+    "requestParameters.bucketName",
+]
+
+
+def make_payload(i: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "variant": f"DA:{1000 + i % 50}.A",
+        "createdAt": str(1681332053916 + i),
+        "additionalMetadata": {
+            "ipaddress": f"10.0.{i % 255}.{random.randint(1, 254)}",
+            "role_name": random.choice(["admin", "viewer", "editor"]),
+            "timestamp": "2023-04-12T20:31:26.364Z",
+            "alert_name": "Google Admin Sensitive Actions",
+            "event_name": "ASSIGN_ROLE",
+            "user_email": f"user{i % 500}@example.com",
+            "admin_email": f"admin{i % 20}@example.com",
+        },
+        "asset": [
+            {"id": f"arn:aws:iam::123456789012:role/Role{i % 100}"},
+            {"id": f"arn:aws:s3:::bucket-{i % 30}"},
+        ],
+        "identity": {
+            "arn": f"arn:aws:sts::123456789012:assumed-role/Role{i % 100}/session",
+            "sessionContext": {"sessionIssuer": {"userName": f"Role{i % 100}"}},
+        },
+    }
+
+
+def per_instance_parse(corpus: list[dict]) -> int:
+    found = 0
+    for raw in corpus:
+        entity_types = [(re.compile(".*"), jsonpath_ng.parse(jpath)) for jpath in JPATHS]
+        for _, jpath in entity_types:
+            found += sum(1 for m in jpath.find(raw) if isinstance(m.value, str))
+    return found
+
+
+def precompiled_extractor(corpus: list[dict]) -> int:
+    extractor = EntityExtractor(
+        [CompiledEntityType(jpath, re.compile(".*"), jsonpath_ng.parse(jpath)) for jpath in JPATHS]
+    )
+    found = 0
+    for raw in corpus:
+        found += sum(1 for _ in extractor.find_values(raw))
+    return found
+
+
+def run(name: str, func, corpus: list[dict]):
+    start = time.perf_counter()
+    found = func(corpus)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:>24}: {elapsed:8.3f}s ({len(corpus) / elapsed:10.0f} instances/s, {found} values)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--instances", type=int, default=10000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    corpus = [make_payload(i) for i in range(args.instances)]
+
+    run("per-instance parse", per_instance_parse, corpus)
+    run("precompiled extractor", precompiled_extractor, corpus)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark for loading the incident and case list views used by the UI tables.
+
+Compares loading full entities (previous behavior) against loading only the projected
+attributes for the incident table's `include[]` set and the minimal case list. For
+each variant the number of queries, the rows returned and the bytes read (the sum of
+`pg_column_size` over every returned row) are reported.
+
+usage: `DATABASE_HOSTNAME=localhost DATABASE_CREDENTIALS=dispatch:dispatch \
+    python tests/performance/list_view_loading.py --organization default --items-per-page 50`
+"""
+
+import argparse
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from dispatch.case.models import CasePaginationMinimalWithExtras, CaseReadMinimalWithExtras
+from dispatch.common.utils.views import (
+    create_model_projection,
+    create_projected_pagination,
+    create_pydantic_include,
+)
+from dispatch.database.core import engine
+from dispatch.database.service import search_filter_sort_paginate
+from dispatch.enums import UserRoles
+from dispatch.incident.models import IncidentExpandedPagination, IncidentRead
+
+# the columns of the incident table (see dashboard/incident/IncidentDialogFilter.vue)
+INCIDENT_TABLE_INCLUDE = [
+    "closed_at",
+    "commanders_location",
+    "created_at",
+    "duplicates",
+    "incident_priority",
+    "incident_severity",
+    "incident_type",
+    "name",
+    "participants_location",
+    "participants_team",
+    "project",
+    "reported_at",
+    "reporters_location",
+    "stable_at",
+    "status",
+    "tags",
+    "title",
+    "total_cost",
+]
+
+
+class QueryRecorder:
+    """Records the statements executed on a connection."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.statements = []
+        event.listen(connection, "before_cursor_execute", self.record)
+
+    def record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append((statement, parameters))
+
+    def bytes_read(self) -> int:
+        """Re-runs the recorded selects, summing the size of the rows they return."""
+        event.remove(self.connection, "before_cursor_execute", self.record)
+        total = 0
+        cursor = self.connection.connection.cursor()
+        for statement, parameters in self.statements:
+            if not statement.lstrip().upper().startswith("SELECT"):
+                continue
+            cursor.execute(
+                f"SELECT coalesce(sum(pg_column_size(q.*)), 0) FROM ({statement}) AS q",
+                parameters,
+            )
+            total += cursor.fetchone()[0]
+        cursor.close()
+        return total
+
+
+def run(name: str, schema_engine, func):
+    with schema_engine.connect() as connection:
+        session = sessionmaker(bind=connection)()
+        recorder = QueryRecorder(connection)
+
+        start = time.perf_counter()
+        rows = func(session)
+        elapsed = time.perf_counter() - start
+
+        queries = len(recorder.statements)
+        bytes_read = recorder.bytes_read()
+        session.close()
+
+    print(
+        f"{name:>32}: {elapsed:8.3f}s {queries:6d} queries {rows:6d} items "
+        f"{bytes_read / 1024:10.1f} KiB read"
+    )
+
+
+def paginate(session, model: str, items_per_page: int, projection: dict = None):
+    return search_filter_sort_paginate(
+        db_session=session,
+        model=model,
+        items_per_page=items_per_page,
+        sort_by=["created_at"],
+        descending=[True],
+        role=UserRoles.admin,
+        projection=projection,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--organization", default="default")
+    parser.add_argument("--items-per-page", type=int, default=50)
+    args = parser.parse_args()
+
+    schema_engine = engine.execution_options(
+        schema_translate_map={None: f"dispatch_organization_{args.organization}"}
+    )
+    include_sets = create_pydantic_include(INCIDENT_TABLE_INCLUDE)
+    incident_page = create_projected_pagination(IncidentRead, include_sets)
+    case_projection = create_model_projection(CaseReadMinimalWithExtras)
+
+    def incidents_full(session):
+        pagination = paginate(session, "Incident", args.items_per_page)
+        return len(IncidentExpandedPagination(**pagination).items)
+
+    def incidents_projected(session):
+        pagination = paginate(session, "Incident", args.items_per_page, include_sets)
+        return len(incident_page(**pagination).items)
+
+    def cases_full(session):
+        pagination = paginate(session, "Case", args.items_per_page)
+        return len(CasePaginationMinimalWithExtras(**pagination).items)
+
+    def cases_projected(session):
+        pagination = paginate(session, "Case", args.items_per_page, case_projection)
+        return len(CasePaginationMinimalWithExtras(**pagination).items)
+
+    run("incidents include[] (full)", schema_engine, incidents_full)
+    run("incidents include[] (projected)", schema_engine, incidents_projected)
+    run("cases minimal (full)", schema_engine, cases_full)
+    run("cases minimal (projected)", schema_engine, cases_projected)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Benchmark for routing an incident to the individual contacts whose filters match it.
+
+Seeds `--contacts` individual contacts, each with a search filter on the incident type
+and tags, in the project of the latest incident (inside a transaction that's rolled
+back), then compares matching every filter in SQL (previous behavior) against the
+project's routing index, reporting the time and number of queries of each.
+
+usage: `DATABASE_HOSTNAME=localhost DATABASE_CREDENTIALS=dispatch:dispatch \
+    python tests/performance/routing_index.py --organization default --contacts 5000`
+"""
+
+import argparse
+import random
+import time
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import sessionmaker
+
+from dispatch.database.core import engine
+from dispatch.incident.models import Incident
+from dispatch.incident.type.models import IncidentType
+from dispatch.individual.models import (
+    IndividualContact,
+    IndividualContactRead,
+    assoc_individual_contact_filters,
+)
+from dispatch.route.index import routing_index_cache
+from dispatch.route.service import get_matches
+from dispatch.search_filter import service as search_filter_service
+from dispatch.search_filter.models import SearchFilter
+from dispatch.tag.models import Tag
+
+MODELS = [(IndividualContact, IndividualContactRead)]
+
+
+def seed(session, incident: Incident, contacts: int):
+    """Creates contacts with filters, a few of them matching the incident."""
+    project_id = incident.project_id
+    incident_type_ids = [
+        i for (i,) in session.query(IncidentType.id).filter(IncidentType.project_id == project_id)
+    ]
+    tag_ids = [i for (i,) in session.query(Tag.id).filter(Tag.project_id == project_id)]
+    incident_tag_ids = [t.id for t in incident.tags]
+
+    filter_rows = []
+    for i in range(contacts):
+        if i % 100 == 0:
+            incident_type_id = incident.incident_type_id
+            tag_id = incident_tag_ids[0] if incident_tag_ids else None
+        else:
+            incident_type_id = random.choice(incident_type_ids)
+            tag_id = random.choice(tag_ids) if tag_ids else None
+
+        conditions = [{"model": "IncidentType", "field": "id", "value": incident_type_id}]
+        if tag_id and i % 2:
+            conditions.append({"model": "Tag", "field": "id", "value": tag_id})
+
+        filter_rows.append(
+            {
+                "name": f"routing-benchmark-{i}",
+                "expression": [{"and": [{"or": [{"op": "==", **c}]} for c in conditions]}],
+                "subject": "incident",
+                "enabled": True,
+                "project_id": project_id,
+            }
+        )
+
+    filter_ids = (
+        session.execute(insert(SearchFilter).returning(SearchFilter.id), filter_rows)
+        .scalars()
+        .all()
+    )
+    contact_rows = [
+        {
+            "name": f"Routing Benchmark {i}",
+            "email": f"routing-benchmark-{i}@example.com",
+            "project_id": project_id,
+        }
+        for i in range(contacts)
+    ]
+    contact_ids = (
+        session.execute(insert(IndividualContact).returning(IndividualContact.id), contact_rows)
+        .scalars()
+        .all()
+    )
+    session.execute(
+        insert(assoc_individual_contact_filters),
+        [
+            {"individual_contact_id": contact_id, "search_filter_id": filter_id}
+            for contact_id, filter_id in zip(contact_ids, filter_ids, strict=True)
+        ],
+    )
+    session.flush()
+
+
+def match_each_filter(session, incident: Incident) -> int:
+    """Matches the filter of every contact in SQL, one query per filter."""
+    contacts = (
+        session.query(IndividualContact)
+        .filter(IndividualContact.project_id == incident.project_id)
+        .filter(IndividualContact.filters.any())
+        .all()
+    )
+    matched = 0
+    for contact in contacts:
+        for f in contact.filters:
+            if search_filter_service.match(
+                db_session=session,
+                subject=f.subject,
+                filter_spec=f.expression,
+                class_instance=incident,
+            ):
+                matched += 1
+                break
+    return matched
+
+
+def match_index(session, incident: Incident) -> int:
+    return len(
+        get_matches(
+            db_session=session,
+            project_id=incident.project_id,
+            class_instance=incident,
+            models=MODELS,
+        )
+    )
+
+
+def run(name: str, connection, session, func, incident: Incident):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", record)
+    start = time.perf_counter()
+    matched = func(session, incident)
+    elapsed = time.perf_counter() - start
+    event.remove(connection, "before_cursor_execute", record)
+
+    print(f"{name:>28}: {elapsed:8.3f}s {len(statements):6d} queries {matched:6d} matches")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--organization", default="default")
+    parser.add_argument("--contacts", type=int, default=5000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    schema_engine = engine.execution_options(
+        schema_translate_map={None: f"dispatch_organization_{args.organization}"}
+    )
+    with schema_engine.connect() as connection:
+        transaction = connection.begin()
+        session = sessionmaker(bind=connection)()
+        try:
+            incident = session.query(Incident).order_by(Incident.id.desc()).first()
+            seed(session, incident, args.contacts)
+
+            run("match each filter", connection, session, match_each_filter, incident)
+            session.expire_all()
+            routing_index_cache.clear()
+            run("routing index (cold)", connection, session, match_index, incident)
+            session.expire_all()
+            run("routing index (warm)", connection, session, match_index, incident)
+        finally:
+            session.close()
+            transaction.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark for posting the messages of an incident with a pooled Slack client.
+
+Starts a local server answering the Slack Web API, then posts `--messages` messages with
+a default `WebClient` (previous behavior) and with a `PooledWebClient`, reporting the
+time and number of connections opened by each.
+
+Connecting to a local server is almost free, so the server waits `--connect-latency`
+seconds before answering on each new connection, the cost of the TCP and TLS handshakes
+with Slack (use 0 to compare the clients' own overhead).
+
+usage: `python tests/performance/slack_client_pooling.py --messages 100 --connect-latency 0.05`
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from slack_sdk.web.client import WebClient
+
+from dispatch.plugins.dispatch_slack.client import PooledWebClient, create_session
+
+
+class SlackHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, don't delay the body
+    disable_nagle_algorithm = True
+    connections = 0
+    connect_latency = 0.0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with SlackHandler.lock:
+            SlackHandler.connections += 1
+        time.sleep(self.connect_latency)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"ok": True, "channel": "C1", "ts": f"{time.time():.6f}"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def run(name: str, client: WebClient, messages: int):
+    SlackHandler.connections = 0
+    start = time.perf_counter()
+    for i in range(messages):
+        client.chat_postMessage(channel="C1", text=f"Incident update {i}")
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:>16}: {elapsed:8.3f}s {SlackHandler.connections:6d} connections")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=100)
+    parser.add_argument("--connect-latency", type=float, default=0.05)
+    args = parser.parse_args()
+    SlackHandler.connect_latency = args.connect_latency
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlackHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/api/"
+
+    try:
+        run("WebClient", WebClient(token="xoxb-benchmark", base_url=base_url), args.messages)
+        run(
+            "PooledWebClient",
+            PooledWebClient(token="xoxb-benchmark", base_url=base_url, session=create_session()),
+            args.messages,
+        )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+import pytest
+
+
+def test_plugin_manager_indexes():
+    from dispatch.plugins.base.manager import PluginManager
+    from dispatch.plugins.dispatch_test.conference import TestConferencePlugin
+    from dispatch.plugins.dispatch_test.ticket import TestTicketPlugin
+
+    manager = PluginManager()
+    manager.register(TestConferencePlugin)
+
+    assert manager.get("test-conference").slug == "test-conference"
+    assert [p.slug for p in manager.all(plugin_type=TestConferencePlugin.type)] == [
+        "test-conference"
+    ]
+
+    # registering wipes the instance cache and rebuilds the indexes
+    manager.register(TestTicketPlugin)
+    assert manager.get("test-ticket").slug == "test-ticket"
+    assert len(manager) == 2
+
+    manager.unregister(TestConferencePlugin)
+    assert not list(manager.all(plugin_type=TestConferencePlugin.type))
+    with pytest.raises(KeyError):
+        manager.get("test-conference")
@@ -111,3 +111,26 @@ def test_get_all_events_for_plugin(*, session, plugin_event):
             is_member = True
             break
     assert is_member
+
+
+def test_plugin_configuration_cache():
+    from dispatch.plugin.cache import PluginConfigurationCache
+
+    cache = PluginConfigurationCache()
+    parsed = []
+
+    def parse(configuration):
+        parsed.append(configuration)
+        return {"raw": configuration}
+
+    first = cache.get(1, "slug", '{"a": 1}', parse)
+    assert cache.get(1, "slug", '{"a": 1}', parse) is first
+    assert len(parsed) == 1
+
+    # a new configuration version is parsed again
+    assert cache.get(1, "slug", '{"a": 2}', parse) == {"raw": '{"a": 2}'}
+    assert len(parsed) == 2
+
+    cache.invalidate(1)
+    cache.get(1, "slug", '{"a": 2}', parse)
+    assert len(parsed) == 3
@@ -0,0 +1,67 @@
+def test_slack_user_cache():
+    from dispatch.plugins.dispatch_slack.cache import USER_INFO_BY_ID, SlackUserCache
+
+    cache = SlackUserCache(maxsize=10, ttl=60, negative_ttl=60)
+    calls = []
+
+    def load_user():
+        calls.append("user")
+        return {"id": "U1", "profile": {"email": "user@example.com"}}
+
+    def load_missing():
+        calls.append("missing")
+        return None
+
+    assert cache.get("T1", USER_INFO_BY_ID, "U1", load_user)["id"] == "U1"
+    assert cache.get("T1", USER_INFO_BY_ID, "U1", load_user)["id"] == "U1"
+
+    # unknown users are cached as negative entries
+    assert cache.get("T1", USER_INFO_BY_ID, "U2", load_missing) is None
+    assert cache.get("T1", USER_INFO_BY_ID, "U2", load_missing) is None
+
+    # entries are scoped to their namespace
+    cache.get("T2", USER_INFO_BY_ID, "U1", load_user)
+
+    assert calls == ["user", "missing", "user"]
+    assert cache.hits == 2
+    assert cache.misses == 3
+
+    cache.invalidate("T1", USER_INFO_BY_ID, "U1")
+    cache.get("T1", USER_INFO_BY_ID, "U1", load_user)
+    assert calls[-1] == "user"
+
+
+def test_get_cached_user_not_found(monkeypatch):
+    from types import SimpleNamespace
+
+    import pytest
+    from slack_sdk.errors import SlackApiError
+
+    from dispatch.plugins.dispatch_slack import service
+    from dispatch.plugins.dispatch_slack.cache import USER_INFO_BY_ID, SlackUserCache
+    from dispatch.plugins.dispatch_slack.enums import SlackAPIErrorCode, SlackAPIGetEndpoints
+
+    calls = []
+
+    def make_call(client, endpoint, **kwargs):
+        calls.append(kwargs)
+        raise SlackApiError("not found", {"ok": False, "error": "user_not_found"})
+
+    monkeypatch.setattr(service, "make_call", make_call)
+    monkeypatch.setattr(service, "slack_user_cache", SlackUserCache(maxsize=10, ttl=60))
+    client = SimpleNamespace(token="xoxb-1")
+
+    # unknown users raise the error of the lookup, which is only made once
+    for _ in range(2):
+        with pytest.raises(SlackApiError) as e:
+            service.get_cached_user(
+                client,
+                USER_INFO_BY_ID,
+                "U1",
+                SlackAPIGetEndpoints.users_info,
+                SlackAPIErrorCode.USER_NOT_FOUND,
+                user="U1",
+            )
+        assert e.value.response["error"] == SlackAPIErrorCode.USER_NOT_FOUND
+
+    assert calls == [{"user": "U1"}]
@@ -0,0 +1,88 @@
+import json
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+@contextmanager
+def serve_slack(respond=lambda method, body: {"ok": True}):
+    """Serves the Slack Web API locally, yielding its base url and the requests it got."""
+    requests = []
+
+    class SlackHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # headers and body are written separately, don't delay the body
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            method = self.path.split("?", 1)[0].rsplit("/", 1)[-1]
+            requests.append((method, body))
+
+            content = json.dumps(respond(method, body)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlackHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/api/", requests
+    finally:
+        server.shutdown()
+
+
+def test_slack_client_registry():
+    from dispatch.plugins.dispatch_slack.client import SlackClientRegistry
+
+    registry = SlackClientRegistry(maxsize=10, pool_size=2)
+
+    client = registry.get("xoxb-1")
+    assert registry.get("xoxb-1") is client
+    assert registry.get("xoxb-2") is not client
+
+    # all clients share the connection pool and rate limits
+    assert registry.get("xoxb-2").session is client.session
+    assert registry.get("xoxb-2").rate_limiter is client.rate_limiter
+
+
+def test_slack_rate_limiter():
+    from dispatch.plugins.dispatch_slack.client import SlackMethodLimit, SlackRateLimiter
+
+    limiter = SlackRateLimiter(
+        limits={
+            "chat.postMessage": SlackMethodLimit(per_minute=6000, burst=2, per_channel=True),
+        }
+    )
+
+    # calls within the burst don't wait
+    assert limiter.acquire("xoxb-1", "chat.postMessage", "C1") == 0
+    assert limiter.acquire("xoxb-1", "chat.postMessage", "C1") == 0
+    assert limiter.acquire("xoxb-1", "chat.postMessage", "C2") == 0
+
+    # the next call waits for a token
+    assert limiter.acquire("xoxb-1", "chat.postMessage", "C1") > 0
+
+    # rate limited methods wait for the retry delay
+    limiter.block("xoxb-1", "chat.postMessage", "C2", 0.05)
+    assert limiter.acquire("xoxb-1", "chat.postMessage", "C2") > 0
+
+
+def test_pooled_web_client_request_body():
+    from dispatch.plugins.dispatch_slack.client import PooledWebClient, create_session
+
+    with serve_slack() as (base_url, requests):
+        client = PooledWebClient(token="xoxb-1", base_url=base_url, session=create_session())
+        client.users_info(user="U1")
+        client.conversations_invite(channel="C1", users=["U1", "U2"])
+        client.chat_postMessage(channel="C1", text="hello")
+
+    assert requests[0] == ("users.info", b"user=U1")
+    assert requests[1] == ("conversations.invite", b"channel=C1&users=U1%2CU2")
+    assert requests[2][0] == "chat.postMessage"
+    assert json.loads(requests[2][1]) == {"channel": "C1", "text": "hello"}
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+
+def test_message_dispatcher():
+    from dispatch.plugins.dispatch_slack.decorators import MessageDispatcher
+
+    dispatcher = MessageDispatcher()
+    dispatcher.registered_funcs = []
+    calls = []
+
+    @dispatcher.add(subject="incident", exclude={"subtype": ["channel_join"]})
+    def handle_incident(payload, message_context):
+        calls.append(("incident", payload["text"], message_context))
+
+    @dispatcher.add(subject="case")
+    def handle_case(payload):
+        calls.append(("case", payload["text"]))
+
+    # argument plans are computed when the functions are registered
+    assert [f["args"] for f in dispatcher.registered_funcs] == [
+        ("payload", "message_context"),
+        ("payload",),
+    ]
+
+    context = {"subject": SimpleNamespace(id="1", type="incident", project_id="1")}
+    dispatcher.dispatch(
+        payload={"text": "hello"},
+        context=context,
+        body={"event": {}},
+        db_session=None,
+        user=None,
+    )
+    assert [c[:2] for c in calls] == [("incident", "hello")]
+    assert calls[0][2].participant is None
+
+    calls.clear()
+    dispatcher.dispatch(
+        payload={"text": "joined"},
+        context=context,
+        body={"event": {"subtype": "channel_join"}},
+        db_session=None,
+        user=None,
+    )
+    assert not calls
+
+
+def test_message_context_memoizes(session, incident):
+    from dispatch.plugins.dispatch_slack.decorators import MessageContext
+
+    subject = SimpleNamespace(id=str(incident.id), type="incident", project_id=None)
+    message_context = MessageContext(db_session=session, context={"subject": subject}, user=None)
+
+    assert message_context.incident is message_context.incident
+    assert message_context.project_id == incident.project_id
+    assert message_context.active_plugins("monitor") is message_context.active_plugins("monitor")
@@ -0,0 +1,93 @@
+class FakeClient:
+    token = "xoxb-directory"
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def users_list(self, limit, cursor=None):
+        self.calls.append(cursor)
+        index = int(cursor or 0)
+        next_cursor = str(index + 1) if index + 1 < len(self.pages) else ""
+        return {"members": self.pages[index], "response_metadata": {"next_cursor": next_cursor}}
+
+
+def user(user_id, email, **kwargs):
+    return {"id": user_id, "profile": {"email": email}, "tz": "America/Los_Angeles", **kwargs}
+
+
+def test_slack_directory():
+    from dispatch.plugins.dispatch_slack.directory import SlackDirectory
+
+    client = FakeClient(
+        [
+            [user("U1", "One@example.com"), user("U2", "two@example.com")],
+            [user("U3", "three@example.com", deleted=True)],
+        ]
+    )
+    directory = SlackDirectory(refresh_interval=3600, max_age=3600)
+
+    # users are loaded one page after the other
+    assert directory.load(client) == 3
+    assert client.calls == [None, "1"]
+
+    assert directory.get_by_id(client, "U1")["tz"] == "America/Los_Angeles"
+    assert directory.get_by_email(client, "one@example.com")["id"] == "U1"
+    assert directory.get_by_id(client, "U3")["id"] == "U3"
+    # deactivated users can't be found by email
+    assert directory.get_by_email(client, "three@example.com") is None
+
+    # changed users replace their previous entries
+    directory.update(client.token, user("U2", "new@example.com"))
+    assert directory.get_by_email(client, "two@example.com") is None
+    assert directory.get_by_email(client, "new@example.com")["id"] == "U2"
+
+    # the workspace isn't reloaded before its refresh interval
+    directory.refresh()
+    assert client.calls == [None, "1"]
+
+    directory.stop()
+
+
+def test_list_users_pooled_client():
+    from urllib.parse import parse_qs
+
+    from dispatch.plugins.dispatch_slack.client import PooledWebClient, create_session
+    from dispatch.plugins.dispatch_slack.directory import list_users
+
+    from tests.plugins.dispatch_slack.test_client import serve_slack
+
+    pages = {
+        "": ([user("U1", "one@example.com")], "page-2"),
+        "page-2": ([user("U2", "two@example.com")], ""),
+    }
+
+    def respond(method, body):
+        cursor = parse_qs(body.decode()).get("cursor", [""])[0]
+        members, next_cursor = pages[cursor]
+        return {"ok": True, "members": members, "response_metadata": {"next_cursor": next_cursor}}
+
+    with serve_slack(respond) as (base_url, requests):
+        client = PooledWebClient(token="xoxb-1", base_url=base_url, session=create_session())
+        users = list_users(client)
+
+    assert [u["id"] for u in users] == ["U1", "U2"]
+    assert len(requests) == 2
+
+
+def test_list_users_stops():
+    from dispatch.plugins.dispatch_slack.directory import list_users
+
+    class RepeatingClient(FakeClient):
+        def users_list(self, limit, cursor=None):
+            self.calls.append(cursor)
+            return {"members": [], "response_metadata": {"next_cursor": "same"}}
+
+    # a cursor returned twice ends the listing
+    client = RepeatingClient([])
+    list_users(client)
+    assert client.calls == [None, "same"]
+
+    # so does the maximum number of pages
+    client = FakeClient([[user(f"U{i}", f"{i}@example.com")] for i in range(10)])
+    assert len(list_users(client, max_pages=3)) == 3
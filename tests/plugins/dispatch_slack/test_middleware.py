@@ -0,0 +1,21 @@
+def test_conversation_subject_confirms_cached_subject(session, conversation, case, incident):
+    from dispatch.conversation.index import ConversationSubject
+    from dispatch.plugins.dispatch_slack.middleware import _conversation_subject
+    from dispatch.plugins.dispatch_slack.models import CaseSubjects, IncidentSubjects
+
+    conversation.case = case
+    session.commit()
+
+    cached = ConversationSubject(
+        organization_slug="default", type=CaseSubjects.case, id=case.id, project_id=1
+    )
+    assert _conversation_subject("default", conversation, cached) is cached
+
+    # another process escalated the case, the cached subject is stale
+    conversation.incident = incident
+    session.commit()
+
+    subject = _conversation_subject("default", conversation, cached)
+    assert subject.type == IncidentSubjects.incident
+    assert subject.id == incident.id
+    assert subject.project_id == incident.project_id
@@ -0,0 +1,73 @@
+import json
+from urllib.parse import urlencode
+
+
+def test_get_request_route():
+    from dispatch.plugins.dispatch_slack.registry import get_request_route
+
+    # events
+    event = json.dumps({"api_app_id": "A1", "team_id": "T1", "event": {}}).encode()
+    assert get_request_route(event) == ("A1", "T1")
+
+    # commands
+    command = urlencode({"api_app_id": "A1", "team_id": "T1", "command": "/dispatch"}).encode()
+    assert get_request_route(command) == ("A1", "T1")
+
+    # interactions
+    payload = json.dumps({"api_app_id": "A1", "team": {"id": "T1"}, "type": "block_actions"})
+    assert get_request_route(urlencode({"payload": payload}).encode()) == ("A1", "T1")
+
+    assert get_request_route(b"{}") is None
+    assert get_request_route(b"not json") is None
+
+
+class FakeEntry:
+    """A configuration whose signing secret is the `secret` of the request body."""
+
+    def __init__(self, secret):
+        self.key = (secret, "1")
+        self.secret = secret
+        self.verified = 0
+
+    def verify(self, body, headers):
+        self.verified += 1
+        return json.loads(body).get("secret") == self.secret
+
+
+def test_find_handler(monkeypatch):
+    from dispatch.plugins.dispatch_slack import registry
+
+    now = [0.0]
+    monkeypatch.setattr(registry.time, "monotonic", lambda: now[0])
+
+    one, two = FakeEntry("one"), FakeEntry("two")
+    loads = []
+
+    slack_app_registry = registry.SlackAppRegistry(ttl=60, min_reload_interval=5)
+
+    def load_entries(organization):
+        loads.append(organization)
+        return [one, two]
+
+    monkeypatch.setattr(slack_app_registry, "load_entries", load_entries)
+    monkeypatch.setattr(slack_app_registry, "get_handler", lambda organization, entry: entry)
+
+    def body(secret):
+        return json.dumps({"api_app_id": "A1", "team_id": "T1", "secret": secret}).encode()
+
+    # unknown routes are checked against every configuration
+    assert slack_app_registry.find_handler("default", body("two"), {}) is two
+    assert (one.verified, two.verified) == (1, 1)
+
+    # known routes are checked against the configuration that verified them
+    assert slack_app_registry.find_handler("default", body("two"), {}) is two
+    assert (one.verified, two.verified) == (1, 2)
+
+    # when no configuration matches, the configurations are only reloaded if they
+    # weren't loaded too recently
+    assert slack_app_registry.find_handler("default", body("three"), {}) is None
+    assert loads == ["default"]
+
+    now[0] = 10.0
+    assert slack_app_registry.find_handler("default", body("three"), {}) is None
+    assert loads == ["default", "default"]
@@ -0,0 +1,76 @@
+def test_get_matches(session, incident, tag, individual_contact, search_filter):
+    from dispatch.individual.models import IndividualContact, IndividualContactRead
+    from dispatch.route.index import routing_index_cache
+    from dispatch.route.service import get_matches
+
+    routing_index_cache.clear()
+    models = [(IndividualContact, IndividualContactRead)]
+
+    incident.tags.append(tag)
+    individual_contact.project = incident.project
+    search_filter.subject = "incident"
+    search_filter.expression = [
+        {"and": [{"or": [{"model": "Tag", "field": "id", "op": "==", "value": tag.id}]}]}
+    ]
+    individual_contact.filters = [search_filter]
+    session.commit()
+
+    matches = get_matches(
+        db_session=session, project_id=incident.project.id, class_instance=incident, models=models
+    )
+    assert [m.resource_state["email"] for m in matches] == [individual_contact.email]
+
+    # the index is rebuilt when the filter changes
+    search_filter.expression = [
+        {"and": [{"or": [{"model": "Tag", "field": "id", "op": "==", "value": tag.id + 1}]}]}
+    ]
+    session.commit()
+
+    assert not get_matches(
+        db_session=session, project_id=incident.project.id, class_instance=incident, models=models
+    )
+
+
+def test_routing_filter_tokens():
+    from dispatch.route.index import RoutingFilter
+
+    routing_filter = RoutingFilter(
+        1,
+        "incident",
+        [
+            {
+                "and": [
+                    {"or": [{"model": "Tag", "field": "id", "op": "==", "value": 1}]},
+                    {"or": [{"model": "IncidentType", "field": "id", "op": "in", "value": [2, 3]}]},
+                ]
+            }
+        ],
+    )
+    assert routing_filter.predicate is not None
+    assert routing_filter.tokens == frozenset([("Tag", "id", 1)])
+
+    # participant filters are matched in SQL
+    routing_filter = RoutingFilter(
+        2, "incident", [{"model": "Participant", "field": "email", "op": "==", "value": "a@b.c"}]
+    )
+    assert routing_filter.predicate is None
+    assert routing_filter.tokens is None
+
+
+def test_routing_filter_like_escapes(session, incident, tag):
+    from dispatch.route.index import RoutingDocument, RoutingFilter
+
+    tag.name = "100%_covered"
+    incident.tags = [tag]
+
+    def matches(pattern):
+        routing_filter = RoutingFilter(
+            1, "incident", [{"model": "Tag", "field": "name", "op": "like", "value": pattern}]
+        )
+        assert routing_filter.predicate is not None
+        return routing_filter.matches(session, RoutingDocument(incident))
+
+    assert matches("100\\%\\_covered")
+    assert matches("100%")
+    assert not matches("100\\%")
+    assert not matches("1000\\%%")
@@ -0,0 +1,79 @@
+def test_skip_running_task():
+    import threading
+
+    from schedule import Scheduler as JobScheduler
+
+    from dispatch.scheduler import Scheduler
+
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_task():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+
+    scheduler = Scheduler(num_workers=2)
+    scheduler.registered_tasks = []
+    scheduler.add(JobScheduler().every(1).seconds, name="slow-task")(slow_task)
+    task = scheduler.registered_tasks[0]
+
+    scheduler.submit(task)
+    assert started.wait(5)
+
+    # the previous run is still in progress, so this one is skipped
+    scheduler.submit(task)
+    release.set()
+    scheduler.pool.close()
+    scheduler.pool.join()
+
+    assert len(calls) == 1
+
+
+def test_scheduled_project_task_fan_out(monkeypatch):
+    import threading
+    from types import SimpleNamespace
+
+    from dispatch import decorators
+
+    organizations = [SimpleNamespace(slug="a"), SimpleNamespace(slug="b")]
+    projects = [SimpleNamespace(id=1), SimpleNamespace(id=2)]
+    monkeypatch.setattr(
+        decorators.organization_service, "get_all", lambda db_session: organizations
+    )
+    monkeypatch.setattr(decorators.project_service, "get_all", lambda db_session: projects)
+
+    units = []
+    threads = set()
+
+    def run_unit(func, organization_slug, project_id, timeout, *args, **kwargs):
+        units.append((organization_slug, project_id))
+        threads.add(threading.current_thread().name)
+
+    monkeypatch.setattr(decorators, "_run_project_unit", run_unit)
+
+    @decorators.scheduled_project_task(max_workers=4)
+    def task(db_session, project):
+        pass
+
+    task()
+    assert sorted(units) == [("a", 1), ("a", 2), ("b", 1), ("b", 2)]
+    assert all(name.startswith("scheduled-task") for name in threads)
+
+
+def test_run_in_process_flushes_metrics(monkeypatch):
+    import pytest
+
+    from dispatch import scheduler
+
+    flushed = []
+    monkeypatch.setattr(scheduler.metrics_provider, "flush", lambda: flushed.append(True))
+
+    def failing_task():
+        raise ValueError
+
+    # process executor children exit without running atexit handlers
+    with pytest.raises(ValueError):
+        scheduler._run_in_process(failing_task)
+    assert flushed
@@ -0,0 +1,24 @@
+def test_like_to_regex():
+    from dispatch.search_filter.evaluation import like_to_regex
+
+    assert like_to_regex("10.0.%").fullmatch("10.0.0.1")
+    assert like_to_regex("a_c").fullmatch("abc")
+    assert not like_to_regex("abc").fullmatch("ABC")
+    assert like_to_regex("abc", ignore_case=True).fullmatch("ABC")
+
+    # escaped wildcards match themselves, like in Postgres
+    assert like_to_regex("100\\%").fullmatch("100%")
+    assert not like_to_regex("100\\%").fullmatch("1000")
+    assert like_to_regex("a\\_c").fullmatch("a_c")
+    assert not like_to_regex("a\\_c").fullmatch("abc")
+
+
+def test_three_valued_logic():
+    from dispatch.search_filter.evaluation import sql_and, sql_not, sql_or
+
+    assert sql_and([True, None]) is None
+    assert sql_and([None, False]) is False
+    assert sql_or([False, None]) is None
+    assert sql_or([None, True]) is True
+    assert sql_not(None) is None
+    assert sql_not(True) is False
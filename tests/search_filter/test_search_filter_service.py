@@ -44,3 +44,21 @@ def test_delete(session, search_filter):
 
     delete(db_session=session, search_filter_id=search_filter.id)
     assert not get(db_session=session, search_filter_id=search_filter.id)
+
+
+def test_match_many(session, incidents):
+    from dispatch.search_filter.service import match_many
+
+    incident = incidents[0]
+    filter_spec = {
+        "and": [{"model": "Incident", "field": "title", "op": "==", "value": incident.title}]
+    }
+
+    matched_ids = match_many(
+        db_session=session, subject="incident", filter_spec=filter_spec, class_instances=incidents
+    )
+    assert incident.id in matched_ids
+
+    assert not match_many(
+        db_session=session, subject="case", filter_spec=filter_spec, class_instances=incidents
+    )
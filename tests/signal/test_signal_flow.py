@@ -588,3 +588,45 @@ def test_signal_instance_create_flow_use_case_type_attributes(session, signal, c
                 case_id=post_flow_instance.case.id,
                 create_all_resources=False
             )
+
+
+def test_parallel_processing_loop(session, signal, project):
+    """Each unprocessed signal instance is processed exactly once by the worker pool."""
+    from collections import Counter
+    from types import SimpleNamespace
+
+    from dispatch.signal import flows
+    from dispatch.signal.models import SignalFilterAction, SignalInstance
+    from tests.factories import SignalInstanceFactory
+
+    signal_instance_ids = [
+        SignalInstanceFactory(project=project, signal=signal, case=None).id for _ in range(20)
+    ]
+    processed = []
+
+    def process_signal_batch(db_session, signal_instance_ids):
+        processed.extend(signal_instance_ids)
+        db_session.query(SignalInstance).filter(SignalInstance.id.in_(signal_instance_ids)).update(
+            {SignalInstance.filter_action: SignalFilterAction.none}, synchronize_session=False
+        )
+        db_session.commit()
+
+    class NoWorkLeft(Exception):
+        pass
+
+    def sleep(seconds):
+        # workers stop at the end of the first pass that finds no work
+        if seconds == flows.LOOP_DELAY:
+            raise NoWorkLeft()
+
+    def get_all_organizations(db_session):
+        return [SimpleNamespace(slug="default")]
+
+    with mock.patch.object(flows, "process_signal_batch", process_signal_batch), \
+        mock.patch.object(flows, "get_all_organizations", get_all_organizations), \
+        mock.patch.object(flows.time, "sleep", sleep):
+        with pytest.raises(NoWorkLeft):
+            flows.parallel_processing_loop(num_workers=4, worker_type="thread", limit=3)
+
+    counts = Counter(processed)
+    assert all(counts[signal_instance_id] == 1 for signal_instance_id in signal_instance_ids)
@@ -824,3 +824,235 @@ def test_canary_signals_not_deduplicated(session, signal, project):
     # Check that the canary signal instance is not deduplicated (should have same case_id as before)
     assert canary_signal_instance.case_id == initial_case_id
     assert canary_signal_instance.filter_action != SignalFilterAction.deduplicate
+
+
+def test_compiled_filter_matches_sql(session, signal, project):
+    from dispatch.database.service import apply_filter_specific_joins, apply_filters
+    from dispatch.signal.filter_engine import compile_expression
+    from dispatch.signal.models import SignalInstance
+    from tests.factories import EntityTypeFactory, EntityFactory, SignalInstanceFactory
+
+    entity_type = EntityTypeFactory(project=project)
+    session.add(entity_type)
+    entity = EntityFactory(entity_type=entity_type, project=project, value="10.0.0.1")
+    session.add(entity)
+
+    signal_instance = SignalInstanceFactory(
+        project=project,
+        signal=signal,
+        entities=[entity],
+        raw=json.dumps({"id": "foo"}),
+    )
+    session.add(signal_instance)
+    session.commit()
+
+    expressions = [
+        [{"or": [{"model": "Entity", "field": "id", "op": "==", "value": entity.id}]}],
+        [{"or": [{"model": "Entity", "field": "id", "op": "==", "value": entity.id + 1}]}],
+        [{"model": "Entity", "field": "value", "op": "ilike", "value": "10.0.%"}],
+        [{"not": [{"model": "EntityType", "field": "id", "op": "in", "value": [entity_type.id]}]}],
+        [{"model": "SignalInstance", "field": "canary", "op": "==", "value": False}],
+    ]
+    for expression in expressions:
+        query = session.query(SignalInstance).filter(SignalInstance.id == signal_instance.id)
+        query = apply_filter_specific_joins(SignalInstance, expression, query)
+        query = apply_filters(query, expression)
+
+        compiled = compile_expression(expression)
+        assert compiled
+        assert compiled.matches(signal_instance) == bool(query.all())
+
+    assert compile_expression([{"model": "Case", "field": "id", "op": "==", "value": 1}]) is None
+
+
+def test_create_instances_bulk(session, signal, project):
+    import uuid
+
+    from dispatch.signal.models import (
+        SignalInstanceBulkCreateStatus,
+        SignalInstanceCreate,
+        SignalRead,
+    )
+    from dispatch.signal.service import create_instances_bulk, get_signal_instance
+
+    signal_instance_id = str(uuid.uuid4())
+    signal_instances_in = [
+        SignalInstanceCreate(
+            project=project, signal=SignalRead.from_orm(signal), raw={"id": signal_instance_id}
+        ),
+        SignalInstanceCreate(
+            project=project, signal=SignalRead.from_orm(signal), raw={"id": signal_instance_id}
+        ),
+        SignalInstanceCreate(
+            project=project, signal=SignalRead.from_orm(signal), raw={"id": "foo"}
+        ),
+    ]
+
+    results = create_instances_bulk(db_session=session, signal_instances_in=signal_instances_in)
+    assert [r.status for r in results] == [
+        SignalInstanceBulkCreateStatus.created,
+        SignalInstanceBulkCreateStatus.duplicate,
+        SignalInstanceBulkCreateStatus.failed,
+    ]
+    assert get_signal_instance(db_session=session, signal_instance_id=signal_instance_id)
+
+    results = create_instances_bulk(db_session=session, signal_instances_in=signal_instances_in[:1])
+    assert results[0].status == SignalInstanceBulkCreateStatus.duplicate
+
+
+def test_create_instances_bulk_row_failure(session, signal, project):
+    import uuid
+
+    from dispatch.signal.models import (
+        SignalInstanceBulkCreateStatus,
+        SignalInstanceCreate,
+        SignalRead,
+    )
+    from dispatch.signal.service import create_instances_bulk, get_signal_instance
+
+    signal_instance_ids = [str(uuid.uuid4()) for _ in range(3)]
+    signal_instances_in = [
+        SignalInstanceCreate(
+            project=project, signal=SignalRead.from_orm(signal), raw={"id": id, "value": "ok"}
+        )
+        for id in signal_instance_ids
+    ]
+    # postgres rejects NUL characters in JSONB, failing the whole multi-row insert
+    signal_instances_in[1].raw["value"] = "\u0000"
+
+    results = create_instances_bulk(db_session=session, signal_instances_in=signal_instances_in)
+    assert [r.status for r in results] == [
+        SignalInstanceBulkCreateStatus.created,
+        SignalInstanceBulkCreateStatus.failed,
+        SignalInstanceBulkCreateStatus.created,
+    ]
+    assert get_signal_instance(db_session=session, signal_instance_id=signal_instance_ids[0])
+    assert not get_signal_instance(db_session=session, signal_instance_id=signal_instance_ids[1])
+    assert get_signal_instance(db_session=session, signal_instance_id=signal_instance_ids[2])
+
+
+def test_create_instances_bulk_signal_resolution(session, signal, project):
+    import uuid
+
+    from dispatch.signal.models import SignalInstanceBulkCreateStatus, SignalInstanceCreate
+    from dispatch.signal.service import create_instances_bulk
+    from tests.factories import ProjectFactory
+
+    other_project = ProjectFactory()
+    signal.external_id = str(uuid.uuid4())
+    session.commit()
+
+    signal_instances_in = [
+        # the external id lookup isn't scoped to the project of the instance
+        SignalInstanceCreate(
+            project=other_project, external_id=signal.external_id, raw={"id": str(uuid.uuid4())}
+        ),
+        # instances without a signal or an external id can't be identified
+        SignalInstanceCreate(project=project, raw={"id": str(uuid.uuid4())}),
+    ]
+
+    results = create_instances_bulk(db_session=session, signal_instances_in=signal_instances_in)
+    assert results[0].status == SignalInstanceBulkCreateStatus.created
+    assert results[0].signal.id == signal.id
+    assert results[1].status == SignalInstanceBulkCreateStatus.failed
+    assert "external id must be provided" in results[1].msg
+
+
+def test_signal_instance_bulk_create_max_size(signal, project):
+    import pytest
+    from pydantic import ValidationError
+
+    from dispatch.config import SIGNAL_INSTANCE_BULK_CREATE_MAX_SIZE
+    from dispatch.signal.models import SignalInstanceBulkCreate, SignalInstanceCreate, SignalRead
+
+    signal_instance_in = SignalInstanceCreate(
+        project=project, signal=SignalRead.from_orm(signal), raw={"id": "foo"}
+    )
+
+    instances = [signal_instance_in] * SIGNAL_INSTANCE_BULK_CREATE_MAX_SIZE
+    assert SignalInstanceBulkCreate(instances=instances)
+
+    # larger batches are rejected (422) before anything is created
+    with pytest.raises(ValidationError):
+        SignalInstanceBulkCreate(instances=instances + [signal_instance_in])
+
+
+def test_claim_unprocessed_signal_instance_ids(session, signal, project):
+    from dispatch.signal.models import SignalInstance
+    from dispatch.signal.service import (
+        claim_unprocessed_signal_instance_ids,
+        release_signal_instance_claims,
+    )
+    from tests.factories import SignalInstanceFactory
+
+    signal_instance_ids = {
+        SignalInstanceFactory(project=project, signal=signal, case=None).id for _ in range(4)
+    }
+
+    engine = session.get_bind()
+    with engine.connect() as worker_1, engine.connect() as worker_2:
+        try:
+            # concurrent workers claim disjoint sets of signal instances
+            claimed_1 = set(claim_unprocessed_signal_instance_ids(worker_1, limit=2))
+            claimed_2 = set(claim_unprocessed_signal_instance_ids(worker_2, limit=10000))
+            assert len(claimed_1) == 2
+            assert not claimed_1 & claimed_2
+            assert signal_instance_ids <= claimed_1 | claimed_2
+
+            # claims survive the commits made while the instances are processed
+            session.query(SignalInstance).filter(SignalInstance.id.in_(claimed_1)).update(
+                {SignalInstance.canary: True}, synchronize_session=False
+            )
+            session.commit()
+            worker_1.commit()
+            release_signal_instance_claims(worker_2)
+            assert not claimed_1 & set(claim_unprocessed_signal_instance_ids(worker_2, limit=10000))
+
+            # released instances can be claimed again
+            release_signal_instance_claims(worker_1)
+            release_signal_instance_claims(worker_2)
+            assert claimed_1 <= set(claim_unprocessed_signal_instance_ids(worker_2, limit=10000))
+        finally:
+            release_signal_instance_claims(worker_1)
+            release_signal_instance_claims(worker_2)
+
+    # don't leave unprocessed instances behind for other tests
+    session.query(SignalInstance).filter(SignalInstance.id.in_(signal_instance_ids)).delete(
+        synchronize_session=False
+    )
+    session.commit()
+
+
+def test_compiled_filter_matches_sql_without_entities(session, signal, project):
+    from dispatch.database.service import apply_filter_specific_joins, apply_filters
+    from dispatch.signal.filter_engine import compile_expression
+    from dispatch.signal.models import SignalInstance
+    from tests.factories import SignalInstanceFactory
+
+    signal_instance = SignalInstanceFactory(
+        project=project, signal=signal, entities=[], raw=json.dumps({"id": "foo"})
+    )
+    session.add(signal_instance)
+    session.commit()
+
+    # entities are outer joined, so instances without entities still have a row
+    expressions = [
+        [{"model": "Entity", "field": "id", "op": "is_null"}],
+        [
+            {
+                "or": [
+                    {"model": "Entity", "field": "value", "op": "==", "value": "10.0.0.1"},
+                    {"model": "SignalInstance", "field": "canary", "op": "==", "value": False},
+                ]
+            }
+        ],
+        [{"model": "EntityType", "field": "id", "op": "in", "value": [1]}],
+    ]
+    for expression in expressions:
+        query = session.query(SignalInstance).filter(SignalInstance.id == signal_instance.id)
+        query = apply_filter_specific_joins(SignalInstance, expression, query)
+        query = apply_filters(query, expression)
+
+        compiled = compile_expression(expression)
+        assert compiled
+        assert compiled.matches(signal_instance) == bool(query.all())
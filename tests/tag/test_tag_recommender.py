@@ -0,0 +1,24 @@
+def test_build_model(session, project):
+    from dispatch.tag.recommender import build_model, tag_model_cache
+    from tests.factories import IncidentFactory, TagFactory
+
+    tag_a, tag_b, tag_c = TagFactory(), TagFactory(), TagFactory()
+    incidents = [
+        IncidentFactory(tags=[tag_a, tag_b]),
+        IncidentFactory(tags=[tag_a, tag_b]),
+        IncidentFactory(tags=[tag_a, tag_c]),
+        IncidentFactory(tags=[tag_c]),
+    ]
+
+    build_model(incidents, "test", project.slug, "incident")
+    model = tag_model_cache.get("test", project.slug, "incident")
+
+    tag_ids, correlations = model.correlations(tag_a.id)
+    assert tag_ids.tolist() == [tag_b.id, tag_c.id]
+    # b: both on 2 of the 3 incidents tagged a or b, c: 1 of the 4 tagged a or c
+    assert correlations.tolist() == [2 / 3, 1 / 4]
+
+    # the model is reloaded when it's rebuilt
+    build_model(incidents[:2], "test", project.slug, "incident")
+    model = tag_model_cache.get("test", project.slug, "incident")
+    assert model.correlations(tag_a.id)[0].tolist() == [tag_b.id]